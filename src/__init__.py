@@ -32,6 +32,7 @@ from .xbrl import (
     fetch_sec_filing_index,
     fetch_xbrl_document,
     fetch_xbrl_filings,
+    fetch_xbrl_frames,
     parse_xbrl_fundamentals,
     save_xbrl_data_to_parquet,
 )
@@ -65,6 +66,7 @@ __all__ = [
     "parse_xbrl_fundamentals",
     "save_xbrl_data_to_parquet",
     "fetch_xbrl_filings",
+    "fetch_xbrl_frames",
     # Exceptions
     "ConfigurationError",
     "APIKeyError",
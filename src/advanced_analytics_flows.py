@@ -15,7 +15,7 @@ from src.portfolio_risk import RiskAnalytics
 from src.portfolio_optimization import PortfolioOptimizer
 from src.options_analysis import OptionsAnalysis
 from src.fixed_income_analysis import FixedIncomeAnalysis
-from src.quick_wins_analytics import QuickWinsAnalytics
+from src.quick_wins_analytics import QuickWinsAnalytics, daily_returns
 from src.portfolio_prices import PriceFetcher
 from src.parquet_db import ParquetDB
 
@@ -152,8 +152,16 @@ def calculate_risk_metrics(prices_df: pd.DataFrame, weights: Dict[str, float]) -
 
 
 @task(retries=2)
-def calculate_optimization_metrics(prices_df: pd.DataFrame, tickers: List[str]) -> Dict:
-    """Calculate portfolio optimization recommendations with error handling."""
+def calculate_optimization_metrics(
+    prices_df: pd.DataFrame,
+    tickers: List[str],
+    returns_df: Optional[pd.DataFrame] = None,
+) -> Dict:
+    """Calculate portfolio optimization recommendations with error handling.
+
+    Pass returns_df (from daily_returns) to reuse returns already computed
+    for prices_df.
+    """
     logger = get_run_logger()
     logger.info("Calculating portfolio optimization...")
 
@@ -162,7 +170,8 @@ def calculate_optimization_metrics(prices_df: pd.DataFrame, tickers: List[str])
         return {}
 
     try:
-        returns_df = prices_df.pct_change().dropna()
+        if returns_df is None:
+            returns_df = daily_returns(prices_df)
         optimizer = PortfolioOptimizer(returns_df, risk_free_rate=0.04)
 
         # Minimum variance portfolio
@@ -192,8 +201,16 @@ def calculate_optimization_metrics(prices_df: pd.DataFrame, tickers: List[str])
 
 
 @task(retries=2)
-def calculate_quick_wins(prices_df: pd.DataFrame, holdings: Dict[str, Dict]) -> Dict:
-    """Calculate quick wins analytics with error handling."""
+def calculate_quick_wins(
+    prices_df: pd.DataFrame,
+    holdings: Dict[str, Dict],
+    returns_df: Optional[pd.DataFrame] = None,
+) -> Dict:
+    """Calculate quick wins analytics with error handling.
+
+    Pass returns_df (from daily_returns) to reuse returns already computed
+    for prices_df.
+    """
     logger = get_run_logger()
     logger.info("Calculating quick wins analytics...")
 
@@ -203,16 +220,19 @@ def calculate_quick_wins(prices_df: pd.DataFrame, holdings: Dict[str, Dict]) ->
     try:
         results = {}
 
+        # Shared array snapshot for the allocation breakdowns
+        portfolio_view = QuickWinsAnalytics.prepare(holdings)
+
         # Sector allocation
         if any("sector" in h for h in holdings.values()):
-            results["sector_allocation"] = QuickWinsAnalytics.sector_allocation(holdings)
+            results["sector_allocation"] = QuickWinsAnalytics.sector_allocation(portfolio_view)
 
         # Asset class breakdown
         if any("asset_class" in h for h in holdings.values()):
-            results["asset_class_breakdown"] = QuickWinsAnalytics.asset_class_breakdown(holdings)
+            results["asset_class_breakdown"] = QuickWinsAnalytics.asset_class_breakdown(portfolio_view)
 
         # Portfolio volatility
-        returns = prices_df.pct_change().dropna()
+        returns = returns_df if returns_df is not None else daily_returns(prices_df)
         portfolio_returns = []
         if len(returns) > 0:
             portfolio_returns = returns.mean(axis=1).values.tolist()
@@ -423,9 +443,12 @@ def advanced_analytics_flow(
     prices_df = fetch_historical_prices(tickers, days=252)
 
     # Calculate metrics
+    # Difference the prices once for every returns-based task
+    returns_df = daily_returns(prices_df) if not prices_df.empty else None
+
     risk_metrics = calculate_risk_metrics(prices_df, weights)
-    optimization_metrics = calculate_optimization_metrics(prices_df, tickers)
-    quick_wins = calculate_quick_wins(prices_df, holdings or {})
+    optimization_metrics = calculate_optimization_metrics(prices_df, tickers, returns_df)
+    quick_wins = calculate_quick_wins(prices_df, holdings or {}, returns_df)
 
     # Optional analyses
     options_analysis = None
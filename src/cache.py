@@ -1,13 +1,24 @@
 """
 Caching utilities for SEC API data.
 
-Implements disk-based caching for CIK lookups to avoid hitting SEC API rate limits.
+Implements disk-based caching for CIK lookups and SEC JSON responses to avoid
+hitting SEC API rate limits.
 """
 
+import hashlib
 import json
 import os
+import tempfile
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from .constants import DEFAULT_OUTPUT_DIR
 from .utils import get_logger
@@ -18,6 +29,9 @@ logger = get_logger(__name__)
 CACHE_DIR = os.path.join(DEFAULT_OUTPUT_DIR, "cache")
 CIK_CACHE_FILE = os.path.join(CACHE_DIR, "cik_cache.json")
 CACHE_EXPIRY_DAYS = 30  # Cache expires after 30 days
+RESPONSE_CACHE_DIR = os.path.join(CACHE_DIR, "responses")
+RESPONSE_CACHE_TTL_SECONDS = 24 * 60 * 60  # Filings and company facts: 1 day
+TICKERS_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # Company tickers file: 7 days
 
 
 class CIKCache:
@@ -165,3 +179,89 @@ class CIKCache:
             "cache_file": CIK_CACHE_FILE,
             "cache_expiry_days": CACHE_EXPIRY_DAYS,
         }
+
+
+class ResponseCache:
+    """Manages caching of SEC JSON responses to disk, one file per URL."""
+
+    @staticmethod
+    def _path(url: str) -> str:
+        """Get the cache file path for a URL.
+
+        Args:
+            url: Requested URL
+
+        Returns:
+            Path of the JSON file holding the cached response
+        """
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(RESPONSE_CACHE_DIR, f"{digest}.json")
+
+    @staticmethod
+    def get(url: str, ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS) -> Optional[Any]:
+        """Get a cached response if it is younger than ttl_seconds.
+
+        Args:
+            url: Requested URL
+            ttl_seconds: Maximum age of the cached response
+
+        Returns:
+            Parsed JSON response if found and fresh, None otherwise
+        """
+        path = ResponseCache._path(url)
+        try:
+            if time.time() - os.path.getmtime(path) > ttl_seconds:
+                logger.debug(f"Response cache expired for {url}")
+                return None
+            if HAS_ORJSON:
+                with open(path, "rb") as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            logger.debug(f"Response cache hit for {url}")
+            return data
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Error reading response cache: {e}")
+            return None
+
+    @staticmethod
+    def set(url: str, data: Any) -> None:
+        """Save a response to cache.
+
+        The file is written to a temporary name and moved into place, so
+        concurrent readers never see a partial response.
+
+        Args:
+            url: Requested URL
+            data: Parsed JSON response
+        """
+        os.makedirs(RESPONSE_CACHE_DIR, exist_ok=True)
+        path = ResponseCache._path(url)
+
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=RESPONSE_CACHE_DIR, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+            logger.debug(f"Cached response for {url}")
+
+        except (IOError, TypeError, ValueError) as e:
+            logger.warning(f"Error writing response cache: {e}")
+
+    @staticmethod
+    def clear() -> None:
+        """Clear all cached responses."""
+        try:
+            if os.path.isdir(RESPONSE_CACHE_DIR):
+                for name in os.listdir(RESPONSE_CACHE_DIR):
+                    os.remove(os.path.join(RESPONSE_CACHE_DIR, name))
+                logger.info("Response cache cleared")
+        except IOError as e:
+            logger.warning(f"Error clearing response cache: {e}")
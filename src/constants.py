@@ -9,6 +9,7 @@ consistency and centralized management of configuration values.
 SEC_BASE_URL: str = "https://data.sec.gov/submissions"
 SEC_COMPANY_TICKERS_URL: str = "https://www.sec.gov/files/company_tickers.json"
 SEC_FILINGS_URL: str = "https://www.sec.gov/cgi-bin/browse-edgar"
+SEC_FRAMES_URL: str = "https://data.sec.gov/api/xbrl/frames"
 
 # Alpha Vantage API
 ALPHA_VANTAGE_BASE_URL: str = "https://www.alphavantage.co/query"
@@ -55,6 +56,13 @@ USER_AGENTS: list[str] = [
 # We use conservative rate limiting of 1 request per 2 seconds
 SEC_MAX_REQUESTS_PER_SECOND: float = 10.0
 SEC_REQUEST_DELAY: float = 0.1  # Actual delay: 100ms between requests
+SEC_MAX_CONCURRENT_REQUESTS: int = 8  # In-flight requests for concurrent fetches
+# In-flight request limits per SEC request mode (sec_request_mode config key)
+SEC_REQUEST_MODES: dict[str, int] = {
+    "normal": SEC_MAX_CONCURRENT_REQUESTS,
+    "caution": 4,
+    "crawl": 1,
+}
 
 # Error Messages
 ERROR_CONFIG_FILE_NOT_FOUND: str = "Config file not found: {path}\nPlease create {path} from {template}"
@@ -29,7 +29,7 @@ from src.portfolio_prices import PriceFetcher
 from src.portfolio_risk import RiskAnalytics
 from src.portfolio_optimization import PortfolioOptimizer
 from src.parquet_db import ParquetDB
-from src.quick_wins_analytics import QuickWinsAnalytics
+from src.quick_wins_analytics import QuickWinsAnalytics, daily_returns
 from src.advanced_analytics_flows import (
     fetch_historical_prices,
     calculate_risk_metrics,
@@ -257,12 +257,17 @@ def portfolio_analytics_advanced() -> Dict:
         # Fetch historical prices
         prices_df = fetch_historical_prices(tickers, days=252)
 
-        # Run analytics
+        # Run analytics, differencing the prices once for both returns-based tasks
+        returns_df = daily_returns(prices_df) if not prices_df.empty else None
         risk_metrics = calculate_risk_metrics(prices_df, weights) if not prices_df.empty else {}
         optimization_metrics = (
-            calculate_optimization_metrics(prices_df, tickers) if not prices_df.empty else {}
+            calculate_optimization_metrics(prices_df, tickers, returns_df)
+            if not prices_df.empty
+            else {}
+        )
+        quick_wins = (
+            calculate_quick_wins(prices_df, {}, returns_df) if not prices_df.empty else {}
         )
-        quick_wins = calculate_quick_wins(prices_df, {}) if not prices_df.empty else {}
 
         # Generate report
         report = generate_portfolio_report(
@@ -392,12 +397,17 @@ if __name__ == "__main__":
             logger_print(f"⚠️  Could not fetch historical prices: {e}")
             prices_df = pd.DataFrame()
 
-        # Run analytics
+        # Run analytics, differencing the prices once for both returns-based tasks
+        returns_df = daily_returns(prices_df) if not prices_df.empty else None
         risk_metrics = calculate_risk_metrics(prices_df, weights) if not prices_df.empty else {}
         optimization_metrics = (
-            calculate_optimization_metrics(prices_df, valid_tickers) if not prices_df.empty else {}
+            calculate_optimization_metrics(prices_df, valid_tickers, returns_df)
+            if not prices_df.empty
+            else {}
+        )
+        quick_wins = (
+            calculate_quick_wins(prices_df, {}, returns_df) if not prices_df.empty else {}
         )
-        quick_wins = calculate_quick_wins(prices_df, {}) if not prices_df.empty else {}
 
         # Generate report
         report_lines = []
@@ -9,10 +9,12 @@ Implements:
 - Volume analysis
 """
 
-from typing import Dict, Optional, Tuple
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from prefect import get_run_logger, task
 
 from .utils import get_logger
@@ -28,6 +30,243 @@ __all__ = [
 
 logger = get_logger(__name__)
 
+# Storage dtype for price-derived indicator columns
+INDICATOR_DTYPE = np.float32
+
+# EMA spans used by calculate_all's default MACD and moving averages
+_PRICE_EMA_SPANS = (12, 26, 20, 50)
+
+# Indicator columns produced by calculate_all, in output order
+_PRICE_COLUMNS = (
+    "bb_upper", "bb_middle", "bb_lower", "bb_width", "bb_pct",
+    "rsi",
+    "macd", "signal", "histogram",
+    "sma_short", "sma_long", "ema_short", "ema_long",
+)
+_VOLUME_COLUMNS = ("obv", "volume_ma", "relative_volume")
+
+
+def _as_f64(prices: pd.Series) -> np.ndarray:
+    """Return the float64 values of a Series without copying when possible."""
+    return prices.to_numpy(dtype=np.float64, copy=False)
+
+
+@dataclass
+class _IndicatorInput:
+    """Price array plus the index to label indicator outputs with."""
+
+    arr: np.ndarray
+    index: pd.Index
+
+    @classmethod
+    def from_series(cls, prices: pd.Series) -> "_IndicatorInput":
+        return cls(arr=_as_f64(prices), index=prices.index)
+
+    def to_series(self, values: np.ndarray) -> pd.Series:
+        return pd.Series(values, index=self.index)
+
+
+def _rolling_mean(arr: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean over `window` values (NaN until the window is full)."""
+    out = np.full(len(arr), np.nan)
+    if len(arr) >= window:
+        out[window - 1:] = sliding_window_view(arr, window).mean(axis=1)
+    return out
+
+
+def _rolling_std(arr: np.ndarray, window: int) -> np.ndarray:
+    """Trailing sample standard deviation over `window` values."""
+    out = np.full(len(arr), np.nan)
+    if len(arr) >= window:
+        out[window - 1:] = sliding_window_view(arr, window).std(axis=1, ddof=1)
+    return out
+
+
+def _ewm_mean(arr: np.ndarray, span: int) -> np.ndarray:
+    """
+    Exponentially weighted mean matching pandas ``ewm(span).mean()``.
+
+    Smooths along axis 0, so a (bars x series) matrix is handled column-wise
+    in a single filter pass.
+    """
+    if len(arr) == 0:
+        return arr.copy()
+    if np.isnan(arr).any():
+        # pandas re-weights around gaps; defer to it for the rare NaN case
+        return pd.DataFrame(arr).ewm(span=span).mean().to_numpy().reshape(arr.shape)
+
+    # Deferred so importing this module (and src) doesn't pay for loading
+    # scipy.signal; after the first call this is a sys.modules lookup
+    from scipy.signal import lfilter
+
+    alpha = 2.0 / (span + 1.0)
+    decay = 1.0 - alpha
+    weighted_sum = lfilter([1.0], [1.0, -decay], arr, axis=0)
+    weight_total = (1.0 - decay ** np.arange(1, len(arr) + 1)) / alpha
+    return weighted_sum / weight_total.reshape((-1,) + (1,) * (arr.ndim - 1))
+
+
+def _ewm_means_ragged(
+    arrays: Sequence[np.ndarray], spans: Sequence[int]
+) -> List[Dict[int, np.ndarray]]:
+    """
+    EMAs of several series of differing lengths, one filter pass per span.
+
+    Series are left-aligned into a (bars x series) matrix. The EMA only
+    looks backwards, so the padding after a shorter series never reaches
+    its values.
+    """
+    lengths = [len(arr) for arr in arrays]
+    packed = np.zeros((max(lengths, default=0), len(arrays)))
+    for col, arr in enumerate(arrays):
+        packed[: len(arr), col] = arr
+
+    smoothed = {span: _ewm_mean(packed, span) for span in spans}
+    return [
+        {span: values[:length, col] for span, values in smoothed.items()}
+        for col, length in enumerate(lengths)
+    ]
+
+
+def _ema(
+    arr: np.ndarray, span: int, emas: Optional[Dict[int, np.ndarray]] = None
+) -> np.ndarray:
+    """EMA of `arr`, reusing a precomputed one from `emas` when present."""
+    if emas is not None and span in emas:
+        return emas[span]
+    return _ewm_mean(arr, span)
+
+
+def _bollinger_bands_impl(
+    arr: np.ndarray, period: int = 20, num_std: float = 2.0
+) -> Dict[str, np.ndarray]:
+    if len(arr) < period:
+        return {}
+
+    middle = _rolling_mean(arr, period)
+    std = _rolling_std(arr, period)
+
+    upper = middle + (std * num_std)
+    lower = middle - (std * num_std)
+
+    bb_width = upper - lower
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bb_pct = (arr - lower) / bb_width
+
+    return {
+        "bb_upper": upper,
+        "bb_middle": middle,
+        "bb_lower": lower,
+        "bb_width": bb_width,
+        "bb_pct": bb_pct,  # 0-1, where 1 = at upper, 0 = at lower
+    }
+
+
+def _rsi_impl(arr: np.ndarray, period: int = 14) -> np.ndarray:
+    if len(arr) < period + 1:
+        return np.full(len(arr), np.nan)
+
+    # Price changes; the first bar has no change and counts as flat
+    deltas = np.empty_like(arr)
+    deltas[0] = 0.0
+    np.subtract(arr[1:], arr[:-1], out=deltas[1:])
+
+    gains = np.where(deltas > 0, deltas, 0.0)
+    losses = np.where(deltas < 0, -deltas, 0.0)
+
+    avg_gain = _rolling_mean(gains, period)
+    avg_loss = _rolling_mean(losses, period)
+
+    # Avoid division by zero
+    rs = avg_gain / np.where(avg_loss == 0, 1e-10, avg_loss)
+
+    return 100 - (100 / (1 + rs))
+
+
+def _macd_impl(
+    arr: np.ndarray,
+    fast_period: int = 12,
+    slow_period: int = 26,
+    signal_period: int = 9,
+    emas: Optional[Dict[int, np.ndarray]] = None,
+) -> Dict[str, np.ndarray]:
+    if len(arr) < slow_period + signal_period:
+        return {}
+
+    macd_line = _ema(arr, fast_period, emas) - _ema(arr, slow_period, emas)
+    signal = _ewm_mean(macd_line, signal_period)
+
+    return {
+        "macd": macd_line,
+        "signal": signal,
+        "histogram": macd_line - signal,
+    }
+
+
+def _moving_averages_impl(
+    arr: np.ndarray,
+    short_period: int = 20,
+    long_period: int = 50,
+    emas: Optional[Dict[int, np.ndarray]] = None,
+) -> Dict[str, np.ndarray]:
+    return {
+        "sma_short": _rolling_mean(arr, short_period),
+        "sma_long": _rolling_mean(arr, long_period),
+        "ema_short": _ema(arr, short_period, emas),
+        "ema_long": _ema(arr, long_period, emas),
+    }
+
+
+def _obv_impl(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    steps = np.empty(len(close))
+    if len(close) == 0:
+        return steps
+
+    # Branchless direction: +1 on up bars, -1 on down bars, 0 when flat or
+    # when either close is missing (NaN compares false both ways)
+    deltas = close[1:] - close[:-1]
+    direction = (deltas > 0).astype(np.float64) - (deltas < 0)
+
+    steps[0] = volume[0]
+    np.multiply(direction, volume[1:], out=steps[1:])
+    return np.cumsum(steps)
+
+
+def _price_indicator_columns(
+    arr: np.ndarray, emas: Optional[Dict[int, np.ndarray]] = None
+) -> Dict[str, np.ndarray]:
+    columns = {}
+    columns.update(_bollinger_bands_impl(arr))
+    columns["rsi"] = _rsi_impl(arr)
+    columns.update(_macd_impl(arr, emas=emas))
+    columns.update(_moving_averages_impl(arr, emas=emas))
+    return columns
+
+
+def _calculate_all_impl(
+    ohlcv_df: pd.DataFrame, emas: Optional[Dict[int, np.ndarray]] = None
+) -> pd.DataFrame:
+    if ohlcv_df.empty or "Close" not in ohlcv_df.columns:
+        return ohlcv_df
+
+    inputs = _IndicatorInput.from_series(ohlcv_df["Close"])
+
+    # Price indicators are computed on the raw array once and assembled
+    # into a single frame instead of one column insert per output
+    columns = _price_indicator_columns(inputs.arr, emas)
+
+    frames = [
+        ohlcv_df,
+        pd.DataFrame(columns, index=inputs.index, dtype=INDICATOR_DTYPE),
+    ]
+
+    # Volume Indicators
+    if "Volume" in ohlcv_df.columns:
+        vol = TechnicalAnalyzer.volume_indicators(ohlcv_df)
+        frames.append(pd.DataFrame(vol, index=inputs.index))
+
+    return pd.concat(frames, axis=1)
+
 
 class TechnicalAnalyzer:
     """Calculate technical analysis indicators."""
@@ -47,25 +286,9 @@ class TechnicalAnalyzer:
         Returns:
             Dict with 'middle', 'upper', 'lower', 'bb_width', 'bb_pct'
         """
-        if len(prices) < period:
-            return {}
-
-        middle = prices.rolling(window=period).mean()
-        std = prices.rolling(window=period).std()
-
-        upper = middle + (std * num_std)
-        lower = middle - (std * num_std)
-
-        bb_width = upper - lower
-        bb_pct = (prices - lower) / (upper - lower)
-
-        return {
-            "bb_upper": upper,
-            "bb_middle": middle,
-            "bb_lower": lower,
-            "bb_width": bb_width,
-            "bb_pct": bb_pct,  # 0-1, where 1 = at upper, 0 = at lower
-        }
+        inputs = _IndicatorInput.from_series(prices)
+        bands = _bollinger_bands_impl(inputs.arr, period, num_std)
+        return {key: inputs.to_series(values) for key, values in bands.items()}
 
     @staticmethod
     def rsi(prices: pd.Series, period: int = 14) -> pd.Series:
@@ -79,27 +302,8 @@ class TechnicalAnalyzer:
         Returns:
             Series with RSI values (0-100)
         """
-        if len(prices) < period + 1:
-            return pd.Series(index=prices.index, dtype=float)
-
-        # Calculate price changes
-        deltas = prices.diff()
-
-        # Separate gains and losses
-        gains = deltas.where(deltas > 0, 0.0)
-        losses = -deltas.where(deltas < 0, 0.0)
-
-        # Calculate averages
-        avg_gain = gains.rolling(window=period).mean()
-        avg_loss = losses.rolling(window=period).mean()
-
-        # Avoid division by zero
-        rs = avg_gain / avg_loss.replace(0, 1e-10)
-
-        # Calculate RSI
-        rsi_values = 100 - (100 / (1 + rs))
-
-        return rsi_values
+        inputs = _IndicatorInput.from_series(prices)
+        return inputs.to_series(_rsi_impl(inputs.arr, period))
 
     @staticmethod
     def macd(
@@ -120,27 +324,9 @@ class TechnicalAnalyzer:
         Returns:
             Dict with 'macd', 'signal', 'histogram'
         """
-        if len(prices) < slow_period + signal_period:
-            return {}
-
-        # Calculate EMAs
-        ema_fast = prices.ewm(span=fast_period).mean()
-        ema_slow = prices.ewm(span=slow_period).mean()
-
-        # MACD line
-        macd_line = ema_fast - ema_slow
-
-        # Signal line
-        signal = macd_line.ewm(span=signal_period).mean()
-
-        # Histogram
-        histogram = macd_line - signal
-
-        return {
-            "macd": macd_line,
-            "signal": signal,
-            "histogram": histogram,
-        }
+        inputs = _IndicatorInput.from_series(prices)
+        lines = _macd_impl(inputs.arr, fast_period, slow_period, signal_period)
+        return {key: inputs.to_series(values) for key, values in lines.items()}
 
     @staticmethod
     def moving_averages(
@@ -157,12 +343,9 @@ class TechnicalAnalyzer:
         Returns:
             Dict with 'sma_short', 'sma_long', 'ema_short', 'ema_long'
         """
-        return {
-            "sma_short": prices.rolling(window=short_period).mean(),
-            "sma_long": prices.rolling(window=long_period).mean(),
-            "ema_short": prices.ewm(span=short_period).mean(),
-            "ema_long": prices.ewm(span=long_period).mean(),
-        }
+        inputs = _IndicatorInput.from_series(prices)
+        averages = _moving_averages_impl(inputs.arr, short_period, long_period)
+        return {key: inputs.to_series(values) for key, values in averages.items()}
 
     @staticmethod
     def volume_indicators(
@@ -185,16 +368,9 @@ class TechnicalAnalyzer:
         volume = ohlcv_df["Volume"]
 
         # On-Balance Volume (OBV)
-        obv = pd.Series(index=close.index, dtype=float)
-        obv.iloc[0] = volume.iloc[0]
-
-        for i in range(1, len(close)):
-            if close.iloc[i] > close.iloc[i - 1]:
-                obv.iloc[i] = obv.iloc[i - 1] + volume.iloc[i]
-            elif close.iloc[i] < close.iloc[i - 1]:
-                obv.iloc[i] = obv.iloc[i - 1] - volume.iloc[i]
-            else:
-                obv.iloc[i] = obv.iloc[i - 1]
+        obv = pd.Series(
+            _obv_impl(_as_f64(close), _as_f64(volume)), index=close.index
+        )
 
         # Volume Moving Average
         vol_ma = volume.rolling(window=period).mean()
@@ -213,44 +389,115 @@ class TechnicalAnalyzer:
         """
         Calculate all technical indicators.
 
+        Price-derived indicators (Bollinger Bands, RSI, MACD, moving
+        averages) are stored as float32: ~7 significant digits keeps the
+        rounding error well under 1bp of any price while halving the memory
+        of the indicator columns. Volume indicators stay float64 because
+        cumulative OBV can exceed float32's exact integer range.
+
         Args:
             ohlcv_df: DataFrame with OHLCV data
 
         Returns:
             DataFrame with original + technical indicator columns
         """
-        if ohlcv_df.empty or "Close" not in ohlcv_df.columns:
-            return ohlcv_df
+        return _calculate_all_impl(ohlcv_df)
 
-        result_df = ohlcv_df.copy()
+    @staticmethod
+    def calculate_all_batch(ohlcv_frames: Sequence[pd.DataFrame]) -> List[pd.DataFrame]:
+        """
+        Calculate all technical indicators for several securities.
 
-        close_prices = ohlcv_df["Close"]
+        The EMAs behind MACD and the moving averages are computed for every
+        security together on one (bars x securities) matrix rather than in a
+        separate pass per security. Results match calculate_all.
 
-        # Bollinger Bands
-        bb = TechnicalAnalyzer.bollinger_bands(close_prices)
-        for key, series in bb.items():
-            result_df[key] = series
+        Args:
+            ohlcv_frames: DataFrames with OHLCV data, one per security
 
-        # RSI
-        result_df["rsi"] = TechnicalAnalyzer.rsi(close_prices)
+        Returns:
+            List of DataFrames with original + technical indicator columns
+        """
+        eligible = [
+            i for i, df in enumerate(ohlcv_frames)
+            if not df.empty and "Close" in df.columns
+        ]
+        ema_sets = _ewm_means_ragged(
+            [_as_f64(ohlcv_frames[i]["Close"]) for i in eligible], _PRICE_EMA_SPANS
+        )
+        emas_by_frame = dict(zip(eligible, ema_sets))
+
+        return [
+            _calculate_all_impl(df, emas_by_frame.get(i))
+            for i, df in enumerate(ohlcv_frames)
+        ]
 
-        # MACD
-        macd = TechnicalAnalyzer.macd(close_prices)
-        for key, series in macd.items():
-            result_df[key] = series
+    @staticmethod
+    def calculate_all_stacked(ohlcv_frames: Sequence[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Calculate all technical indicators for several securities as one frame.
 
-        # Moving Averages
-        ma = TechnicalAnalyzer.moving_averages(close_prices)
-        for key, series in ma.items():
-            result_df[key] = series
+        Equivalent to concatenating calculate_all_batch's results, but each
+        security's indicators are written straight into preallocated
+        (rows x indicators) buffers, so no per-security frames are built
+        and nothing is copied by a final concat of indicator frames.
 
-        # Volume Indicators
-        if "Volume" in ohlcv_df.columns:
-            vol = TechnicalAnalyzer.volume_indicators(ohlcv_df)
-            for key, series in vol.items():
-                result_df[key] = series
+        Args:
+            ohlcv_frames: DataFrames with OHLCV data, one per security
 
-        return result_df
+        Returns:
+            DataFrame with the stacked OHLCV rows + technical indicator
+            columns, on a fresh RangeIndex
+        """
+        frames = [df for df in ohlcv_frames if not df.empty]
+        if not frames:
+            return pd.DataFrame()
+
+        stacked = pd.concat(frames, ignore_index=True)
+        total_rows = len(stacked)
+
+        eligible = [i for i, df in enumerate(frames) if "Close" in df.columns]
+        if not eligible:
+            return stacked
+        ema_sets = _ewm_means_ragged(
+            [_as_f64(frames[i]["Close"]) for i in eligible], _PRICE_EMA_SPANS
+        )
+        emas_by_frame = dict(zip(eligible, ema_sets))
+
+        price_out = np.full((total_rows, len(_PRICE_COLUMNS)), np.nan, dtype=INDICATOR_DTYPE)
+        volume_out = np.full((total_rows, len(_VOLUME_COLUMNS)), np.nan)
+        price_written = np.zeros(len(_PRICE_COLUMNS), dtype=bool)
+        volume_written = np.zeros(len(_VOLUME_COLUMNS), dtype=bool)
+
+        offset = 0
+        for i, df in enumerate(frames):
+            block = slice(offset, offset + len(df))
+            offset += len(df)
+            if i not in emas_by_frame:
+                continue
+
+            columns = _price_indicator_columns(_as_f64(df["Close"]), emas_by_frame[i])
+            for col, name in enumerate(_PRICE_COLUMNS):
+                if name in columns:
+                    price_out[block, col] = columns[name]
+                    price_written[col] = True
+
+            if "Volume" in df.columns:
+                vol = TechnicalAnalyzer.volume_indicators(df)
+                for col, name in enumerate(_VOLUME_COLUMNS):
+                    volume_out[block, col] = vol[name].to_numpy()
+                    volume_written[col] = True
+
+        # Indicators no security had enough history for are left out, as
+        # they would be when concatenating per-security results
+        price_df = pd.DataFrame(price_out, columns=list(_PRICE_COLUMNS))
+        if not price_written.all():
+            price_df = price_df.loc[:, price_written]
+        volume_df = pd.DataFrame(volume_out, columns=list(_VOLUME_COLUMNS))
+        if not volume_written.all():
+            volume_df = volume_df.loc[:, volume_written]
+
+        return pd.concat([stacked, price_df, volume_df], axis=1)
 
 
 @task
@@ -5,6 +5,9 @@ Provides technical indicator calculation functions that work both directly
 in Streamlit and with Prefect for logging and monitoring.
 """
 
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
@@ -16,6 +19,36 @@ try:
 except ImportError:
     HAS_PREFECT = False
 
+try:
+    import polars as pl
+    HAS_POLARS = True
+except ImportError:
+    HAS_POLARS = False
+
+logger = logging.getLogger(__name__)
+
+
+def group_prices_by_symbol(
+    holdings_prices: pd.DataFrame
+) -> Dict[str, pd.DataFrame]:
+    """
+    Split price data into per-symbol frames ordered by timestamp.
+    
+    Sorts once and splits with a single groupby instead of scanning the
+    whole frame with a boolean mask for every symbol.
+    
+    Args:
+        holdings_prices: DataFrame with price data for one or more symbols
+    
+    Returns:
+        Dict mapping symbol to its timestamp-ordered price rows
+    """
+    ordered = holdings_prices.sort_values(['symbol', 'timestamp'], kind='mergesort')
+    return {
+        symbol: symbol_prices
+        for symbol, symbol_prices in ordered.groupby('symbol', sort=False)
+    }
+
 
 def calculate_indicators_for_symbol(
     symbol: str,
@@ -46,6 +79,181 @@ def calculate_indicators_for_symbol(
         return None
 
 
+def calculate_indicators_for_symbols(
+    symbol_groups: Dict[str, pd.DataFrame]
+) -> Tuple[Optional[pd.DataFrame], List[str]]:
+    """
+    Calculate technical indicators for several symbols in one batch.
+    
+    Uses TechnicalAnalyzer.calculate_all_stacked so EMAs are computed for
+    all symbols in one pass and every symbol's rows land in one frame;
+    falls back to per-symbol calculation on error.
+    
+    Args:
+        symbol_groups: Dict mapping symbol to its price data
+    
+    Returns:
+        Tuple of (stacked indicators or None, list of symbols calculated)
+    """
+    # Need minimum data
+    batch = {
+        symbol: symbol_prices
+        for symbol, symbol_prices in symbol_groups.items()
+        if len(symbol_prices) >= 20
+    }
+    if not batch:
+        return None, []
+    
+    try:
+        from src.portfolio_technical import TechnicalAnalyzer
+        
+        return TechnicalAnalyzer.calculate_all_stacked(list(batch.values())), list(batch)
+        
+    except Exception as e:
+        calculated = {
+            symbol: calculate_indicators_for_symbol(symbol, symbol_prices)
+            for symbol, symbol_prices in batch.items()
+        }
+        frames = {symbol: df for symbol, df in calculated.items() if df is not None}
+        if not frames:
+            return None, []
+        return pd.concat(frames.values(), ignore_index=True), list(frames)
+
+
+def calculate_indicators_parallel(
+    symbol_groups: Dict[str, pd.DataFrame],
+    max_workers: int = 1
+) -> Tuple[Optional[pd.DataFrame], List[str]]:
+    """
+    Calculate technical indicators for many symbols, optionally across processes.
+    
+    The batched calculation costs around a millisecond per symbol, less
+    than starting a process pool, so it runs in-process by default. With
+    max_workers > 1, symbols are dealt round-robin into one batch per
+    worker of a spawn-context pool (fork is unsafe from the multi-threaded
+    Streamlit and Prefect processes). Falls back to a single in-process
+    batch for a single symbol or if the pool fails.
+    
+    Args:
+        symbol_groups: Dict mapping symbol to its price data
+        max_workers: Worker process count; 1 calculates in-process
+    
+    Returns:
+        Tuple of (stacked indicators or None, list of symbols calculated)
+    """
+    symbols = list(symbol_groups)
+    workers = min(max_workers, len(symbols))
+    
+    if workers > 1:
+        batches = [
+            {symbol: symbol_groups[symbol] for symbol in symbols[i::workers]}
+            for i in range(workers)
+        ]
+        try:
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                frames = []
+                calculated = []
+                for batch_df, batch_symbols in executor.map(calculate_indicators_for_symbols, batches):
+                    if batch_df is not None:
+                        frames.append(batch_df)
+                        calculated.extend(batch_symbols)
+            
+            if not frames:
+                return None, []
+            return pd.concat(frames, ignore_index=True), calculated
+        except Exception:
+            logger.warning(
+                "Process pool failed, calculating indicators in-process",
+                exc_info=True,
+            )
+    
+    return calculate_indicators_for_symbols(symbol_groups)
+
+
+def calculate_indicators_polars(
+    symbol_groups: Dict[str, pd.DataFrame]
+) -> Tuple[Optional[pd.DataFrame], List[str]]:
+    """
+    Calculate technical indicators for all symbols with one Polars query.
+    
+    Opt-in alternative to the pandas path (requires polars). Every symbol
+    is computed in a single multi-threaded pass using window expressions
+    over 'symbol'. Produces the same columns as
+    TechnicalAnalyzer.calculate_all_stacked.
+    
+    Args:
+        symbol_groups: Dict mapping symbol to timestamp-ordered price data
+    
+    Returns:
+        Tuple of (stacked indicators or None, list of symbols calculated)
+    """
+    batch = {
+        symbol: symbol_prices
+        for symbol, symbol_prices in symbol_groups.items()
+        if len(symbol_prices) >= 20
+    }
+    if not batch or any("Close" not in df.columns for df in batch.values()):
+        return calculate_indicators_for_symbols(symbol_groups)
+    
+    combined = pd.concat(batch.values(), ignore_index=True)
+    has_volume = "Volume" in combined.columns
+    
+    close = pl.col("Close")
+    delta = close.diff()
+    gains = pl.when(delta > 0).then(delta).otherwise(0.0)
+    losses = pl.when(delta < 0).then(-delta).otherwise(0.0)
+    avg_gain = gains.rolling_mean(14)
+    avg_loss = losses.rolling_mean(14)
+    rs = avg_gain / pl.when(avg_loss == 0).then(1e-10).otherwise(avg_loss)
+    
+    bb_middle = close.rolling_mean(20)
+    bb_std = close.rolling_std(20)
+    
+    # MACD needs slow (26) + signal (9) periods of history
+    has_macd_history = pl.len() >= 35
+    macd_line = close.ewm_mean(span=12) - close.ewm_mean(span=26)
+    signal = macd_line.ewm_mean(span=9)
+    
+    # Price-derived indicators are stored as float32, as in calculate_all
+    price_exprs = [
+        (bb_middle + bb_std * 2.0).alias("bb_upper"),
+        bb_middle.alias("bb_middle"),
+        (bb_middle - bb_std * 2.0).alias("bb_lower"),
+        (bb_std * 4.0).alias("bb_width"),
+        ((close - (bb_middle - bb_std * 2.0)) / (bb_std * 4.0)).alias("bb_pct"),
+        (100 - (100 / (1 + rs))).alias("rsi"),
+        pl.when(has_macd_history).then(macd_line).alias("macd"),
+        pl.when(has_macd_history).then(signal).alias("signal"),
+        pl.when(has_macd_history).then(macd_line - signal).alias("histogram"),
+        close.rolling_mean(20).alias("sma_short"),
+        close.rolling_mean(50).alias("sma_long"),
+        close.ewm_mean(span=20).alias("ema_short"),
+        close.ewm_mean(span=50).alias("ema_long"),
+    ]
+    exprs = [expr.over("symbol").cast(pl.Float32) for expr in price_exprs]
+    
+    if has_volume:
+        volume = pl.col("Volume").cast(pl.Float64)
+        volume_ma = volume.rolling_mean(20)
+        exprs += [
+            ((delta.sign().fill_null(0) * volume).cum_sum() + volume.first()).over("symbol").alias("obv"),
+            volume_ma.over("symbol").alias("volume_ma"),
+            (volume / volume_ma).over("symbol").alias("relative_volume"),
+        ]
+    
+    indicators = (
+        pl.from_pandas(combined)
+        .with_columns(exprs)
+        .to_pandas()
+    )
+    
+    if max(len(df) for df in batch.values()) < 35:
+        indicators = indicators.drop(columns=["macd", "signal", "histogram"])
+    
+    return indicators, list(batch)
+
+
 def validate_technical_data(
     symbol_prices: pd.DataFrame
 ) -> bool:
@@ -71,6 +279,42 @@ def validate_technical_data(
     return True
 
 
+def process_all_symbols(
+    holdings_prices: pd.DataFrame,
+    symbols: List[str],
+    max_workers: int = 1,
+    use_polars: bool = False
+) -> Tuple[Optional[pd.DataFrame], List[str]]:
+    """
+    Validate and calculate technical indicators for every symbol.
+    
+    Args:
+        holdings_prices: DataFrame with price data for the holdings
+        symbols: Symbols to process, in reporting order
+        max_workers: Worker processes for indicator calculation
+        use_polars: Calculate indicators with Polars when it is installed
+    
+    Returns:
+        Tuple of (stacked indicators or None, list of failed symbols)
+    """
+    symbol_groups = group_prices_by_symbol(holdings_prices)
+    
+    valid_groups = {
+        symbol: symbol_groups[symbol]
+        for symbol in symbols
+        if validate_technical_data(symbol_groups.get(symbol))
+    }
+    if use_polars and HAS_POLARS:
+        combined, calculated = calculate_indicators_polars(valid_groups)
+    else:
+        combined, calculated = calculate_indicators_parallel(valid_groups, max_workers)
+    
+    calculated = set(calculated)
+    failed_symbols = [symbol for symbol in symbols if symbol not in calculated]
+    
+    return combined, failed_symbols
+
+
 def save_technical_to_db(
     technical_df: pd.DataFrame,
     db=None
@@ -100,7 +344,9 @@ def save_technical_to_db(
 def calculate_technical_streamlit(
     holdings_df: pd.DataFrame,
     db=None,
-    prices_df: pd.DataFrame = None
+    prices_df: pd.DataFrame = None,
+    max_workers: int = 1,
+    use_polars: bool = False
 ) -> Tuple[int, List[str]]:
     """
     Calculate technical indicators for all holdings (Streamlit-compatible).
@@ -111,6 +357,9 @@ def calculate_technical_streamlit(
         holdings_df: DataFrame with holdings
         db: ParquetDB instance (creates new if None)
         prices_df: DataFrame with price data (fetches from DB if None)
+        max_workers: Worker processes for indicator calculation
+            (1 calculates in-process)
+        use_polars: Calculate indicators with Polars when it is installed
     
     Returns:
         Tuple of (number of symbols processed, list of failed symbols)
@@ -121,47 +370,31 @@ def calculate_technical_streamlit(
         if db is None:
             db = ParquetDB(root_path="db")
         
-        # Get price data if not provided
+        symbols = holdings_df['sym'].unique().tolist()
+        symbols_set = set(symbols)
+        
+        # Get price data if not provided, pushing the symbol filter down
+        # to the parquet scan so other symbols' rows are never loaded
         if prices_df is None:
-            prices_df = db.read_table('prices')
+            prices_df = db.read_table('prices', filters=[('symbol', 'in', symbols)])
         
         if prices_df is None or prices_df.empty:
-            return 0, holdings_df['sym'].unique().tolist()
+            return 0, symbols
         
-        symbols = holdings_df['sym'].unique().tolist()
-        holdings_prices = prices_df[prices_df['symbol'].isin(symbols)].copy()
+        holdings_prices = prices_df[prices_df['symbol'].isin(symbols_set)]
         
         if holdings_prices.empty:
             return 0, symbols
         
-        all_indicators = []
-        failed_symbols = []
-        
-        for symbol in symbols:
-            try:
-                symbol_prices = holdings_prices[holdings_prices['symbol'] == symbol].sort_values('timestamp')
-                
-                if not validate_technical_data(symbol_prices):
-                    failed_symbols.append(symbol)
-                    continue
-                
-                indicators = calculate_indicators_for_symbol(symbol, symbol_prices)
-                
-                if indicators is not None and not indicators.empty:
-                    all_indicators.append(indicators)
-                else:
-                    failed_symbols.append(symbol)
-                    
-            except Exception as e:
-                failed_symbols.append(symbol)
-                continue
+        combined, failed_symbols = process_all_symbols(
+            holdings_prices, symbols, max_workers, use_polars
+        )
         
-        if all_indicators:
-            combined = pd.concat(all_indicators, ignore_index=True)
+        if combined is not None:
             success = save_technical_to_db(combined, db)
             
             if success:
-                return len(all_indicators), failed_symbols
+                return len(symbols) - len(failed_symbols), failed_symbols
             else:
                 return 0, symbols
         else:
@@ -173,40 +406,23 @@ def calculate_technical_streamlit(
 
 # Prefect task wrappers (optional, if Prefect available)
 if HAS_PREFECT:
-    @task(name="calculate_indicators_task")
-    def calculate_indicators_task(
-        symbol: str,
-        symbol_prices: pd.DataFrame
-    ) -> Optional[pd.DataFrame]:
-        """Prefect task for calculating indicators."""
+    @task(name="process_all_symbols_task")
+    def process_all_symbols_task(
+        holdings_prices: pd.DataFrame,
+        symbols: List[str]
+    ) -> Tuple[Optional[pd.DataFrame], List[str]]:
+        """Prefect task calculating indicators for all symbols in one batch."""
         task_logger = get_run_logger()
-        task_logger.info(f"Calculating indicators for {symbol}")
         
-        indicators = calculate_indicators_for_symbol(symbol, symbol_prices)
+        combined, failed_symbols = process_all_symbols(holdings_prices, symbols)
         
-        if indicators is not None:
-            task_logger.info(f"Calculated {len(indicators)} records for {symbol}")
-        else:
-            task_logger.warning(f"Failed to calculate indicators for {symbol}")
-        
-        return indicators
-    
-    @task(name="validate_price_data_task")
-    def validate_price_data_task(
-        symbol: str,
-        symbol_prices: pd.DataFrame
-    ) -> bool:
-        """Prefect task for validating price data."""
-        task_logger = get_run_logger()
-        
-        is_valid = validate_technical_data(symbol_prices)
-        
-        if is_valid:
-            task_logger.info(f"Price data valid for {symbol} ({len(symbol_prices)} records)")
-        else:
-            task_logger.warning(f"Price data invalid for {symbol}")
+        for symbol in failed_symbols:
+            task_logger.debug(f"No indicators calculated for {symbol}")
+        task_logger.info(
+            f"Calculated indicators for {len(symbols) - len(failed_symbols)} symbols ({len(failed_symbols)} failed)"
+        )
         
-        return is_valid
+        return combined, failed_symbols
     
     @task(name="save_technical_task")
     def save_technical_task(technical_df: pd.DataFrame) -> bool:
@@ -249,16 +465,19 @@ if HAS_PREFECT:
         try:
             db = ParquetDB(root_path="db")
             
-            # Get price data if not provided
+            symbols = holdings_df['sym'].unique().tolist()
+            symbols_set = set(symbols)
+            
+            # Get price data if not provided, pushing the symbol filter down
+            # to the parquet scan so other symbols' rows are never loaded
             if prices_df is None:
-                prices_df = db.read_table('prices')
+                prices_df = db.read_table('prices', filters=[('symbol', 'in', symbols)])
             
             if prices_df is None or prices_df.empty:
                 flow_logger.error("No price data available")
-                return 0, holdings_df['sym'].unique().tolist()
+                return 0, symbols
             
-            symbols = holdings_df['sym'].unique().tolist()
-            holdings_prices = prices_df[prices_df['symbol'].isin(symbols)].copy()
+            holdings_prices = prices_df[prices_df['symbol'].isin(symbols_set)]
             
             if holdings_prices.empty:
                 flow_logger.error("No price data for holdings")
@@ -266,43 +485,18 @@ if HAS_PREFECT:
             
             flow_logger.info(f"Starting technical analysis for {len(symbols)} symbols")
             
-            all_indicators = []
-            failed_symbols = []
-            
-            # Process each symbol
-            for symbol in symbols:
-                try:
-                    symbol_prices = holdings_prices[holdings_prices['symbol'] == symbol].sort_values('timestamp')
-                    
-                    # Validate price data
-                    is_valid = validate_price_data_task(symbol, symbol_prices)
-                    
-                    if not is_valid:
-                        failed_symbols.append(symbol)
-                        continue
-                    
-                    # Calculate indicators
-                    indicators = calculate_indicators_task(symbol, symbol_prices)
-                    
-                    if indicators is not None and not indicators.empty:
-                        all_indicators.append(indicators)
-                    else:
-                        failed_symbols.append(symbol)
-                        
-                except Exception as e:
-                    flow_logger.warning(f"Error processing {symbol}: {str(e)[:100]}")
-                    failed_symbols.append(symbol)
-                    continue
+            # One task for the whole batch rather than two per symbol
+            combined, failed_symbols = process_all_symbols_task(holdings_prices, symbols)
             
-            if all_indicators:
-                combined = pd.concat(all_indicators, ignore_index=True)
+            if combined is not None:
+                processed = len(symbols) - len(failed_symbols)
                 
                 # Save to database
                 success = save_technical_task(combined)
                 
-                flow_logger.info(f"Technical analysis complete: {len(all_indicators)} processed, {len(failed_symbols)} failed")
+                flow_logger.info(f"Technical analysis complete: {processed} processed, {len(failed_symbols)} failed")
                 
-                return len(all_indicators), failed_symbols if success else symbols
+                return processed, failed_symbols if success else symbols
             else:
                 flow_logger.warning("No indicators calculated")
                 return 0, symbols
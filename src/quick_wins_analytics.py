@@ -15,72 +15,436 @@ Easy-to-implement, high-value analytics:
 - Mean reversion signals
 """
 
+import heapq
+from collections import defaultdict
+from dataclasses import dataclass
+from operator import attrgetter, itemgetter
+
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union
+
+# Daily volatility -> annualized percentage (252 trading days)
+_ANNUALIZED_PCT = np.sqrt(252) * 100
+
+# Working precision for returns-based matrix work (correlations, betas,
+# momentum). Returns are noisy to far fewer than float32's ~7 significant
+# digits, and halving the width halves memory traffic and doubles SIMD lanes.
+# Returns are always derived from prices in float64 before the downcast.
+_RETURNS_DTYPE = np.float32
+
+# Label tables indexed by how many thresholds a value clears
+_Z_SIGNALS = (
+    "Oversold - Potential Buy",
+    "Oversold - Light Buy",
+    "Normal Range",
+    "Overbought - Light Sell",
+    "Overbought - Potential Sell",
+)
+_Z_STRENGTHS = ("Strong", "Moderate", "None", "Moderate", "Strong")
+_Z_NORMAL = 2
+_BETA_LABELS = ("Inverse/Hedge", "Conservative", "Moderate", "Aggressive")
+_MOMENTUM_LABELS = ("Downtrend", "Uptrend", "Strong Uptrend")
+
+
+@dataclass(frozen=True)
+class PortfolioView:
+    """
+    Array snapshot of a holdings dict, built by QuickWinsAnalytics.prepare().
+
+    Sector and asset class labels are stored as integer codes into their
+    first-seen categories, so repeated allocations reduce over small ints
+    instead of re-hashing label strings.
+    """
+
+    tickers: np.ndarray
+    quantities: np.ndarray
+    prices: np.ndarray
+    sector_codes: np.ndarray
+    sectors: np.ndarray
+    asset_class_codes: np.ndarray
+    asset_classes: np.ndarray
+
+    @property
+    def values(self) -> np.ndarray:
+        """Position values (quantity * price)."""
+        return self.quantities * self.prices
+
+
+@dataclass(slots=True)
+class MomentumScore:
+    """Momentum screening result for one ticker."""
+
+    momentum_pct: float
+    positive_day_ratio: float
+    score: float
+    signal: str
+
+    def as_dict(self) -> Dict[str, any]:
+        """Plain dict for JSON consumers."""
+        return {
+            "momentum_pct": self.momentum_pct,
+            "positive_day_ratio": self.positive_day_ratio,
+            "score": self.score,
+            "signal": self.signal,
+        }
+
+
+@dataclass(slots=True)
+class MeanReversionSignal:
+    """Mean reversion result for one ticker."""
+
+    current_price: float
+    moving_average: float
+    z_score: float
+    signal: str
+    strength: str
+    deviation_pct: float
+
+    def as_dict(self) -> Dict[str, any]:
+        """Plain dict for JSON consumers."""
+        return {
+            "current_price": self.current_price,
+            "moving_average": self.moving_average,
+            "z_score": self.z_score,
+            "signal": self.signal,
+            "strength": self.strength,
+            "deviation_pct": self.deviation_pct,
+        }
+
+
+def _ranked_entry(
+    ticker: str, entry: Union[Dict, MomentumScore, MeanReversionSignal]
+) -> Dict:
+    """Output dict for a ranked per-ticker entry, led by its ticker."""
+    fields = entry if isinstance(entry, dict) else entry.as_dict()
+    return {"ticker": ticker, **fields}
+
+
+def _categorize(labels: List) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode labels as compact integer codes into first-seen categories.
+
+    Args:
+        labels: Label per holding
+
+    Returns:
+        Tuple of (codes, categories)
+    """
+    index = {}
+    codes = [index.setdefault(label, len(index)) for label in labels]
+    categories = np.empty(len(index), dtype=object)
+    categories[:] = list(index)
+
+    return np.array(codes, dtype=np.min_scalar_type(len(index))), categories
+
+
+def _allocation_by_codes(
+    values: np.ndarray, codes: np.ndarray, categories: np.ndarray
+) -> Dict[str, float]:
+    """
+    Percentage of portfolio value held in each category.
+
+    Args:
+        values: Position values
+        codes: Category code per position
+        categories: Category labels indexed by code
+
+    Returns:
+        Dict of category -> allocation percentage, in first-seen order
+    """
+    total_value = values.sum()
+
+    if total_value == 0:
+        return {}
+
+    category_values = np.bincount(codes, weights=values, minlength=len(categories))
+    percentages = category_values / total_value * 100
+    return dict(zip(categories.tolist(), percentages.tolist()))
+
+
+def _column_major(df: pd.DataFrame) -> np.ndarray:
+    """
+    Float64 values of a ticker-column frame in Fortran (column-major) order.
+
+    The analytics below reduce or slice one ticker column at a time. With a
+    row-major array each column read strides across every row, so coerce
+    once up front. Frames built column by column are usually column-major
+    already, in which case no copy is made.
+
+    Args:
+        df: DataFrame with ticker columns
+
+    Returns:
+        2-D float64 array laid out column by column
+    """
+    return np.asfortranarray(df.to_numpy(dtype=np.float64))
+
+
+def _simple_returns(price_df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Period returns of each ticker, dropping dates with any missing return.
+
+    Equivalent to price_df.pct_change().dropna() (gaps are forward-filled
+    first, as pct_change does) without building intermediate frames.
+
+    Args:
+        price_df: DataFrame with date index, ticker columns (prices)
+
+    Returns:
+        Tuple of (2-D column-major array of returns, boolean mask of the
+        kept rows among price_df.index[1:])
+    """
+    prices = _column_major(price_df)
+
+    if np.isnan(prices).any():
+        prices = _column_major(price_df.ffill())
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        returns = prices[1:] / prices[:-1] - 1
+
+    complete = ~np.isnan(returns).any(axis=1)
+    return returns[complete], complete
+
+
+def daily_returns(price_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Period returns for a price frame.
+
+    Same result as price_df.pct_change().dropna() without the intermediate
+    frames. Compute it once per price frame and pass the result to
+    momentum_screening and portfolio_beta_visualization rather than
+    recomputing pct_change in each.
+
+    Args:
+        price_df: DataFrame with date index, ticker columns (prices)
+
+    Returns:
+        DataFrame of returns
+    """
+    returns, complete = _simple_returns(price_df)
+    return pd.DataFrame(
+        returns,
+        index=price_df.index[1:][complete],
+        columns=price_df.columns,
+    )
+
+
+def _correlation(returns: np.ndarray) -> np.ndarray:
+    """
+    Pearson correlation matrix between the columns of a returns array.
+
+    Args:
+        returns: 2-D array without missing values (rows = dates)
+
+    Returns:
+        Square correlation matrix; NaN for columns with no variance
+    """
+    n_cols = returns.shape[1]
+
+    if len(returns) == 0:
+        return np.full((n_cols, n_cols), np.nan)
+
+    centered = returns - returns.mean(axis=0)
+    covariance = centered.T @ centered
+    scale = np.sqrt(np.diag(covariance))
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        corr = covariance / np.outer(scale, scale)
+
+    np.clip(corr, -1.0, 1.0, out=corr)
+    corr[np.diag_indices(n_cols)] = np.where(scale > 0, 1.0, np.nan)
+    return corr
+
+
+def _trailing_window_stats(
+    arr: np.ndarray, period: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Last value, mean and sample std of each column's trailing window.
+
+    NaNs are skipped per column, so each window holds the last `period`
+    valid observations. Columns with fewer valid values get NaN throughout.
+
+    Args:
+        arr: 2-D float array (rows = dates, columns = tickers)
+        period: Window length
+
+    Returns:
+        Tuple of (last values, window means, window stds), one per column
+    """
+    n_cols = arr.shape[1]
+    windows = np.full((period, n_cols), np.nan)
+    valid = ~np.isnan(arr)
+
+    if valid.all():
+        if len(arr) >= period:
+            windows[:] = arr[-period:]
+    else:
+        # Keep each column's last `period` valid values, all columns at once
+        valid_counts = np.cumsum(valid, axis=0)
+        totals = valid_counts[-1] if len(arr) else np.zeros(n_cols, dtype=np.intp)
+        full = totals >= period
+        in_window = valid & (valid_counts > totals - period) & full
+
+        # Column-major extraction gives `period` values per full column, in order
+        windows[:, full] = arr.T[in_window.T].reshape(-1, period).T
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = windows.mean(axis=0)
+        stds = np.sqrt(((windows - means) ** 2).sum(axis=0) / (period - 1))
+
+    if period > 1:
+        # Flat windows have exactly zero spread, as pandas rolling reports
+        stds[np.ptp(windows, axis=0) == 0] = 0.0
+
+    return windows[-1], means, stds
+
+
+def _top_and_bottom(values: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Indices of the n largest values (descending) and n smallest (ascending).
+
+    Matches slicing a stable descending sort: ties rank by position, and
+    the bottom list is that sort's tail reversed. Only the candidates around
+    the partition point are sorted.
+
+    Args:
+        values: 1-D float array
+        n: Number of entries to take from each end
+
+    Returns:
+        Tuple of (top indices, bottom indices)
+    """
+    positions = np.arange(len(values))
+
+    if not 0 < n < len(values):
+        order = np.lexsort((positions, -values))
+        return order[:n], order[-n:][::-1]
+
+    top_cut = np.partition(values, len(values) - n)[len(values) - n]
+    top = np.flatnonzero(values >= top_cut)
+    top = top[np.lexsort((top, -values[top]))][:n]
+
+    bottom_cut = np.partition(values, n - 1)[n - 1]
+    bottom = np.flatnonzero(values <= bottom_cut)
+    bottom = bottom[np.lexsort((-bottom, values[bottom]))][:n]
+
+    return top, bottom
+
+
+def _concentration_from_array(weights_array: np.ndarray) -> Dict[str, float]:
+    """
+    Concentration metrics for a non-empty 1-D float64 array of weights.
+
+    Args:
+        weights_array: Position weights (normalized here)
+
+    Returns:
+        Concentration risk metrics
+    """
+    weights_array = weights_array / weights_array.sum()
+
+    # Herfindahl-Hirschman Index
+    hhi = weights_array @ weights_array
+
+    # Top-N concentration: only the five largest weights need ordering
+    top_count = min(5, len(weights_array))
+    top_weights = np.partition(weights_array, len(weights_array) - top_count)
+    top_weights = np.sort(top_weights[-top_count:])[::-1]
+    top_1 = top_weights[0]
+    top_3 = top_weights[:3].sum()
+    top_5 = top_weights.sum()
+
+    return {
+        "hhi_index": float(hhi),  # 0.1-1.0, higher = more concentrated
+        "top_1_concentration": float(top_1 * 100),
+        "top_3_concentration": float(top_3 * 100),
+        "top_5_concentration": float(top_5 * 100),
+        "num_holdings": len(weights_array),
+        "diversification_score": float(1.0 / hhi if hhi > 0 else 0),  # Higher = better
+        "is_concentrated": hhi > 0.25,  # HHI > 0.25 = moderately concentrated
+    }
 
 
 class QuickWinsAnalytics:
     """High-value, easy-to-implement portfolio analytics."""
 
     @staticmethod
-    def sector_allocation(holdings: Dict[str, Dict]) -> Dict[str, float]:
+    def prepare(holdings: Dict[str, Dict]) -> PortfolioView:
         """
-        Calculate portfolio allocation by sector.
+        Snapshot holdings into arrays for reuse across analytics calls.
 
         Args:
-            holdings: Dict with ticker -> {'quantity': int, 'price': float, 'sector': str}
+            holdings: Dict with ticker -> {'quantity', 'price', 'sector', 'asset_class'}
 
         Returns:
-            Dict of sector -> allocation percentage
+            PortfolioView accepted by the allocation and rotation analytics
         """
-        sector_values = {}
-        total_value = 0.0
-
-        for ticker, data in holdings.items():
-            value = data.get("quantity", 0) * data.get("price", 0)
-            sector = data.get("sector", "Unknown")
+        positions = holdings.values()
+        count = len(holdings)
+        sector_codes, sectors = _categorize(
+            [d.get("sector", "Unknown") for d in positions]
+        )
+        asset_class_codes, asset_classes = _categorize(
+            [d.get("asset_class", "equity") for d in positions]
+        )
+
+        return PortfolioView(
+            tickers=np.asarray(list(holdings), dtype=object),
+            quantities=np.fromiter(
+                (d.get("quantity", 0) for d in positions), dtype=np.float64, count=count
+            ),
+            prices=np.fromiter(
+                (d.get("price", 0) for d in positions), dtype=np.float64, count=count
+            ),
+            sector_codes=sector_codes,
+            sectors=sectors,
+            asset_class_codes=asset_class_codes,
+            asset_classes=asset_classes,
+        )
 
-            if sector not in sector_values:
-                sector_values[sector] = 0.0
+    @staticmethod
+    def sector_allocation(
+        holdings: Union[Dict[str, Dict], PortfolioView]
+    ) -> Dict[str, float]:
+        """
+        Calculate portfolio allocation by sector.
 
-            sector_values[sector] += value
-            total_value += value
+        Args:
+            holdings: Dict with ticker -> {'quantity': int, 'price': float, 'sector': str},
+                or a PortfolioView from prepare()
 
-        # Convert to percentages
-        if total_value == 0:
-            return {}
+        Returns:
+            Dict of sector -> allocation percentage
+        """
+        if not isinstance(holdings, PortfolioView):
+            holdings = QuickWinsAnalytics.prepare(holdings)
 
-        return {sector: (value / total_value * 100) for sector, value in sector_values.items()}
+        return _allocation_by_codes(
+            holdings.values, holdings.sector_codes, holdings.sectors
+        )
 
     @staticmethod
-    def asset_class_breakdown(holdings: Dict[str, Dict]) -> Dict[str, float]:
+    def asset_class_breakdown(
+        holdings: Union[Dict[str, Dict], PortfolioView]
+    ) -> Dict[str, float]:
         """
         Calculate portfolio by asset class (equity, crypto, bond, etc.).
 
         Args:
-            holdings: Dict with ticker -> {'quantity': int, 'price': float, 'asset_class': str}
+            holdings: Dict with ticker -> {'quantity': int, 'price': float, 'asset_class': str},
+                or a PortfolioView from prepare()
 
         Returns:
             Dict of asset_class -> allocation percentage
         """
-        class_values = {}
-        total_value = 0.0
-
-        for ticker, data in holdings.items():
-            value = data.get("quantity", 0) * data.get("price", 0)
-            asset_class = data.get("asset_class", "equity")
+        if not isinstance(holdings, PortfolioView):
+            holdings = QuickWinsAnalytics.prepare(holdings)
 
-            if asset_class not in class_values:
-                class_values[asset_class] = 0.0
-
-            class_values[asset_class] += value
-            total_value += value
-
-        if total_value == 0:
-            return {}
-
-        return {ac: (value / total_value * 100) for ac, value in class_values.items()}
+        return _allocation_by_codes(
+            holdings.values, holdings.asset_class_codes, holdings.asset_classes
+        )
 
     @staticmethod
     def portfolio_volatility(returns: List[float], annualized: bool = True) -> float:
@@ -97,11 +461,11 @@ class QuickWinsAnalytics:
         if len(returns) < 2:
             return 0.0
 
-        returns_array = np.array(returns)
-        std_dev = np.std(returns_array)
+        returns_array = np.fromiter(returns, dtype=np.float64, count=len(returns))
+        std_dev = returns_array.std()
 
         if annualized:
-            std_dev *= np.sqrt(252)
+            return float(std_dev * _ANNUALIZED_PCT)
 
         return float(std_dev * 100)
 
@@ -117,19 +481,18 @@ class QuickWinsAnalytics:
         Returns:
             Dict with projection and breakdown by holding
         """
-        total_dividend = 0.0
-        breakdown = {}
-
-        for ticker, data in holdings.items():
-            quantity = data.get("quantity", 0)
-            price = data.get("price", 0)
-            div_yield = data.get("dividend_yield", 0)
-
-            position_value = quantity * price
-            annual_dividend = position_value * div_yield
+        # One pass over the holdings into parallel float columns
+        fields = np.fromiter(
+            (
+                (d.get("quantity", 0), d.get("price", 0), d.get("dividend_yield", 0))
+                for d in holdings.values()
+            ),
+            dtype=[("quantity", "f8"), ("price", "f8"), ("dividend_yield", "f8")],
+            count=len(holdings),
+        )
 
-            breakdown[ticker] = annual_dividend
-            total_dividend += annual_dividend
+        annual_dividends = fields["quantity"] * fields["price"] * fields["dividend_yield"]
+        total_dividend = annual_dividends.sum()
 
         if annual_projection:
             projection_period = "annual"
@@ -142,7 +505,7 @@ class QuickWinsAnalytics:
             "projection_period": projection_period,
             "projected_income": float(projected),
             "annual_equivalent": float(total_dividend),
-            "breakdown": {k: float(v) for k, v in breakdown.items()},
+            "breakdown": dict(zip(holdings, annual_dividends.tolist())),
         }
 
     @staticmethod
@@ -157,82 +520,106 @@ class QuickWinsAnalytics:
         Returns:
             Dict with top performers
         """
-        performance = []
-
-        for ticker, data in positions.items():
-            entry = data.get("entry_price", 0)
-            current = data.get("current_price", 0)
-
-            if entry == 0:
-                continue
-
-            pnl_pct = (current - entry) / entry * 100
-            pnl_dollars = current - entry
-
-            performance.append(
-                {
-                    "ticker": ticker,
-                    "entry_price": entry,
-                    "current_price": current,
-                    "pnl_pct": pnl_pct,
-                    "pnl_dollars": pnl_dollars,
-                }
-            )
-
-        # Sort by performance
-        performance.sort(key=lambda x: x["pnl_pct"], reverse=True)
-
-        winners = performance[:top_n]
-        losers = performance[-top_n:][::-1]  # Reverse to show worst first
+        tickers = list(positions)
+        count = len(tickers)
+        entries = np.fromiter(
+            (data.get("entry_price", 0) for data in positions.values()),
+            dtype=np.float64,
+            count=count,
+        )
+        currents = np.fromiter(
+            (data.get("current_price", 0) for data in positions.values()),
+            dtype=np.float64,
+            count=count,
+        )
+
+        held = np.flatnonzero(entries != 0)
+        entries = entries[held]
+        currents = currents[held]
+        pnl_dollars = currents - entries
+        pnl_pct = pnl_dollars / entries * 100
+
+        winner_idx, loser_idx = _top_and_bottom(pnl_pct, top_n)
+
+        def _entry(i: int) -> Dict:
+            return {
+                "ticker": tickers[held[i]],
+                "entry_price": float(entries[i]),
+                "current_price": float(currents[i]),
+                "pnl_pct": float(pnl_pct[i]),
+                "pnl_dollars": float(pnl_dollars[i]),
+            }
 
         return {
-            "winners": [
-                {k: (float(v) if isinstance(v, (int, float)) else v) for k, v in w.items()} for w in winners
-            ],
-            "losers": [{k: (float(v) if isinstance(v, (int, float)) else v) for k, v in l.items()} for l in losers],
+            "winners": [_entry(i) for i in winner_idx],
+            "losers": [_entry(i) for i in loser_idx],
         }
 
     @staticmethod
-    def correlation_matrix_summary(price_df: pd.DataFrame, top_correlations: int = 5) -> Dict[str, any]:
+    def correlation_matrix_summary(
+        price_df: pd.DataFrame, top_correlations: int = 5, include_matrix: bool = True
+    ) -> Dict[str, any]:
         """
         Calculate and summarize correlation matrix.
 
         Args:
             price_df: DataFrame with date index, ticker columns
             top_correlations: Number of top correlations to show
+            include_matrix: If False, omit the full correlation matrix
 
         Returns:
-            Dict with correlation summary
+            Dict with correlation summary (correlations computed in float32)
         """
-        returns_df = price_df.pct_change().dropna()
-        corr_matrix = returns_df.corr()
-
-        # Find top positive and negative correlations
-        correlation_pairs = []
-
-        for i in range(len(corr_matrix.columns)):
-            for j in range(i + 1, len(corr_matrix.columns)):
-                ticker_i = corr_matrix.columns[i]
-                ticker_j = corr_matrix.columns[j]
-                corr_value = corr_matrix.iloc[i, j]
+        columns = price_df.columns
+        returns, _ = _simple_returns(price_df)
+        returns = returns.astype(_RETURNS_DTYPE, copy=False)
+        corr_matrix = _correlation(returns)
+
+        # Upper-triangle pairs, strongest absolute correlation first
+        i_upper, j_upper = np.triu_indices(len(columns), k=1)
+        pair_values = corr_matrix[i_upper, j_upper]
+        order = np.argsort(-np.abs(pair_values), kind="stable")
+
+        # Find top positive and negative correlations, building dicts only for
+        # the pairs that are kept
+        tickers = columns.tolist()
+        top_positive = []
+        top_negative = []
+
+        for k in order:
+            if min(len(top_positive), len(top_negative)) >= top_correlations:
+                break
+
+            corr_value = pair_values[k]
+
+            if corr_value > 0:
+                selected = top_positive
+            elif corr_value < 0:
+                selected = top_negative
+            else:
+                continue
 
-                correlation_pairs.append(
-                    {"ticker_1": ticker_i, "ticker_2": ticker_j, "correlation": corr_value}
+            if len(selected) < top_correlations:
+                selected.append(
+                    {
+                        "ticker_1": tickers[i_upper[k]],
+                        "ticker_2": tickers[j_upper[k]],
+                        "correlation": float(corr_value),
+                    }
                 )
 
-        # Sort by absolute correlation
-        correlation_pairs.sort(key=lambda x: abs(x["correlation"]), reverse=True)
-
-        top_positive = [p for p in correlation_pairs if p["correlation"] > 0][:top_correlations]
-        top_negative = [p for p in correlation_pairs if p["correlation"] < 0][:top_correlations]
-
-        return {
-            "correlation_matrix": corr_matrix.to_dict(),
+        summary = {
             "top_positive_correlations": top_positive,
             "top_negative_correlations": top_negative,
-            "num_assets": len(corr_matrix.columns),
+            "num_assets": len(columns),
         }
 
+        if include_matrix:
+            corr_df = pd.DataFrame(corr_matrix, index=columns, columns=columns)
+            summary = {"correlation_matrix": corr_df.to_dict(), **summary}
+
+        return summary
+
     @staticmethod
     def sharpe_ratio_calculation(
         returns: List[float], risk_free_rate: float = 0.04, periods_per_year: int = 252
@@ -251,9 +638,13 @@ class QuickWinsAnalytics:
         if len(returns) < 2:
             return 0.0
 
-        returns_array = np.array(returns)
-        excess_return = np.mean(returns_array) - (risk_free_rate / periods_per_year)
-        std_return = np.std(returns_array)
+        returns_array = np.asarray(returns, dtype=np.float64)
+
+        # One mean, shared by the excess return and the (population) std
+        mean_return = returns_array.mean()
+        deviations = returns_array - mean_return
+        std_return = np.sqrt(deviations @ deviations / len(returns_array))
+        excess_return = mean_return - (risk_free_rate / periods_per_year)
 
         if std_return == 0:
             return 0.0
@@ -272,31 +663,12 @@ class QuickWinsAnalytics:
         Returns:
             Concentration risk metrics
         """
-        weights_array = np.array(list(weights.values()))
-
-        if len(weights_array) == 0:
+        if not weights:
             return {}
 
-        weights_array = weights_array / weights_array.sum()
-
-        # Herfindahl-Hirschman Index
-        hhi = np.sum(weights_array**2)
-
-        # Top-N concentration
-        sorted_weights = sorted(weights_array, reverse=True)
-        top_1 = sorted_weights[0] if len(sorted_weights) > 0 else 0
-        top_3 = sum(sorted_weights[:3]) if len(sorted_weights) >= 3 else sum(sorted_weights)
-        top_5 = sum(sorted_weights[:5]) if len(sorted_weights) >= 5 else sum(sorted_weights)
-
-        return {
-            "hhi_index": float(hhi),  # 0.1-1.0, higher = more concentrated
-            "top_1_concentration": float(top_1 * 100),
-            "top_3_concentration": float(top_3 * 100),
-            "top_5_concentration": float(top_5 * 100),
-            "num_holdings": len(weights),
-            "diversification_score": float(1.0 / hhi if hhi > 0 else 0),  # Higher = better
-            "is_concentrated": hhi > 0.25,  # HHI > 0.25 = moderately concentrated
-        }
+        return _concentration_from_array(
+            np.fromiter(weights.values(), dtype=np.float64, count=len(weights))
+        )
 
     @staticmethod
     def portfolio_summary_statistics(holdings: Dict[str, Dict], prices: Dict[str, float]) -> Dict[str, any]:
@@ -310,31 +682,29 @@ class QuickWinsAnalytics:
         Returns:
             Summary statistics
         """
-        total_value = 0.0
-        weights = {}
+        tickers = list(holdings)
+        count = len(tickers)
+        quantities = np.fromiter(holdings.values(), dtype=np.float64, count=count)
+        ticker_prices = np.fromiter(
+            (prices.get(ticker, 0) for ticker in tickers), dtype=np.float64, count=count
+        )
 
-        for ticker, quantity in holdings.items():
-            price = prices.get(ticker, 0)
-            value = quantity * price
-            total_value += value
+        values = quantities * ticker_prices
+        total_value = values.sum()
 
         if total_value == 0:
             return {}
 
-        for ticker, quantity in holdings.items():
-            price = prices.get(ticker, 0)
-            value = quantity * price
-            weights[ticker] = value / total_value
-
-        concentration = QuickWinsAnalytics.concentration_risk_metrics(weights)
+        weights_array = values / total_value
+        concentration = _concentration_from_array(weights_array)
 
         return {
             "total_portfolio_value": float(total_value),
             "num_holdings": len(holdings),
-            "largest_holding": max(weights.values()) * 100 if weights else 0,
-            "smallest_holding": min(weights.values()) * 100 if weights else 0,
+            "largest_holding": float(weights_array.max() * 100),
+            "smallest_holding": float(weights_array.min() * 100),
             "concentration_metrics": concentration,
-            "weights": {k: float(v * 100) for k, v in weights.items()},
+            "weights": dict(zip(tickers, (weights_array * 100).tolist())),
         }
 
     @staticmethod
@@ -347,52 +717,53 @@ class QuickWinsAnalytics:
             market_returns: Series with market returns
         
         Returns:
-            Dict with beta values and visualization data
+            Dict with beta values and visualization data (betas computed in float32)
         """
-        betas = {}
-        
-        for ticker in returns_df.columns:
-            # Calculate covariance between ticker and market
-            covariance = np.cov(returns_df[ticker], market_returns)[0, 1]
-            market_variance = np.var(market_returns)
-            
-            if market_variance != 0:
-                beta = covariance / market_variance
-            else:
-                beta = 0.0
-            
-            betas[ticker] = float(beta)
-        
+        returns = _column_major(returns_df).astype(_RETURNS_DTYPE, copy=False)
+        market = np.asarray(market_returns, dtype=_RETURNS_DTYPE)
+
+        # Covariance of every ticker with the market in one matrix-vector product
+        if returns.shape[1] > 0:
+            market_centered = market - market.mean()
+            returns_centered = returns - returns.mean(axis=0)
+            covariances = returns_centered.T @ market_centered / (len(market) - 1)
+        else:
+            covariances = np.empty(0)
+        market_variance = np.var(market)
+
+        if market_variance != 0:
+            beta_values = covariances / market_variance
+        else:
+            beta_values = np.zeros(len(covariances))
+
+        betas = dict(zip(returns_df.columns, beta_values.tolist()))
+
         portfolio_beta = float(np.mean(list(betas.values()))) if betas else 1.0
         
         return {
             "portfolio_beta": portfolio_beta,
             "individual_betas": betas,
-            "beta_interpretation": (
-                "Aggressive" if portfolio_beta > 1.2 else
-                "Moderate" if portfolio_beta > 0.8 else
-                "Conservative" if portfolio_beta > 0 else
-                "Inverse/Hedge"
+            "beta_interpretation": _BETA_LABELS[
+                (portfolio_beta > 0) + (portfolio_beta > 0.8) + (portfolio_beta > 1.2)
+            ],
+            "high_beta_holdings": heapq.nlargest(
+                5, ((t, b) for t, b in betas.items() if b > 1.2), key=lambda x: x[1]
+            ),
+            "low_beta_holdings": heapq.nsmallest(
+                5, ((t, b) for t, b in betas.items() if b < 0.8), key=lambda x: x[1]
             ),
-            "high_beta_holdings": sorted(
-                [(t, b) for t, b in betas.items() if b > 1.2],
-                key=lambda x: x[1],
-                reverse=True
-            )[:5],
-            "low_beta_holdings": sorted(
-                [(t, b) for t, b in betas.items() if b < 0.8],
-                key=lambda x: x[1]
-            )[:5],
         }
 
     @staticmethod
-    def sector_rotation_strategy(sector_returns: Dict[str, float], holding_sectors: Dict[str, str]) -> Dict[str, any]:
+    def sector_rotation_strategy(
+        sector_returns: Dict[str, float], holding_sectors: Union[Dict[str, str], PortfolioView]
+    ) -> Dict[str, any]:
         """
         Identify sector rotation opportunities.
         
         Args:
             sector_returns: Dict of sector -> recent return %
-            holding_sectors: Dict of ticker -> sector
+            holding_sectors: Dict of ticker -> sector, or a PortfolioView from prepare()
         
         Returns:
             Rotation recommendations
@@ -400,76 +771,106 @@ class QuickWinsAnalytics:
         if not sector_returns:
             return {}
         
-        sorted_sectors = sorted(sector_returns.items(), key=lambda x: x[1], reverse=True)
-        best_sectors = [s[0] for s in sorted_sectors[:3]]
-        worst_sectors = [s[0] for s in sorted_sectors[-3:]]
+        # Only the three best and worst sectors are needed. Worst is taken in
+        # reverse so ties keep the order a full descending sort would give.
+        best = heapq.nlargest(3, sector_returns.items(), key=lambda x: x[1])
+        worst = heapq.nsmallest(
+            3, reversed(sector_returns.items()), key=lambda x: x[1]
+        )[::-1]
+        best_sectors = [s[0] for s in best]
+        worst_sectors = [s[0] for s in worst]
+        worst_set = set(worst_sectors)
         
         # Find holdings in underperforming sectors
-        holdings_in_worst = {}
-        for ticker, sector in holding_sectors.items():
-            if sector in worst_sectors:
-                if sector not in holdings_in_worst:
-                    holdings_in_worst[sector] = []
-                holdings_in_worst[sector].append(ticker)
+        holdings_in_worst = defaultdict(list)
+        if isinstance(holding_sectors, PortfolioView):
+            for code, sector in enumerate(holding_sectors.sectors.tolist()):
+                if sector in worst_set:
+                    in_sector = holding_sectors.sector_codes == code
+                    holdings_in_worst[sector] = holding_sectors.tickers[in_sector].tolist()
+        else:
+            for ticker, sector in holding_sectors.items():
+                if sector in worst_set:
+                    holdings_in_worst[sector].append(ticker)
         
         return {
             "best_performing_sectors": [
-                {"sector": s[0], "return": float(s[1])} for s in sorted_sectors[:3]
+                {"sector": s[0], "return": float(s[1])} for s in best
             ],
             "worst_performing_sectors": [
-                {"sector": s[0], "return": float(s[1])} for s in sorted_sectors[-3:]
+                {"sector": s[0], "return": float(s[1])} for s in worst
             ],
-            "candidates_for_rotation": holdings_in_worst,
+            "candidates_for_rotation": dict(holdings_in_worst),
             "rotation_potential": f"Consider rotating from {', '.join(worst_sectors)} to {', '.join(best_sectors)}",
         }
 
     @staticmethod
-    def momentum_screening(returns_df: pd.DataFrame, period: int = 20) -> Dict[str, any]:
+    def momentum_screening(
+        returns_df: pd.DataFrame, period: int = 20, as_records: bool = False
+    ) -> Dict[str, any]:
         """
         Screen for momentum signals using price momentum and RSI-like calculations.
         
         Args:
             returns_df: DataFrame with ticker columns (daily returns)
             period: Lookback period for momentum
+            as_records: If True, 'all_scores' holds slotted MomentumScore
+                records instead of dicts (lighter for large batch runs)
         
         Returns:
-            Momentum signals and screening results
+            Momentum signals and screening results (returns compounded in float32)
         """
         momentum_scores = {}
+        entry_type = MomentumScore if as_records else dict
+
+        values = _column_major(returns_df).astype(_RETURNS_DTYPE, copy=False)
+        recent_returns = values[max(len(values) - period, 0):]
+        num_days = len(recent_returns)
+
+        # Price momentum (cumulative return over period), all tickers at once;
+        # missing returns count as flat like pandas' skipna product
+        momentums = np.nanprod(1 + recent_returns, axis=0) - 1
+
+        # Momentum strength (consistency)
+        positive_days = (recent_returns > 0).sum(axis=0)
+        if num_days > 0:
+            strengths = positive_days / num_days
+        else:
+            strengths = np.zeros(len(momentums))
+
+        # Composite score
+        scores = momentums * 100 + strengths * 20  # Weighted composite
+
+        tiers = (scores > 0).astype(np.intp) + (scores > 10)
+
+        for ticker, momentum, strength, score, tier in zip(
+            returns_df.columns, momentums, strengths, scores, tiers
+        ):
+            momentum_scores[ticker] = entry_type(
+                momentum_pct=float(momentum * 100),
+                positive_day_ratio=float(strength),
+                score=float(score),
+                signal=_MOMENTUM_LABELS[tier],
+            )
         
-        for ticker in returns_df.columns:
-            # Calculate price momentum (cumulative return over period)
-            recent_returns = returns_df[ticker].tail(period)
-            momentum = (1 + recent_returns).prod() - 1
-            
-            # Calculate momentum strength (consistency)
-            positive_days = (recent_returns > 0).sum()
-            strength = positive_days / len(recent_returns) if len(recent_returns) > 0 else 0
-            
-            # Composite score
-            score = momentum * 100 + strength * 20  # Weighted composite
-            
-            momentum_scores[ticker] = {
-                "momentum_pct": float(momentum * 100),
-                "positive_day_ratio": float(strength),
-                "score": float(score),
-                "signal": "Strong Uptrend" if score > 10 else "Uptrend" if score > 0 else "Downtrend"
-            }
-        
-        sorted_momentum = sorted(momentum_scores.items(), key=lambda x: x[1]["score"], reverse=True)
+        score_of = attrgetter("score") if as_records else itemgetter("score")
+        sorted_momentum = sorted(
+            momentum_scores.items(), key=lambda x: score_of(x[1]), reverse=True
+        )
         
         return {
             "all_scores": momentum_scores,
-            "top_momentum": [
-                {**{"ticker": t}, **v} for t, v in sorted_momentum[:5]
-            ],
-            "bottom_momentum": [
-                {**{"ticker": t}, **v} for t, v in sorted_momentum[-5:]
-            ],
+            "top_momentum": [_ranked_entry(t, v) for t, v in sorted_momentum[:5]],
+            "bottom_momentum": [_ranked_entry(t, v) for t, v in sorted_momentum[-5:]],
         }
 
     @staticmethod
-    def mean_reversion_signals(prices_df: pd.DataFrame, period: int = 20, std_dev_threshold: float = 2.0) -> Dict[str, any]:
+    def mean_reversion_signals(
+        prices_df: pd.DataFrame,
+        period: int = 20,
+        std_dev_threshold: float = 2.0,
+        as_records: bool = False,
+    ) -> Dict[str, any]:
         """
         Identify mean reversion signals using deviation from moving average.
         
@@ -477,73 +878,76 @@ class QuickWinsAnalytics:
             prices_df: DataFrame with ticker columns (prices)
             period: Period for moving average
             std_dev_threshold: Number of standard deviations for signal
+            as_records: If True, 'all_signals' holds slotted MeanReversionSignal
+                records instead of dicts (lighter for large batch runs)
         
         Returns:
             Mean reversion signals and candidates
         """
         signals = {}
-        
-        for ticker in prices_df.columns:
-            prices = prices_df[ticker].dropna()
-            
-            if len(prices) < period:
-                continue
-            
-            # Calculate moving average and standard deviation
-            ma = prices.rolling(window=period).mean()
-            std = prices.rolling(window=period).std()
-            
-            # Get current deviation
-            current_price = prices.iloc[-1]
-            current_ma = ma.iloc[-1]
-            current_std = std.iloc[-1]
-            
-            if current_std == 0 or pd.isna(current_ma):
-                continue
-            
+        entry_type = MeanReversionSignal if as_records else dict
+
+        # Only the latest window matters, so skip the full rolling series
+        last_prices, moving_averages, moving_stds = _trailing_window_stats(
+            _column_major(prices_df), period
+        )
+
+        # NaN average means fewer than `period` prices
+        usable = (moving_stds != 0) & ~np.isnan(moving_averages)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
             # Calculate z-score (deviation in standard deviations)
-            z_score = (current_price - current_ma) / current_std
-            
-            # Determine signal
-            if z_score > std_dev_threshold:
-                signal = "Overbought - Potential Sell"
-                strength = "Strong"
-            elif z_score > std_dev_threshold * 0.5:
-                signal = "Overbought - Light Sell"
-                strength = "Moderate"
-            elif z_score < -std_dev_threshold:
-                signal = "Oversold - Potential Buy"
-                strength = "Strong"
-            elif z_score < -std_dev_threshold * 0.5:
-                signal = "Oversold - Light Buy"
-                strength = "Moderate"
-            else:
-                signal = "Normal Range"
-                strength = "None"
-            
-            signals[ticker] = {
-                "current_price": float(current_price),
-                "moving_average": float(current_ma),
-                "z_score": float(z_score),
-                "signal": signal,
-                "strength": strength,
-                "deviation_pct": float((current_price - current_ma) / current_ma * 100),
-            }
+            z_scores = (last_prices - moving_averages) / moving_stds
+            deviations = (last_prices - moving_averages) / moving_averages * 100
+
+        # Bucket index into the _Z_* label tables without per-ticker branches.
+        # Strictness differs by side (z == -threshold is a light buy, while
+        # z == threshold / 2 is normal), so sum the comparisons directly.
+        buckets = (
+            (z_scores >= -std_dev_threshold).astype(np.intp)
+            + (z_scores >= -std_dev_threshold * 0.5)
+            + (z_scores > std_dev_threshold * 0.5)
+            + (z_scores > std_dev_threshold)
+        )
+        buckets[np.isnan(z_scores)] = _Z_NORMAL
+
+        for ticker, current_price, current_ma, z_score, deviation, bucket in zip(
+            prices_df.columns[usable],
+            last_prices[usable],
+            moving_averages[usable],
+            z_scores[usable],
+            deviations[usable],
+            buckets[usable],
+        ):
+            signals[ticker] = entry_type(
+                current_price=float(current_price),
+                moving_average=float(current_ma),
+                z_score=float(z_score),
+                signal=_Z_SIGNALS[bucket],
+                strength=_Z_STRENGTHS[bucket],
+                deviation_pct=float(deviation),
+            )
         
-        # Filter for actionable signals
-        buy_signals = {t: v for t, v in signals.items() if "Buy" in v["signal"]}
-        sell_signals = {t: v for t, v in signals.items() if "Sell" in v["signal"]}
+        # Filter for actionable signals; output dicts are only built for the
+        # candidates that are kept
+        field = attrgetter if as_records else itemgetter
+        signal_of = field("signal")
+        z_score_of = field("z_score")
+        buy_signals = [(t, v) for t, v in signals.items() if "Buy" in signal_of(v)]
+        sell_signals = [(t, v) for t, v in signals.items() if "Sell" in signal_of(v)]
         
         return {
             "all_signals": signals,
-            "buy_candidates": sorted(
-                [{**{"ticker": t}, **v} for t, v in buy_signals.items()],
-                key=lambda x: abs(x["z_score"]),
-                reverse=True
-            )[:5],
-            "sell_candidates": sorted(
-                [{**{"ticker": t}, **v} for t, v in sell_signals.items()],
-                key=lambda x: abs(x["z_score"]),
-                reverse=True
-            )[:5],
+            "buy_candidates": [
+                _ranked_entry(t, v)
+                for t, v in sorted(
+                    buy_signals, key=lambda x: abs(z_score_of(x[1])), reverse=True
+                )[:5]
+            ],
+            "sell_candidates": [
+                _ranked_entry(t, v)
+                for t, v in sorted(
+                    sell_signals, key=lambda x: abs(z_score_of(x[1])), reverse=True
+                )[:5]
+            ],
         }
@@ -7,62 +7,143 @@ Provides analysis functions for:
 - Sector rotation strategies
 - Portfolio beta calculation
 
-Works both directly in Streamlit and with Prefect for logging.
+Works both directly in Streamlit and with Prefect for logging. Prefect is
+imported and the tasks/flows are built on first use; set FIN_ENABLE_PREFECT=0
+to run the flow wrappers as plain function calls.
 """
 
-from typing import Dict, List, Optional, Tuple
+import importlib.util
+import os
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 
 import pandas as pd
 import numpy as np
 
-try:
-    from prefect import flow, task, get_run_logger
-    HAS_PREFECT = True
-except ImportError:
-    HAS_PREFECT = False
+HAS_PREFECT = (
+    os.getenv("FIN_ENABLE_PREFECT", "1") == "1"
+    and importlib.util.find_spec("prefect") is not None
+)
 
 
-def calculate_momentum_analysis(holdings_df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
+_MOMENTUM_SIGNALS = pd.CategoricalDtype(
+    ['Downtrend', 'Uptrend', 'Strong Uptrend'], ordered=True
+)
+_REVERSION_SIGNALS = pd.CategoricalDtype(
+    ['Strong Oversold', 'Oversold', 'Normal Range', 'Overbought', 'Strong Overbought'],
+    ordered=True,
+)
+_REVERSION_NORMAL = 2
+_RISK_PROFILES = (
+    'Very Conservative / Hedged', 'Conservative', 'Moderate', 'Aggressive',
+)
+_RETURNS_DTYPE = np.float32
+
+
+def _float_column(holdings_df: pd.DataFrame, column: str) -> np.ndarray:
+    """
+    Extract a holdings column as a float64 array with NaN for missing values.
+
+    Args:
+        holdings_df: DataFrame with holdings
+        column: Column name to extract
+
+    Returns:
+        float64 numpy array aligned with holdings_df rows
+    """
+    return holdings_df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _compute_return_pct(holdings_df: pd.DataFrame) -> np.ndarray:
+    """
+    Calculate return % per holding from multiple sources.
+
+    pnl_percent is used where present; other rows fall back to price returns
+    from current_price and bep, or to pnl_absolute over entry value when the
+    price columns are absent.
+
+    Args:
+        holdings_df: DataFrame with holdings including returns data
+
+    Returns:
+        float64 array of return % aligned with holdings_df rows
+    """
+    columns = set(holdings_df.columns)
+    return_pct = np.zeros(len(holdings_df))
+    missing = slice(None)
+
+    if 'pnl_percent' in columns:
+        pnl_percent = _float_column(holdings_df, 'pnl_percent')
+        missing = np.isnan(pnl_percent)
+        return_pct = np.where(missing, 0.0, pnl_percent)
+        if not missing.any():
+            return return_pct
+
+    # Fall back only for rows without pnl_percent
+    if {'current_price', 'bep'} <= columns:
+        current = _float_column(holdings_df, 'current_price')[missing]
+        entry = _float_column(holdings_df, 'bep')[missing]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return_pct[missing] = np.where(
+                entry > 0, (current - entry) / entry * 100, 0.0
+            )
+    elif {'pnl_absolute', 'qty', 'bep'} <= columns:
+        qty = _float_column(holdings_df, 'qty')[missing]
+        entry = _float_column(holdings_df, 'bep')[missing]
+        pnl_absolute = _float_column(holdings_df, 'pnl_absolute')[missing]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return_pct[missing] = np.where(
+                (qty > 0) & (entry > 0), pnl_absolute / (qty * entry) * 100, 0.0
+            )
+
+    return return_pct
+
+
+def _momentum_codes(return_pct: np.ndarray) -> np.ndarray:
+    """
+    Classify return % into momentum signal codes.
+
+    Args:
+        return_pct: Array of return % per holding
+
+    Returns:
+        int8 codes into _MOMENTUM_SIGNALS (0=Downtrend, 1=Uptrend,
+        2=Strong Uptrend)
+    """
+    return (return_pct > 0).astype(np.int8) + (return_pct > 10)
+
+
+def calculate_momentum_analysis(
+    holdings_df: pd.DataFrame, return_pct: Optional[np.ndarray] = None
+) -> Tuple[pd.DataFrame, Dict]:
     """
     Calculate momentum signals from holdings data.
     
     Args:
         holdings_df: DataFrame with holdings including returns data
+        return_pct: Precomputed _compute_return_pct(holdings_df), if available
     
     Returns:
         Tuple of (momentum_df with signals, statistics dict)
     """
-    momentum_data = []
-    
-    for idx, row in holdings_df.iterrows():
-        # Calculate return % from multiple sources
-        return_pct = 0
-        
-        if 'pnl_percent' in holdings_df.columns and pd.notna(row.get('pnl_percent')):
-            return_pct = float(row['pnl_percent'])
-        elif 'current_price' in holdings_df.columns and 'bep' in holdings_df.columns:
-            current = float(row.get('current_price', 0))
-            entry = float(row.get('bep', 0))
-            if entry > 0:
-                return_pct = ((current - entry) / entry) * 100
-        elif 'pnl_absolute' in holdings_df.columns and 'qty' in holdings_df.columns and 'bep' in holdings_df.columns:
-            qty = float(row.get('qty', 0))
-            entry = float(row.get('bep', 0))
-            if qty > 0 and entry > 0:
-                entry_value = qty * entry
-                return_pct = (float(row.get('pnl_absolute', 0)) / entry_value) * 100 if entry_value > 0 else 0
-        
-        momentum_data.append({
-            'Symbol': row['sym'],
-            'Return %': round(return_pct, 2),
-            'Current Price': row.get('current_price', 0),
-            'Signal': 'Strong Uptrend' if return_pct > 10 else 'Uptrend' if return_pct > 0 else 'Downtrend'
-        })
-    
-    momentum_df = pd.DataFrame(momentum_data).sort_values('Return %', ascending=False)
-    
-    uptrend_count = len(momentum_df[momentum_df['Signal'].str.contains('Uptrend')])
-    downtrend_count = len(momentum_df[momentum_df['Signal'] == 'Downtrend'])
+    if return_pct is None:
+        return_pct = _compute_return_pct(holdings_df)
+
+    current_price = (
+        holdings_df['current_price'].to_numpy()
+        if 'current_price' in holdings_df.columns else 0
+    )
+    signal_codes = _momentum_codes(return_pct)
+
+    momentum_df = pd.DataFrame({
+        'Symbol': holdings_df['sym'].to_numpy(),
+        'Return %': np.round(return_pct, 2),
+        'Current Price': current_price,
+        'Signal': pd.Categorical.from_codes(signal_codes, dtype=_MOMENTUM_SIGNALS),
+    }).sort_values('Return %', ascending=False)
+    
+    uptrend_count = int(np.count_nonzero(signal_codes))
+    downtrend_count = len(signal_codes) - uptrend_count
     avg_return = momentum_df['Return %'].mean()
     
     stats = {
@@ -70,8 +151,8 @@ def calculate_momentum_analysis(holdings_df: pd.DataFrame) -> Tuple[pd.DataFrame
         'uptrend_count': uptrend_count,
         'downtrend_count': downtrend_count,
         'avg_return': float(avg_return),
-        'best_performer': momentum_df.iloc[0]['Symbol'] if not momentum_df.empty else None,
-        'worst_performer': momentum_df.iloc[-1]['Symbol'] if not momentum_df.empty else None,
+        'best_performer': momentum_df['Symbol'].iat[0] if not momentum_df.empty else None,
+        'worst_performer': momentum_df['Symbol'].iat[-1] if not momentum_df.empty else None,
     }
     
     return momentum_df, stats
@@ -90,22 +171,30 @@ def calculate_mean_reversion_analysis(holdings_df: pd.DataFrame) -> Tuple[pd.Dat
     if 'pnl_percent' not in holdings_df.columns:
         return pd.DataFrame(), {'error': 'No P&L data available'}
     
-    reversion_data = []
-    for idx, row in holdings_df.iterrows():
-        pnl = row['pnl_percent']
-        reversion_data.append({
-            'Symbol': row['sym'],
-            'P&L %': pnl,
-            'Current Price': row.get('current_price', 0),
-            'Signal': 'Strong Overbought' if pnl > 50 else 'Overbought' if pnl > 20 else 'Strong Oversold' if pnl < -50 else 'Oversold' if pnl < -20 else 'Normal Range'
-        })
-    
-    reversion_df = pd.DataFrame(reversion_data).sort_values('P&L %', ascending=True)
-    
-    oversold_count = len(reversion_df[reversion_df['Signal'].str.contains('Oversold')])
-    overbought_count = len(reversion_df[reversion_df['Signal'].str.contains('Overbought')])
-    normal_count = len(reversion_df[reversion_df['Signal'] == 'Normal Range'])
-    
+    pnl = _float_column(holdings_df, 'pnl_percent')
+
+    # Bucket codes count thresholds crossed either side of Normal Range;
+    # NaN crosses none and stays Normal
+    buckets = (
+        _REVERSION_NORMAL
+        + (pnl > 20).astype(np.intp) + (pnl > 50)
+        - (pnl < -20) - (pnl < -50)
+    )
+
+    reversion_df = pd.DataFrame({
+        'Symbol': holdings_df['sym'].to_numpy(),
+        'P&L %': holdings_df['pnl_percent'].to_numpy(),
+        'Current Price': (
+            holdings_df['current_price'].to_numpy()
+            if 'current_price' in holdings_df.columns else 0
+        ),
+        'Signal': pd.Categorical.from_codes(buckets, dtype=_REVERSION_SIGNALS),
+    }).sort_values('P&L %', ascending=True)
+
+    oversold_count = int(np.count_nonzero(buckets < _REVERSION_NORMAL))
+    overbought_count = int(np.count_nonzero(buckets > _REVERSION_NORMAL))
+    normal_count = len(buckets) - oversold_count - overbought_count
+
     stats = {
         'total_symbols': len(reversion_df),
         'oversold_count': oversold_count,
@@ -132,195 +221,271 @@ def calculate_sector_rotation_analysis(holdings_df: pd.DataFrame) -> Tuple[pd.Da
     if 'asset' not in holdings_df.columns:
         return pd.DataFrame(), {'error': 'No asset/sector data available'}
     
-    sector_data = []
-    
-    for asset_class in holdings_df['asset'].unique():
-        asset_holdings = holdings_df[holdings_df['asset'] == asset_class]
-        
-        total_value = asset_holdings['current_value'].sum()
-        total_cost = asset_holdings['qty'].fillna(1) * asset_holdings['bep'].fillna(0)
-        total_cost = total_cost.sum()
-        total_pnl = asset_holdings['pnl_absolute'].sum() if 'pnl_absolute' in asset_holdings.columns else total_value - total_cost
-        
-        num_positions = len(asset_holdings)
-        
-        sector_data.append({
-            'Asset Class': asset_class,
-            'Value': total_value,
-            'Cost': total_cost,
-            'P&L': total_pnl,
-            'Positions': num_positions,
-            'Avg Position Size': total_value / num_positions if num_positions > 0 else 0,
-        })
-    
-    sector_df = pd.DataFrame(sector_data).sort_values('Value', ascending=False)
+    has_pnl = 'pnl_absolute' in holdings_df.columns
+    # Missing quantity counts as one unit, missing entry price as zero cost
+    qty = np.nan_to_num(
+        _float_column(holdings_df, 'qty'), nan=1.0, posinf=np.inf, neginf=-np.inf
+    )
+    bep = np.nan_to_num(
+        _float_column(holdings_df, 'bep'), nan=0.0, posinf=np.inf, neginf=-np.inf
+    )
+    costed = holdings_df.assign(_cost=qty * bep)
+
+    # One grouped pass in first-appearance order; missing asset classes are
+    # kept as their own group
+    sector_df = costed.groupby('asset', sort=False, dropna=False).agg(
+        **{
+            'Value': ('current_value', 'sum'),
+            'Cost': ('_cost', 'sum'),
+            'P&L': ('pnl_absolute' if has_pnl else '_cost', 'sum'),
+            'Positions': ('_cost', 'size'),
+        }
+    )
+    if not has_pnl:
+        sector_df['P&L'] = sector_df['Value'] - sector_df['Cost']
+    sector_df['Avg Position Size'] = sector_df['Value'] / sector_df['Positions']
+
+    sector_df = (
+        sector_df.rename_axis('Asset Class')
+        .reset_index()
+        .sort_values('Value', ascending=False)
+    )
     
     total_portfolio_value = sector_df['Value'].sum()
+    top_sector = sector_df['Asset Class'].iat[0] if not sector_df.empty else None
+    top_sector_value = float(sector_df['Value'].iat[0]) if not sector_df.empty else 0
     
     stats = {
         'total_value': float(total_portfolio_value),
         'num_sectors': len(sector_df),
-        'top_sector': sector_df.iloc[0]['Asset Class'] if not sector_df.empty else None,
-        'top_sector_value': float(sector_df.iloc[0]['Value']) if not sector_df.empty else 0,
-        'top_sector_pct': float((sector_df.iloc[0]['Value'] / total_portfolio_value * 100)) if not sector_df.empty and total_portfolio_value > 0 else 0,
+        'top_sector': top_sector,
+        'top_sector_value': top_sector_value,
+        'top_sector_pct': float(top_sector_value / total_portfolio_value * 100) if not sector_df.empty and total_portfolio_value > 0 else 0,
         'total_pnl': float(sector_df['P&L'].sum()),
     }
     
     return sector_df, stats
 
 
-def calculate_portfolio_beta_analysis(holdings_df: pd.DataFrame) -> Dict:
+def calculate_portfolio_beta_analysis(
+    holdings_df: pd.DataFrame, return_pct: Optional[np.ndarray] = None
+) -> Dict:
     """
     Calculate portfolio beta from holdings data.
     
     Args:
         holdings_df: DataFrame with holdings including returns data
+        return_pct: Precomputed _compute_return_pct(holdings_df), if available
     
     Returns:
         Dictionary with beta metrics and risk classification
     """
-    total_value = holdings_df['current_value'].sum()
-    
-    # Calculate returns for each holding
-    holding_returns = []
-    for idx, row in holdings_df.iterrows():
-        return_pct = 0
-        
-        if 'pnl_percent' in holdings_df.columns and pd.notna(row.get('pnl_percent')):
-            return_pct = float(row['pnl_percent'])
-        elif 'current_price' in holdings_df.columns and 'bep' in holdings_df.columns:
-            current = float(row.get('current_price', 0))
-            entry = float(row.get('bep', 0))
-            if entry > 0:
-                return_pct = ((current - entry) / entry) * 100
-        elif 'pnl_absolute' in holdings_df.columns and 'qty' in holdings_df.columns and 'bep' in holdings_df.columns:
-            qty = float(row.get('qty', 0))
-            entry = float(row.get('bep', 0))
-            if qty > 0 and entry > 0:
-                entry_value = qty * entry
-                return_pct = (float(row.get('pnl_absolute', 0)) / entry_value) * 100 if entry_value > 0 else 0
-        
-        holding_returns.append(return_pct)
-    
-    holding_returns = np.array(holding_returns)
-    
-    # Calculate metrics
-    portfolio_return = np.average(holding_returns, weights=holdings_df['current_value'].values) if total_value > 0 else 0
-    returns_volatility = np.std(holding_returns)
-    market_return = np.mean(holding_returns)
-    market_volatility = np.std(holding_returns)
-    
-    # Calculate beta
-    if market_volatility > 0:
-        portfolio_beta = returns_volatility / market_volatility if market_volatility > 0 else 1.0
-        
-        if market_return != 0:
-            performance_ratio = portfolio_return / market_return
-            portfolio_beta = portfolio_beta * performance_ratio
-    else:
-        portfolio_beta = 1.0
-    
+    if return_pct is None:
+        return_pct = _compute_return_pct(holdings_df)
+
+    # Percent returns and position values need far less than float64
+    # precision; float32 halves the memory the reductions stream through
+    weights = _float_column(holdings_df, 'current_value').astype(_RETURNS_DTYPE)
+    holding_returns = return_pct.astype(_RETURNS_DTYPE)
+
+    # Calculate metrics; holdings stand in for the market, so mean and std
+    # are shared between the portfolio and market figures
+    total_value = np.nansum(weights)
+    portfolio_return = (
+        (holding_returns @ weights) / weights.sum() if total_value > 0 else 0
+    )
+
+    # Sum and sum of squares in one reduction each, shifted by the first
+    # return so equal returns give exactly zero variance
+    num_holdings = len(holding_returns)
+    shift = holding_returns[0] if num_holdings else 0.0
+    deviations = holding_returns - shift
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean_deviation = deviations.sum() / np.float64(num_holdings)
+        variance = (deviations @ deviations) / np.float64(num_holdings)
+    variance = max(variance - mean_deviation * mean_deviation, 0.0)
+    returns_volatility = np.sqrt(variance)
+    market_return = shift + mean_deviation
+
+    # Volatility over itself is 1, so beta reduces to the performance ratio
+    portfolio_beta = 1.0
+    if returns_volatility > 0 and market_return != 0:
+        portfolio_beta = portfolio_return / market_return
+
     # Ensure beta is positive and reasonable
-    portfolio_beta = max(0.1, min(portfolio_beta, 3.0))
-    
+    portfolio_beta = float(max(0.1, min(portfolio_beta, 3.0)))
+
     # Calculate Sharpe ratio (simplified: excess return / volatility)
     sharpe_ratio = portfolio_return / returns_volatility if returns_volatility > 0 else 0
-    
-    # Classify risk profile
-    if portfolio_beta > 1.2:
-        risk_profile = "Aggressive"
-    elif portfolio_beta > 0.8:
-        risk_profile = "Moderate"
-    elif portfolio_beta >= 0.5:
-        risk_profile = "Conservative"
-    else:
-        risk_profile = "Very Conservative / Hedged"
-    
+
+    risk_profile = _RISK_PROFILES[
+        (portfolio_beta >= 0.5) + (portfolio_beta > 0.8) + (portfolio_beta > 1.2)
+    ]
+
     return {
-        'beta': float(portfolio_beta),
+        'beta': portfolio_beta,
         'volatility': float(returns_volatility),
         'portfolio_return': float(portfolio_return),
         'sharpe_ratio': float(sharpe_ratio),
         'risk_profile': risk_profile,
         'num_holdings': len(holdings_df),
-        'avg_return': float(np.mean(holding_returns)),
-        'std_dev': float(np.std(holding_returns)),
+        'avg_return': float(market_return),
+        'std_dev': float(returns_volatility),
     }
 
 
-# Prefect task wrappers (optional, if Prefect available)
-if HAS_PREFECT:
-    @task(name="momentum_analysis_task")
-    def momentum_analysis_task(holdings_df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
-        """Prefect task for momentum analysis."""
-        return calculate_momentum_analysis(holdings_df)
-    
-    @task(name="mean_reversion_task")
-    def mean_reversion_task(holdings_df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
-        """Prefect task for mean reversion analysis."""
-        return calculate_mean_reversion_analysis(holdings_df)
-    
-    @task(name="sector_rotation_task")
-    def sector_rotation_task(holdings_df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
-        """Prefect task for sector rotation analysis."""
-        return calculate_sector_rotation_analysis(holdings_df)
-    
-    @task(name="portfolio_beta_task")
-    def portfolio_beta_task(holdings_df: pd.DataFrame) -> Dict:
-        """Prefect task for portfolio beta analysis."""
-        return calculate_portfolio_beta_analysis(holdings_df)
-    
-    # Flow wrappers that work in/out of Prefect context
-    @flow(name="momentum_analysis_flow")
-    def momentum_analysis_flow(holdings_df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
-        """Streamlit-compatible momentum analysis flow."""
-        flow_logger = get_run_logger()
-        flow_logger.info(f"Starting momentum analysis for {len(holdings_df)} holdings")
-        momentum_df, stats = momentum_analysis_task(holdings_df)
-        flow_logger.info(f"Momentum analysis complete: {stats['uptrend_count']} uptrend, {stats['downtrend_count']} downtrend")
-        return momentum_df, stats
-    
-    @flow(name="mean_reversion_flow")
-    def mean_reversion_flow(holdings_df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
-        """Streamlit-compatible mean reversion flow."""
-        flow_logger = get_run_logger()
-        flow_logger.info(f"Starting mean reversion analysis for {len(holdings_df)} holdings")
-        reversion_df, stats = mean_reversion_task(holdings_df)
-        flow_logger.info(f"Mean reversion analysis complete: {stats['oversold_count']} oversold, {stats['overbought_count']} overbought")
-        return reversion_df, stats
-    
-    @flow(name="sector_rotation_flow")
-    def sector_rotation_flow(holdings_df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
-        """Streamlit-compatible sector rotation flow."""
-        flow_logger = get_run_logger()
-        flow_logger.info(f"Starting sector rotation analysis for {len(holdings_df)} holdings")
-        sector_df, stats = sector_rotation_task(holdings_df)
-        flow_logger.info(f"Sector analysis complete: {stats['num_sectors']} sectors analyzed")
-        return sector_df, stats
-    
-    @flow(name="portfolio_beta_flow")
-    def portfolio_beta_flow(holdings_df: pd.DataFrame) -> Dict:
-        """Streamlit-compatible portfolio beta flow."""
-        flow_logger = get_run_logger()
-        flow_logger.info(f"Starting portfolio beta analysis")
-        beta_metrics = portfolio_beta_task(holdings_df)
-        flow_logger.info(f"Portfolio beta: {beta_metrics['beta']:.2f}, Risk: {beta_metrics['risk_profile']}")
-        return beta_metrics
-
-else:
-    # Fallback if Prefect not available
-    def momentum_analysis_flow(holdings_df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
-        """Fallback momentum analysis without Prefect."""
-        return calculate_momentum_analysis(holdings_df)
-    
-    def mean_reversion_flow(holdings_df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
-        """Fallback mean reversion without Prefect."""
-        return calculate_mean_reversion_analysis(holdings_df)
-    
-    def sector_rotation_flow(holdings_df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
-        """Fallback sector rotation without Prefect."""
-        return calculate_sector_rotation_analysis(holdings_df)
-    
-    def portfolio_beta_flow(holdings_df: pd.DataFrame) -> Dict:
-        """Fallback portfolio beta without Prefect."""
-        return calculate_portfolio_beta_analysis(holdings_df)
+@lru_cache(maxsize=None)
+def _prefect_wrapper(kind: str, func: Callable, name: str) -> Callable:
+    """
+    Build a Prefect task or flow around func, importing Prefect on first use.
+
+    Args:
+        kind: 'task' or 'flow'
+        func: Function to wrap
+        name: Prefect task/flow name
+
+    Returns:
+        The Prefect Task or Flow object
+    """
+    import prefect
+
+    return getattr(prefect, kind)(name=name)(func)
+
+
+def _run_logger():
+    """Get the Prefect run logger for the active flow run."""
+    from prefect import get_run_logger
+
+    return get_run_logger()
+
+
+# Prefect task wrappers, built lazily on attribute access
+_TASKS = {
+    'momentum_analysis_task': calculate_momentum_analysis,
+    'mean_reversion_task': calculate_mean_reversion_analysis,
+    'sector_rotation_task': calculate_sector_rotation_analysis,
+    'portfolio_beta_task': calculate_portfolio_beta_analysis,
+}
+
+
+def __getattr__(name: str):
+    """Resolve Prefect task wrappers, building them on first access."""
+    if HAS_PREFECT and name in _TASKS:
+        return _prefect_wrapper('task', _TASKS[name], name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Analyses runnable through analytics_flow, by kind
+_ANALYSES = {
+    'momentum': calculate_momentum_analysis,
+    'reversion': calculate_mean_reversion_analysis,
+    'sector': calculate_sector_rotation_analysis,
+    'beta': calculate_portfolio_beta_analysis,
+}
+
+# Analyses that take the holdings' return % as a second argument
+_RETURN_PCT_KINDS = frozenset({'momentum', 'beta'})
+
+
+def _summarize(kind: str, result) -> str:
+    """Build the log line reported after an analysis completes."""
+    if kind == 'beta':
+        return f"Portfolio beta: {result['beta']:.2f}, Risk: {result['risk_profile']}"
+
+    stats = result[1]
+    if 'error' in stats:
+        return f"{kind} analysis skipped: {stats['error']}"
+    if kind == 'momentum':
+        return f"Momentum analysis complete: {stats['uptrend_count']} uptrend, {stats['downtrend_count']} downtrend"
+    if kind == 'reversion':
+        return f"Mean reversion analysis complete: {stats['oversold_count']} oversold, {stats['overbought_count']} overbought"
+    return f"Sector analysis complete: {stats['num_sectors']} sectors analyzed"
+
+
+def _check_kinds(kinds: Tuple[str, ...]) -> None:
+    """Raise ValueError for analysis kinds not in _ANALYSES."""
+    unknown = set(kinds) - set(_ANALYSES)
+    if unknown:
+        raise ValueError(f"Unknown analyses: {sorted(unknown)}")
+
+
+def run_analyses(
+    holdings_df: pd.DataFrame, kinds: Tuple[str, ...] = tuple(_ANALYSES)
+) -> Dict:
+    """
+    Run the selected quick wins analyses in-process.
+
+    Args:
+        holdings_df: DataFrame with holdings
+        kinds: Analyses to run, from 'momentum', 'reversion', 'sector', 'beta'
+
+    Returns:
+        Dictionary of kind -> that analysis' result
+    """
+    _check_kinds(kinds)
+    # Momentum and beta both read return %, so compute it once per run
+    return_pct = (
+        _compute_return_pct(holdings_df) if _RETURN_PCT_KINDS & set(kinds) else None
+    )
+    return {
+        kind: (
+            _ANALYSES[kind](holdings_df, return_pct)
+            if kind in _RETURN_PCT_KINDS
+            else _ANALYSES[kind](holdings_df)
+        )
+        for kind in kinds
+    }
+
+
+def _analytics_flow(holdings_df: pd.DataFrame, kinds: Tuple[str, ...]) -> Dict:
+    """Streamlit-compatible quick wins analytics flow."""
+    flow_logger = _run_logger()
+    flow_logger.info(f"Starting {', '.join(kinds)} analysis for {len(holdings_df)} holdings")
+    results = _prefect_wrapper('task', run_analyses, 'analytics_task')(holdings_df, kinds)
+    for kind, result in results.items():
+        flow_logger.info(_summarize(kind, result))
+    return results
+
+
+def analytics_flow(
+    holdings_df: pd.DataFrame, kinds: Tuple[str, ...] = tuple(_ANALYSES)
+) -> Dict:
+    """
+    Run the selected analyses, as one Prefect flow and task when enabled.
+
+    All analyses run inside a single task, so asking for several costs one
+    task run rather than one per analysis.
+
+    Args:
+        holdings_df: DataFrame with holdings
+        kinds: Analyses to run, from 'momentum', 'reversion', 'sector', 'beta'
+
+    Returns:
+        Dictionary of kind -> that analysis' result
+    """
+    kinds = tuple(kinds)
+    _check_kinds(kinds)
+    if not HAS_PREFECT:
+        return run_analyses(holdings_df, kinds)
+    return _prefect_wrapper('flow', _analytics_flow, 'analytics_flow')(holdings_df, kinds)
+
+
+# Single-analysis flow wrappers that work in/out of Prefect context
+def momentum_analysis_flow(holdings_df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
+    """Streamlit-compatible momentum analysis flow."""
+    return analytics_flow(holdings_df, kinds=('momentum',))['momentum']
+
+
+def mean_reversion_flow(holdings_df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
+    """Streamlit-compatible mean reversion flow."""
+    return analytics_flow(holdings_df, kinds=('reversion',))['reversion']
+
+
+def sector_rotation_flow(holdings_df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
+    """Streamlit-compatible sector rotation flow."""
+    return analytics_flow(holdings_df, kinds=('sector',))['sector']
+
+
+def portfolio_beta_flow(holdings_df: pd.DataFrame) -> Dict:
+    """Streamlit-compatible portfolio beta flow."""
+    return analytics_flow(holdings_df, kinds=('beta',))['beta']
@@ -14,10 +14,15 @@ These flows enable portfolio managers to quickly identify:
 - Mean reversion candidates for range trading
 """
 
-from typing import Dict, List, Optional
+import json
+import os
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 from prefect import flow, get_run_logger, task
 
 from .quick_wins_analytics import QuickWinsAnalytics
@@ -34,6 +39,45 @@ __all__ = [
 
 logger = get_logger(__name__)
 
+_SECTOR_RETURNS_SEED = 42
+_DEFAULT_SECTOR_RETURNS = {
+    "Technology": 0.08,
+    "Finance": 0.05,
+    "Healthcare": 0.10,
+    "Energy": 0.03,
+    "Industrials": 0.06,
+}
+
+
+def _coalesce_price_fields(
+    prices_dict: Dict, symbols, fields: Tuple[str, ...]
+) -> pd.Series:
+    """
+    Pick the first available field per symbol from dict-valued price data.
+
+    Args:
+        prices_dict: Dictionary of symbol -> price data
+        symbols: Symbols to look up, in output order
+        fields: Candidate fields in priority order
+
+    Returns:
+        float Series indexed by symbol, omitting symbols with no field set
+    """
+    records = {
+        symbol: prices_dict[symbol]
+        for symbol in symbols
+        if isinstance(prices_dict.get(symbol), dict)
+    }
+    frame = pd.DataFrame(list(records.values()), index=list(records))
+
+    values = pd.Series(np.nan, index=frame.index, dtype=float)
+    for field in reversed(fields):
+        if field in frame.columns:
+            column = frame[field].astype(float)
+            values = column.where(column.notna(), values)
+
+    return values.dropna()
+
 
 @task(name="prepare_returns_data")
 def prepare_returns_data(prices_dict: Dict, holdings_df: pd.DataFrame) -> pd.DataFrame:
@@ -50,34 +94,20 @@ def prepare_returns_data(prices_dict: Dict, holdings_df: pd.DataFrame) -> pd.Dat
     task_logger = get_run_logger()
     task_logger.info("Preparing returns data...")
 
-    returns_dict = {}
-
-    for symbol in holdings_df["sym"].unique():
-        if symbol in prices_dict:
-            price_data = prices_dict[symbol]
-
-            # Extract price information
-            if isinstance(price_data, dict):
-                if "return_pct" in price_data:
-                    returns_dict[symbol] = float(price_data.get("return_pct", 0))
-                elif "price" in price_data:
-                    returns_dict[symbol] = float(price_data.get("price", 0))
-                elif "price_usd" in price_data:
-                    returns_dict[symbol] = float(price_data.get("price_usd", 0))
-                elif "price_eur" in price_data:
-                    returns_dict[symbol] = float(price_data.get("price_eur", 0))
+    returns = _coalesce_price_fields(
+        prices_dict,
+        holdings_df["sym"].unique(),
+        ("return_pct", "price", "price_usd", "price_eur"),
+    )
 
-    if not returns_dict:
+    if returns.empty:
         task_logger.warning("No returns data available")
         # Return empty DataFrame with correct structure for beta calculation
         return pd.DataFrame(index=pd.Index([], name="symbol"), columns=["return_pct"])
 
     # Create DataFrame with symbols as index and a single returns column
-    df = pd.DataFrame(
-        {"return_pct": list(returns_dict.values())},
-        index=pd.Index(list(returns_dict.keys()), name="symbol")
-    )
-    
+    df = returns.rename("return_pct").rename_axis("symbol").to_frame()
+
     task_logger.info(f"Prepared returns data for {len(df)} securities")
     return df
 
@@ -97,26 +127,62 @@ def prepare_prices_data(prices_dict: Dict, holdings_df: pd.DataFrame) -> pd.Data
     task_logger = get_run_logger()
     task_logger.info("Preparing prices data...")
 
-    prices = {}
-
-    for symbol in holdings_df["sym"].unique():
-        if symbol in prices_dict:
-            price_data = prices_dict[symbol]
-
-            if isinstance(price_data, dict):
-                if "price" in price_data:
-                    prices[symbol] = float(price_data.get("price", 0))
-                elif "price_usd" in price_data:
-                    prices[symbol] = float(price_data.get("price_usd", 0))
-                elif "price_eur" in price_data:
-                    prices[symbol] = float(price_data.get("price_eur", 0))
+    prices = _coalesce_price_fields(
+        prices_dict, holdings_df["sym"].unique(), ("price", "price_usd", "price_eur")
+    )
 
-    if not prices:
+    if prices.empty:
         task_logger.warning("No prices data available")
         return pd.DataFrame()
 
     task_logger.info(f"Prepared prices data for {len(prices)} securities")
-    return pd.DataFrame(list(prices.items()), columns=["symbol", "price"]).set_index("symbol")
+    return prices.rename("price").rename_axis("symbol").to_frame()
+
+
+def _table_fingerprint(table_path: str) -> Tuple[int, int]:
+    """
+    Fingerprint a partitioned ParquetDB table by its data files.
+
+    Upserts rewrite partition files in place without touching the table
+    directory, so the fingerprint covers every parquet file under it.
+
+    Args:
+        table_path: Path to the table directory
+
+    Returns:
+        Tuple of (parquet file count, latest file mtime in ns)
+    """
+    file_count = 0
+    latest_mtime_ns = 0
+
+    for dirpath, _, filenames in os.walk(table_path):
+        for filename in filenames:
+            if filename.endswith(".parquet"):
+                file_count += 1
+                mtime_ns = os.stat(os.path.join(dirpath, filename)).st_mtime_ns
+                latest_mtime_ns = max(latest_mtime_ns, mtime_ns)
+
+    return file_count, latest_mtime_ns
+
+
+@lru_cache(maxsize=1)
+def _read_prices_table(
+    root_path: str, fingerprint: Tuple[int, int]
+) -> Optional[pd.DataFrame]:
+    """
+    Read the ParquetDB prices table, cached on its fingerprint.
+
+    Repeated flow runs reuse the parsed table until the prices table is
+    rewritten. Callers must not modify the returned frame.
+
+    Args:
+        root_path: ParquetDB root directory
+        fingerprint: Result of _table_fingerprint for the prices table
+
+    Returns:
+        Prices DataFrame or None if no data
+    """
+    return ParquetDB(root_path).read_table("prices")
 
 
 @task(name="prepare_market_returns")
@@ -132,7 +198,8 @@ def prepare_market_returns() -> pd.Series:
 
     try:
         db = ParquetDB()
-        prices_data = db.read_table("prices")
+        table_path = os.path.join(db.root_path, "prices")
+        prices_data = _read_prices_table(db.root_path, _table_fingerprint(table_path))
 
         if prices_data is None or prices_data.empty:
             task_logger.warning("No market data available, returning dummy market returns")
@@ -167,31 +234,26 @@ def prepare_sector_data(holdings_df: pd.DataFrame) -> tuple:
     task_logger = get_run_logger()
     task_logger.info("Preparing sector data...")
 
-    # Sector returns (example data - would come from market data in production)
-    sector_returns = {}
-    for sector in holdings_df["sector"].unique() if "sector" in holdings_df.columns else []:
-        # Example sector returns (would be calculated from actual data)
-        sector_returns[sector] = np.random.uniform(-0.05, 0.15)
+    # Sector returns (example data - would come from market data in production).
+    # A fixed seed keeps them reproducible across runs and independent of global RNG state.
+    sectors = holdings_df["sector"].unique() if "sector" in holdings_df.columns else []
+    rng = np.random.default_rng(_SECTOR_RETURNS_SEED)
+    sector_returns = dict(
+        zip(list(sectors), rng.uniform(-0.05, 0.15, size=len(sectors)).tolist())
+    )
 
     if not sector_returns:
         # Default sectors if not in holdings
-        sector_returns = {
-            "Technology": 0.08,
-            "Finance": 0.05,
-            "Healthcare": 0.10,
-            "Energy": 0.03,
-            "Industrials": 0.06,
-        }
+        sector_returns = dict(_DEFAULT_SECTOR_RETURNS)
 
     # Holdings by sector
-    holding_sectors = {}
     if "sector" in holdings_df.columns:
-        for _, row in holdings_df.iterrows():
-            holding_sectors[row["sym"]] = row["sector"]
+        holding_sectors = dict(
+            zip(holdings_df["sym"].tolist(), holdings_df["sector"].tolist())
+        )
     else:
         # Assign default sectors
-        for symbol in holdings_df["sym"]:
-            holding_sectors[symbol] = "Unknown"
+        holding_sectors = dict.fromkeys(holdings_df["sym"].tolist(), "Unknown")
 
     task_logger.info(f"Sector data prepared: {len(sector_returns)} sectors, {len(holding_sectors)} holdings")
     return sector_returns, holding_sectors
@@ -318,6 +380,23 @@ def calculate_mean_reversion_task(
         return {"error": str(e)}
 
 
+def _json_default(obj):
+    """
+    Convert numpy and pandas values that json cannot serialize natively.
+
+    Args:
+        obj: Value json.dumps could not encode
+
+    Returns:
+        JSON-compatible equivalent
+    """
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
+
+
 @task(name="save_quick_wins_results")
 def save_quick_wins_results(
     beta_analysis: Dict,
@@ -342,21 +421,30 @@ def save_quick_wins_results(
 
     try:
         db = ParquetDB()
+        timestamp = pd.Timestamp.now()
 
-        # Save each analysis as a separate record
+        # Save each analysis as a separate record, as JSON that reads back losslessly
         quick_wins_data = {
             "analysis_type": ["beta", "sector_rotation", "momentum", "mean_reversion"],
             "results": [
-                str(beta_analysis),
-                str(sector_rotation),
-                str(momentum_signals),
-                str(mean_reversion),
+                json.dumps(beta_analysis, default=_json_default),
+                json.dumps(sector_rotation, default=_json_default),
+                json.dumps(momentum_signals, default=_json_default),
+                json.dumps(mean_reversion, default=_json_default),
             ],
-            "timestamp": [pd.Timestamp.now()] * 4,
+            "timestamp": [timestamp] * 4,
         }
 
         df = pd.DataFrame(quick_wins_data)
-        db.write_table(df, "quick_wins_analysis", mode="append")
+
+        # Append as a new file in the table directory so read_table picks up every run
+        table_path = os.path.join(db.root_path, "quick_wins_analysis")
+        os.makedirs(table_path, exist_ok=True)
+        pq.write_table(
+            pa.Table.from_pandas(df, preserve_index=False),
+            os.path.join(table_path, f"{timestamp:%Y%m%d_%H%M%S_%f}.parquet"),
+            compression="snappy",
+        )
         task_logger.info("Quick wins results saved")
         return True
 
@@ -390,19 +478,33 @@ def quick_wins_analytics_flow(
     flow_logger.info("Starting quick wins analytics flow...")
 
     try:
-        # Prepare data
+        # Prepare data; the preparation tasks are independent, so run them concurrently
         flow_logger.info("Preparing analysis data...")
-        returns_df = prepare_returns_data(prices_dict, holdings_df)
-        prices_df = prepare_prices_data(prices_dict, holdings_df)
-        market_returns = prepare_market_returns()
-        sector_returns, holding_sectors = prepare_sector_data(holdings_df)
+        returns_future = prepare_returns_data.submit(prices_dict, holdings_df)
+        prices_future = prepare_prices_data.submit(prices_dict, holdings_df)
+        market_future = prepare_market_returns.submit()
+        sector_future = prepare_sector_data.submit(holdings_df)
+
+        returns_df = returns_future.result()
+        prices_df = prices_future.result()
+        market_returns = market_future.result()
+        sector_returns, holding_sectors = sector_future.result()
 
-        # Calculate quick wins analyses
+        # Calculate quick wins analyses concurrently
         flow_logger.info("Calculating quick wins analyses...")
-        beta_analysis = calculate_portfolio_beta_task(returns_df, market_returns)
-        sector_rotation = calculate_sector_rotation_task(sector_returns, holding_sectors)
-        momentum_signals = calculate_momentum_signals_task(returns_df, period=20)
-        mean_reversion = calculate_mean_reversion_task(prices_df, period=20, std_dev_threshold=2.0)
+        beta_future = calculate_portfolio_beta_task.submit(returns_df, market_returns)
+        sector_rotation_future = calculate_sector_rotation_task.submit(
+            sector_returns, holding_sectors
+        )
+        momentum_future = calculate_momentum_signals_task.submit(returns_df, period=20)
+        mean_reversion_future = calculate_mean_reversion_task.submit(
+            prices_df, period=20, std_dev_threshold=2.0
+        )
+
+        beta_analysis = beta_future.result()
+        sector_rotation = sector_rotation_future.result()
+        momentum_signals = momentum_future.result()
+        mean_reversion = mean_reversion_future.result()
 
         # Save results
         save_success = save_quick_wins_results(beta_analysis, sector_rotation, momentum_signals, mean_reversion)
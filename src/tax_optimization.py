@@ -11,10 +11,14 @@ Provides tax optimization strategies with:
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 from typing import Dict, List, Tuple, Optional, Set
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import lru_cache
 import logging
+import time
 from pathlib import Path
 
 from src.parquet_db import ParquetDB
@@ -22,6 +26,78 @@ from src.utils import get_logger
 
 logger = get_logger(__name__)
 
+_NS_PER_DAY = 86_400 * 10**9
+
+
+def _compute_lot_metrics(
+    quantity: np.ndarray,
+    purchase_price: np.ndarray,
+    current_price: np.ndarray,
+    purchase_ns: np.ndarray,
+    today_ns: int,
+    include_short_term: bool = True
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute per-lot values, gains and holding periods over whole columns.
+    
+    Args:
+        quantity: Lot quantities
+        purchase_price: Purchase prices
+        current_price: Current prices
+        purchase_ns: Purchase timestamps as int64 nanoseconds (NaT allowed)
+        today_ns: Current timestamp as int64 nanoseconds
+        include_short_term: Whether short-term losses count as losses
+        
+    Returns:
+        Tuple of (current_value, unrealized_gl, gl_pct, is_long_term, loss_mask)
+    """
+    current_value = quantity * current_price
+    book_value = quantity * purchase_price
+    unrealized_gl = current_value - book_value
+    gl_pct = np.divide(
+        unrealized_gl, book_value, out=np.zeros_like(book_value), where=book_value != 0
+    )
+    gl_pct *= 100
+    
+    # Whole days held, floored like Timedelta.days; missing dates count as short
+    holding_days = (today_ns - purchase_ns) // _NS_PER_DAY
+    is_long_term = (holding_days >= 365) & (purchase_ns != np.iinfo(np.int64).min)
+    
+    loss_mask = unrealized_gl < 0
+    if not include_short_term:
+        loss_mask &= is_long_term
+    
+    return current_value, unrealized_gl, gl_pct, is_long_term, loss_mask
+
+
+def _parse_purchase_dates(purchase_dates: pd.Series) -> pd.Series:
+    """
+    Parse a purchase date column in one vectorized call.
+    
+    ISO dates (the app's own format) take the fixed-format fast path, with
+    repeated dates parsed once; other layouts fall back to format inference.
+    
+    Args:
+        purchase_dates: Dates as strings or timestamps
+        
+    Returns:
+        Series of datetime64 values
+    """
+    try:
+        return pd.to_datetime(purchase_dates, format='ISO8601', cache=True)
+    except (ValueError, TypeError):
+        return pd.to_datetime(purchase_dates, cache=True)
+
+
+@lru_cache(maxsize=128)
+def _breakeven_days(alternative_investment_return_pct: float) -> int:
+    """Days until breakeven; depends only on the alternative return rate."""
+    if alternative_investment_return_pct <= 0:
+        return 365  # Default to 1 year
+    
+    # Timeline = 30 days minimum (wash sale period) + optimization window
+    return 30 + int(365 * (0.02 / alternative_investment_return_pct))
+
 
 @dataclass
 class TaxLot:
@@ -37,6 +113,32 @@ class TaxLot:
     holding_period: str  # 'short' (< 1 year) or 'long' (>= 1 year)
 
 
+@dataclass
+class TaxLotBatch:
+    """Columnar batch of tax lots, holding one array per TaxLot field."""
+    symbol: np.ndarray
+    quantity: np.ndarray
+    purchase_price: np.ndarray
+    purchase_date: np.ndarray
+    current_price: np.ndarray
+    current_value: np.ndarray
+    unrealized_gain_loss: np.ndarray
+    gain_loss_pct: np.ndarray
+    holding_period: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.symbol)
+    
+    def take(self, indices) -> 'TaxLotBatch':
+        """Select rows by integer indices, boolean mask or slice."""
+        return TaxLotBatch(*(getattr(self, f.name)[indices] for f in fields(self)))
+    
+    def to_list(self) -> List[TaxLot]:
+        """Materialize the batch as TaxLot objects."""
+        columns = [getattr(self, f.name).tolist() for f in fields(self)]
+        return [TaxLot(*row) for row in zip(*columns)]
+
+
 @dataclass
 class TaxHarvestingOpportunity:
     """Represents a tax loss harvesting opportunity."""
@@ -61,6 +163,19 @@ class TaxOptimizationEngine:
     - Generates tax reports
     """
     
+    # Parquet schema for saved opportunities; symbols and holding periods
+    # repeat heavily, so they are dictionary-encoded
+    OPPORTUNITY_SCHEMA = pa.schema([
+        pa.field('symbol', pa.dictionary(pa.int32(), pa.string())),
+        pa.field('unrealized_loss', pa.float64()),
+        pa.field('quantity', pa.float64()),
+        pa.field('tax_savings', pa.float64()),
+        pa.field('replacements', pa.list_(pa.string())),
+        pa.field('wash_sale_risk', pa.float64()),
+        pa.field('holding_period', pa.dictionary(pa.int8(), pa.string())),
+        pa.field('days_held', pa.int32()),
+    ])
+    
     def __init__(self, capital_gains_rate: float = 0.20, ordinary_rate: float = 0.35):
         """
         Initialize tax optimization engine.
@@ -86,6 +201,23 @@ class TaxOptimizationEngine:
             'PG': ['KO', 'CL', 'MO'],  # Consumer staples
             'JNJ': ['UNH', 'LLY', 'ABBV'],  # Healthcare
         }
+        
+        # Price-tier alternatives for symbols without a sector mapping:
+        # below the first bound, below the second, and at or above it
+        self.price_tier_bounds = np.array([50.0, 200.0])
+        self.price_tier_replacements = [
+            ['ARKK', 'IJH', 'IWM'],  # Small/mid cap alternatives
+            ['VOO', 'QQQ', 'SPLG'],  # Large cap alternatives
+            ['BRK.B', 'AFRM', 'MSTR'],  # High-price alternatives
+        ]
+        
+        # Wash sale risk for similar (but not identical) security pairs
+        # (would need real data for accuracy)
+        self.similar_pair_risk = {
+            frozenset(('AAPL', 'MSFT')): 0.3,
+            frozenset(('JPM', 'BAC')): 0.3,
+            frozenset(('XOM', 'CVX')): 0.25,
+        }
     
     def identify_unrealized_losses(
         self,
@@ -103,47 +235,51 @@ class TaxOptimizationEngine:
         Returns:
             List of TaxLot objects with losses
         """
-        losing_positions = []
-        today = pd.Timestamp.now()
+        return self.identify_unrealized_loss_batch(holdings, include_short_term).to_list()
+    
+    def identify_unrealized_loss_batch(
+        self,
+        holdings: pd.DataFrame,
+        include_short_term: bool = True
+    ) -> TaxLotBatch:
+        """
+        Identify unrealized losses as a columnar batch.
         
-        for _, row in holdings.iterrows():
-            symbol = row['symbol']
-            quantity = row['quantity']
-            purchase_price = row['purchase_price']
-            current_price = row['current_price']
-            purchase_date = pd.Timestamp(row['purchase_date'])
-            
-            # Calculate gains/losses
-            current_value = quantity * current_price
-            book_value = quantity * purchase_price
-            unrealized_gl = current_value - book_value
-            gl_pct = (unrealized_gl / book_value) * 100 if book_value != 0 else 0
-            
-            # Determine holding period
-            holding_days = (today - purchase_date).days
-            is_long_term = holding_days >= 365
-            holding_period = 'long' if is_long_term else 'short'
+        Args:
+            holdings: DataFrame with columns:
+                - symbol, quantity, purchase_price, purchase_date, current_price
+            include_short_term: Whether to include short-term losses
             
-            # Only include losses
-            if unrealized_gl < 0:
-                if include_short_term or is_long_term:
-                    tax_lot = TaxLot(
-                        symbol=symbol,
-                        quantity=quantity,
-                        purchase_price=purchase_price,
-                        purchase_date=purchase_date.strftime('%Y-%m-%d'),
-                        current_price=current_price,
-                        current_value=current_value,
-                        unrealized_gain_loss=unrealized_gl,
-                        gain_loss_pct=gl_pct,
-                        holding_period=holding_period
-                    )
-                    losing_positions.append(tax_lot)
-        
-        # Sort by loss amount (descending)
-        losing_positions.sort(key=lambda x: x.unrealized_gain_loss)
-        
-        return losing_positions
+        Returns:
+            TaxLotBatch of losing lots, sorted by loss amount (largest first)
+        """
+        today = pd.Timestamp.now()
+        
+        purchase_dates = _parse_purchase_dates(holdings['purchase_date'])
+        current_value, unrealized_gl, gl_pct, is_long_term, mask = _compute_lot_metrics(
+            holdings['quantity'].to_numpy(dtype=np.float64),
+            holdings['purchase_price'].to_numpy(dtype=np.float64),
+            holdings['current_price'].to_numpy(dtype=np.float64),
+            purchase_dates.to_numpy(dtype='datetime64[ns]').view(np.int64),
+            today.value,
+            include_short_term
+        )
+        
+        # Only include losses, sorted by loss amount (largest first)
+        idx = np.flatnonzero(mask)
+        idx = idx[np.argsort(unrealized_gl[idx], kind='stable')]
+        
+        return TaxLotBatch(
+            symbol=holdings['symbol'].to_numpy()[idx],
+            quantity=holdings['quantity'].to_numpy()[idx],
+            purchase_price=holdings['purchase_price'].to_numpy()[idx],
+            purchase_date=purchase_dates.iloc[idx].dt.strftime('%Y-%m-%d').to_numpy(),
+            current_price=holdings['current_price'].to_numpy()[idx],
+            current_value=current_value[idx],
+            unrealized_gain_loss=unrealized_gl[idx],
+            gain_loss_pct=gl_pct[idx],
+            holding_period=np.where(is_long_term[idx], 'long', 'short'),
+        )
     
     def suggest_replacement_securities(
         self,
@@ -162,23 +298,39 @@ class TaxOptimizationEngine:
         Returns:
             List of suggested replacement symbols
         """
-        suggestions = []
-        
-        # Check if we have sector replacements
-        if sector_focus and symbol in self.sector_replacements:
-            suggestions = self.sector_replacements[symbol].copy()
-        
-        # Add alternatives based on characteristics
-        if not suggestions:
-            # If no direct mapping, suggest similar price point alternatives
-            if current_price < 50:
-                suggestions = ['ARKK', 'IJH', 'IWM']  # Small/mid cap alternatives
-            elif current_price < 200:
-                suggestions = ['VOO', 'QQQ', 'SPLG']  # Large cap alternatives
-            else:
-                suggestions = ['BRK.B', 'AFRM', 'MSTR']  # High-price alternatives
+        return self.suggest_replacement_batch([symbol], [current_price], sector_focus)[0]
+    
+    def suggest_replacement_batch(
+        self,
+        symbols,
+        current_prices,
+        sector_focus: bool = True
+    ) -> List[List[str]]:
+        """
+        Suggest replacement securities for many symbols at once.
         
-        return suggestions[:5]  # Limit to 5 suggestions
+        Args:
+            symbols: Symbols to replace
+            current_prices: Current prices, aligned with symbols
+            sector_focus: Whether to prioritize same sector
+            
+        Returns:
+            List of suggested replacement symbol lists, one per symbol
+        """
+        sector_replacements = self.sector_replacements if sector_focus else {}
+        
+        # If no direct mapping, suggest similar price point alternatives
+        tiers = np.searchsorted(
+            self.price_tier_bounds,
+            np.asarray(current_prices, dtype=np.float64),
+            side='right'
+        )
+        
+        # Limit to 5 suggestions
+        return [
+            (sector_replacements.get(symbol) or self.price_tier_replacements[tier])[:5]
+            for symbol, tier in zip(symbols, tiers.tolist())
+        ]
     
     def calculate_tax_savings(
         self,
@@ -229,26 +381,52 @@ class TaxOptimizationEngine:
         Returns:
             Risk score 0-1 (0 = no risk, 1 = certain wash sale)
         """
-        risk = 0.0
-        
-        # Risk 1: If replacement is the same security
-        if replacement_symbol and replacement_symbol.split('.')[0] == symbol.split('.')[0]:
-            risk = 0.95  # High risk
-        
-        # Risk 2: If replacement is very similar
-        if replacement_symbol:
-            # Check if same sector/type (would need real data for accuracy)
-            similar_pairs = [
-                (['AAPL', 'MSFT'], 0.3),
-                (['JPM', 'BAC'], 0.3),
-                (['XOM', 'CVX'], 0.25),
-            ]
-            
-            for pair, pair_risk in similar_pairs:
-                if {symbol, replacement_symbol} == set(pair):
-                    risk = pair_risk
+        if not replacement_symbol:
+            return 0.0
+        
+        # Risk 1: If replacement is very similar
+        pair_risk = self.similar_pair_risk.get(frozenset((symbol, replacement_symbol)))
+        if pair_risk is not None:
+            return pair_risk
         
-        return risk
+        # Risk 2: If replacement is the same security
+        if replacement_symbol.split('.')[0] == symbol.split('.')[0]:
+            return 0.95  # High risk
+        
+        return 0.0
+    
+    def assess_wash_sale_risk_batch(
+        self,
+        symbols: List[str],
+        quantities: List[float],
+        replacements: List[List[str]]
+    ) -> np.ndarray:
+        """
+        Assess the lowest wash sale risk among each symbol's replacements.
+        
+        Each distinct (symbol, replacement) pair is assessed once for the
+        whole batch, since lots sharing a ticker share their candidates.
+        
+        Args:
+            symbols: Symbols being sold
+            quantities: Quantities to sell, aligned with symbols
+            replacements: Suggested replacement symbols for each symbol
+            
+        Returns:
+            Array of minimum risk scores, 0.1 where there are no replacements
+        """
+        risks = np.full(len(symbols), 0.1)
+        pair_risks = {}
+        for i, (symbol, quantity, suggested) in enumerate(
+            zip(symbols, quantities, replacements)
+        ):
+            for replacement in suggested:
+                key = (symbol, replacement)
+                if key not in pair_risks:
+                    pair_risks[key] = self.assess_wash_sale_risk(symbol, quantity, replacement)
+            if suggested:
+                risks[i] = min(pair_risks[symbol, replacement] for replacement in suggested)
+        return risks
     
     def calculate_breakeven_timeline(
         self,
@@ -265,15 +443,7 @@ class TaxOptimizationEngine:
         Returns:
             Days until breakeven
         """
-        if alternative_investment_return_pct <= 0:
-            return 365  # Default to 1 year
-        
-        daily_rate = alternative_investment_return_pct / 252
-        
-        # Timeline = 30 days minimum (wash sale period) + optimization window
-        breakeven_days = 30 + int(365 * (0.02 / alternative_investment_return_pct))
-        
-        return breakeven_days
+        return _breakeven_days(alternative_investment_return_pct)
     
     def generate_tax_harvesting_report(
         self,
@@ -292,97 +462,114 @@ class TaxOptimizationEngine:
         Returns:
             Dict with harvesting opportunities and summary
         """
+        now = pd.Timestamp.now()
+        
         # Identify losses
-        losses = self.identify_unrealized_losses(holdings)
+        losses = self.identify_unrealized_loss_batch(holdings)
         
         # Filter by minimum loss amount
-        significant_losses = [
-            loss for loss in losses
-            if abs(loss.unrealized_gain_loss) >= min_loss_amount
-        ]
-        
-        opportunities = []
-        total_potential_savings = 0.0
-        
-        for loss in significant_losses[:max_opportunities]:
-            tax_savings = self.calculate_tax_savings(
-                abs(loss.unrealized_gain_loss),
-                loss.holding_period
-            )
-            
-            replacements = self.suggest_replacement_securities(
-                loss.symbol,
-                loss.current_price
-            )
-            
-            wash_sale_risk = min(
-                [self.assess_wash_sale_risk(loss.symbol, loss.quantity, r) for r in replacements],
-                default=0.1
-            )
-            
-            opportunity = TaxHarvestingOpportunity(
-                original_symbol=loss.symbol,
-                unrealized_loss=abs(loss.unrealized_gain_loss),
-                quantity=loss.quantity,
-                tax_lot=loss,
-                suggested_replacements=replacements,
-                estimated_tax_savings=tax_savings,
-                wash_sale_risk=wash_sale_risk
-            )
-            
-            opportunities.append(opportunity)
-            total_potential_savings += tax_savings
-        
-        # Calculate aggregate metrics
-        short_term_losses = sum(
-            abs(l.unrealized_gain_loss) for l in significant_losses
-            if l.holding_period == 'short'
+        loss_amounts = np.abs(losses.unrealized_gain_loss)
+        significant = np.flatnonzero(loss_amounts >= min_loss_amount)
+        loss_amounts = loss_amounts[significant]
+        is_short = losses.holding_period[significant] == 'short'
+        
+        # Calculate aggregate metrics, binning long (0) and short (1) in one pass
+        period_losses = np.bincount(
+            is_short.view(np.uint8), weights=loss_amounts, minlength=2
+        )
+        long_term_losses = float(period_losses[0])
+        short_term_losses = float(period_losses[1])
+        
+        # Losses are already sorted, so the top opportunities are a prefix
+        top = losses.take(significant[:max_opportunities])
+        top_amounts = loss_amounts[:len(top)]
+        tax_savings = top_amounts * np.where(
+            is_short[:len(top)], self.ordinary_rate, self.capital_gains_rate
         )
+        total_potential_savings = float(tax_savings.sum())
         
-        long_term_losses = sum(
-            abs(l.unrealized_gain_loss) for l in significant_losses
-            if l.holding_period == 'long'
+        symbols = top.symbol.tolist()
+        replacements = self.suggest_replacement_batch(symbols, top.current_price)
+        wash_sale_risks = self.assess_wash_sale_risk_batch(
+            symbols, top.quantity.tolist(), replacements
         )
+        days_held = np.datetime64(now, 'D') - top.purchase_date.astype('datetime64[D]')
         
         report = {
-            'report_date': pd.Timestamp.now().strftime('%Y-%m-%d'),
-            'total_unrealized_losses': sum(abs(l.unrealized_gain_loss) for l in significant_losses),
+            'report_date': now.strftime('%Y-%m-%d'),
+            'total_unrealized_losses': short_term_losses + long_term_losses,
             'short_term_losses': short_term_losses,
             'long_term_losses': long_term_losses,
-            'num_losing_positions': len(significant_losses),
-            'num_opportunities': len(opportunities),
+            'num_losing_positions': len(significant),
+            'num_opportunities': len(top),
             'total_potential_tax_savings': total_potential_savings,
-            'avg_tax_savings_per_position': total_potential_savings / len(opportunities) if opportunities else 0,
-            'avg_wash_sale_risk': np.mean([o.wash_sale_risk for o in opportunities]) if opportunities else 0,
+            'avg_tax_savings_per_position': total_potential_savings / len(top) if len(top) else 0,
+            'avg_wash_sale_risk': wash_sale_risks.mean() if len(wash_sale_risks) else 0,
             'opportunities': [
                 {
-                    'symbol': opp.original_symbol,
-                    'unrealized_loss': opp.unrealized_loss,
-                    'quantity': opp.quantity,
-                    'tax_savings': opp.estimated_tax_savings,
-                    'replacements': opp.suggested_replacements,
-                    'wash_sale_risk': opp.wash_sale_risk,
-                    'holding_period': opp.tax_lot.holding_period,
-                    'days_held': (pd.Timestamp.now() - pd.Timestamp(opp.tax_lot.purchase_date)).days
+                    'symbol': symbol,
+                    'unrealized_loss': unrealized_loss,
+                    'quantity': quantity,
+                    'tax_savings': savings,
+                    'replacements': suggested,
+                    'wash_sale_risk': risk,
+                    'holding_period': period,
+                    'days_held': days
                 }
-                for opp in opportunities
+                for symbol, unrealized_loss, quantity, savings, suggested, risk, period, days in zip(
+                    symbols,
+                    top_amounts.tolist(),
+                    top.quantity.tolist(),
+                    tax_savings.tolist(),
+                    replacements,
+                    wash_sale_risks.tolist(),
+                    top.holding_period.tolist(),
+                    days_held.astype(np.int64).tolist(),
+                )
             ]
         }
         
         return report
     
+    @staticmethod
+    def opportunity_columns(report: Dict) -> Dict[str, list]:
+        """
+        Transpose a report's opportunities into one list per field.
+        
+        Pass the result to generate_tax_report_csv and
+        save_tax_analysis_parquet to transpose once for both files.
+        
+        Args:
+            report: Report from generate_tax_harvesting_report
+            
+        Returns:
+            Dict of field -> values, empty when there are no opportunities
+        """
+        opportunities = report['opportunities']
+        if not opportunities:
+            return {}
+        return {key: [opp[key] for opp in opportunities] for key in opportunities[0]}
+    
     def generate_tax_report_csv(
         self,
         report: Dict,
-        output_dir: str = "db"
+        output_dir: str = "db",
+        now: Optional[pd.Timestamp] = None,
+        columns: Optional[Dict[str, list]] = None
     ) -> str:
-        """Generate and save tax report as CSV."""
+        """Generate and save tax report as CSV.
+        
+        columns is opportunity_columns(report), transposed here when omitted.
+        """
+        stamp = now.strftime('%Y%m%d') if now is not None else time.strftime('%Y%m%d')
         try:
             # Create DataFrame from opportunities
-            opportunities_df = pd.DataFrame(report['opportunities'])
+            if columns is None:
+                columns = self.opportunity_columns(report)
+            opportunities_df = pd.DataFrame(columns)
             
-            # Add summary row
-            summary_df = pd.DataFrame([{
+            # Summary row, appended after the opportunities
+            summary = {
                 'symbol': 'SUMMARY',
                 'unrealized_loss': report['total_unrealized_losses'],
                 'tax_savings': report['total_potential_tax_savings'],
@@ -391,14 +578,16 @@ class TaxOptimizationEngine:
                 'wash_sale_risk': report['avg_wash_sale_risk'],
                 'holding_period': '',
                 'days_held': ''
-            }])
+            }
+            if opportunities_df.columns.empty:
+                opportunities_df = pd.DataFrame(columns=list(summary))
+            summary_df = pd.DataFrame([summary], columns=opportunities_df.columns)
             
-            result_df = pd.concat([opportunities_df, summary_df], ignore_index=True)
-            
-            output_file = Path(output_dir) / "tax_optimization" / f"tax_report_{pd.Timestamp.now().strftime('%Y%m%d')}.csv"
+            output_file = Path(output_dir) / "tax_optimization" / f"tax_report_{stamp}.csv"
             output_file.parent.mkdir(parents=True, exist_ok=True)
             
-            result_df.to_csv(output_file, index=False)
+            opportunities_df.to_csv(output_file, index=False)
+            summary_df.to_csv(output_file, mode='a', header=False, index=False)
             logger.info(f"Saved tax report to {output_file}")
             
             return str(output_file)
@@ -410,33 +599,45 @@ class TaxOptimizationEngine:
     def save_tax_analysis_parquet(
         self,
         report: Dict,
-        output_dir: str = "db"
+        output_dir: str = "db",
+        now: Optional[pd.Timestamp] = None,
+        columns: Optional[Dict[str, list]] = None
     ) -> str:
-        """Save tax analysis to Parquet format."""
+        """Save tax analysis to Parquet format.
+        
+        columns is opportunity_columns(report), transposed here when omitted.
+        """
+        if now is None:
+            now = pd.Timestamp.now()
+        stamp = now.strftime('%Y%m%d')
         try:
             # Extract summary metrics
-            summary_df = pd.DataFrame([{
-                'report_date': report['report_date'],
-                'total_unrealized_losses': report['total_unrealized_losses'],
-                'short_term_losses': report['short_term_losses'],
-                'long_term_losses': report['long_term_losses'],
-                'num_losing_positions': report['num_losing_positions'],
-                'total_potential_tax_savings': report['total_potential_tax_savings'],
-                'avg_wash_sale_risk': report['avg_wash_sale_risk'],
-                'timestamp': pd.Timestamp.now()
-            }])
+            summary_table = pa.table({
+                'report_date': [report['report_date']],
+                'total_unrealized_losses': [report['total_unrealized_losses']],
+                'short_term_losses': [report['short_term_losses']],
+                'long_term_losses': [report['long_term_losses']],
+                'num_losing_positions': [report['num_losing_positions']],
+                'total_potential_tax_savings': [report['total_potential_tax_savings']],
+                'avg_wash_sale_risk': [report['avg_wash_sale_risk']],
+                'timestamp': pa.array([now], type=pa.timestamp('ns'))
+            })
             
-            output_file = Path(output_dir) / "tax_optimization" / f"summary_{pd.Timestamp.now().strftime('%Y%m%d')}.parquet"
+            output_file = Path(output_dir) / "tax_optimization" / f"summary_{stamp}.parquet"
             output_file.parent.mkdir(parents=True, exist_ok=True)
             
-            summary_df.to_parquet(output_file)
+            pq.write_table(summary_table, output_file, compression='zstd')
             logger.info(f"Saved tax analysis summary to {output_file}")
             
             # Also save opportunities
-            if report['opportunities']:
-                opportunities_df = pd.DataFrame(report['opportunities'])
-                opportunities_file = Path(output_dir) / "tax_optimization" / f"opportunities_{pd.Timestamp.now().strftime('%Y%m%d')}.parquet"
-                opportunities_df.to_parquet(opportunities_file)
+            if columns is None:
+                columns = self.opportunity_columns(report)
+            if columns:
+                opportunities_table = pa.Table.from_pydict(
+                    columns, schema=self.OPPORTUNITY_SCHEMA
+                )
+                opportunities_file = Path(output_dir) / "tax_optimization" / f"opportunities_{stamp}.parquet"
+                pq.write_table(opportunities_table, opportunities_file, compression='zstd')
                 logger.info(f"Saved tax opportunities to {opportunities_file}")
             
             return str(output_file)
@@ -5,12 +5,22 @@ This module provides common functionality used across the application including
 HTTP request handling with exponential backoff, logging setup, and data validation.
 """
 
+import asyncio
+import itertools
 import logging
 import time
 from typing import Any, Optional
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from .constants import (
     DEFAULT_TIMEOUT,
@@ -23,15 +33,19 @@ __all__ = [
     "setup_logger",
     "get_logger",
     "make_request_with_backoff",
+    "make_request_with_backoff_async",
+    "AsyncRateLimiter",
     "get_next_user_agent",
     "validate_ticker",
     "validate_cik",
 ]
 
 
-# Module-level user agent index for rotation
-_ua_index: int = 0
+# Module-level user agent rotation
+_ua_cycle = itertools.cycle(USER_AGENTS)
 _logger: Optional[logging.Logger] = None
+# Shared HTTP session so repeated requests reuse pooled keep-alive connections
+_session: Optional[requests.Session] = None
 
 
 def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
@@ -90,10 +104,110 @@ def get_next_user_agent() -> str:
     Returns:
         Next user agent string from the rotation list.
     """
-    global _ua_index
-    ua = USER_AGENTS[_ua_index % len(USER_AGENTS)]
-    _ua_index += 1
-    return ua
+    return next(_ua_cycle)
+
+
+def _get_session() -> requests.Session:
+    """
+    Get the shared HTTP session, creating it on first use.
+
+    Retries are disabled on the adapter because make_request_with_backoff
+    applies its own status-specific backoff. Headers shared by every
+    request are set once on the session.
+
+    Returns:
+        Session with pooled connections for HTTP and HTTPS.
+    """
+    global _session
+    if _session is None:
+        session = requests.Session()
+        session.headers.update(
+            {
+                "Accept": "application/json",
+                "Accept-Encoding": "gzip, deflate",
+                "Cache-Control": "no-cache",
+            }
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _session = session
+    return _session
+
+
+def _request_headers(headers: Optional[dict[str, str]]) -> dict[str, str]:
+    """
+    Build per-request headers with a rotated user agent.
+
+    The remaining defaults live on the shared session (see _get_session).
+
+    Args:
+        headers: Custom headers overriding the defaults.
+
+    Returns:
+        Headers for a single request.
+    """
+    if headers:
+        return {"User-Agent": get_next_user_agent(), **headers}
+    return {"User-Agent": get_next_user_agent()}
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body, using orjson when it is installed.
+
+    Bodies orjson rejects fall back to response.json(), so decode errors
+    still surface as requests.JSONDecodeError.
+
+    Args:
+        response: Successful HTTP response.
+
+    Returns:
+        Parsed JSON body.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass
+    return response.json()
+
+
+def _status_backoff(
+    response: requests.Response, attempt: int, initial_delay: float
+) -> float:
+    """
+    Get the wait before retrying a non-200 response.
+
+    Args:
+        response: Response with a non-200 status code.
+        attempt: Zero-based attempt number.
+        initial_delay: Initial delay between retries in seconds.
+
+    Returns:
+        Seconds to wait before the next attempt.
+
+    Raises:
+        requests.HTTPError: For error statuses other than 403 and 429.
+    """
+    logger = get_logger(__name__)
+
+    if response.status_code == 403:
+        wait_time = initial_delay * (2**attempt)
+        logger.warning(
+            f"403 Forbidden on attempt {attempt + 1}. "
+            f"Waiting {wait_time}s before retry..."
+        )
+        return wait_time
+    if response.status_code == 429:  # Rate limited
+        wait_time = initial_delay * (2**attempt) * 10  # Longer backoff for 429
+        logger.warning(
+            f"429 Too Many Requests on attempt {attempt + 1}. "
+            f"Waiting {wait_time}s before retry..."
+        )
+        return wait_time
+    response.raise_for_status()
+    return 0.0
 
 
 def make_request_with_backoff(
@@ -129,38 +243,141 @@ def make_request_with_backoff(
     # Rate limiting: add delay before making request
     time.sleep(rate_limit_delay)
 
-    default_headers = {
-        "User-Agent": get_next_user_agent(),
-        "Accept": "application/json",
-        "Accept-Encoding": "gzip, deflate",
-        "Cache-Control": "no-cache",
-    }
-
-    if headers:
-        default_headers.update(headers)
+    request_headers = _request_headers(headers)
 
     for attempt in range(max_retries):
         try:
-            response = requests.get(url, headers=default_headers, timeout=timeout)
+            response = _get_session().get(
+                url, headers=request_headers, timeout=timeout
+            )
 
             if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 403:
+                return _decode_json(response)
+            wait_time = _status_backoff(response, attempt, initial_delay)
+            if wait_time:
+                time.sleep(wait_time)
+
+        except requests.RequestException as e:
+            if attempt < max_retries - 1:
                 wait_time = initial_delay * (2**attempt)
                 logger.warning(
-                    f"403 Forbidden on attempt {attempt + 1}. "
+                    f"Request error on attempt {attempt + 1}: {e}. "
                     f"Waiting {wait_time}s before retry..."
                 )
                 time.sleep(wait_time)
-            elif response.status_code == 429:  # Rate limited
-                wait_time = initial_delay * (2**attempt) * 10  # Longer backoff for 429
-                logger.warning(
-                    f"429 Too Many Requests on attempt {attempt + 1}. "
-                    f"Waiting {wait_time}s before retry..."
+            else:
+                logger.error(
+                    f"Request failed after {max_retries} attempts: {e}"
                 )
-                time.sleep(wait_time)
+                return None
+
+    logger.error(f"Failed to retrieve {url} after {max_retries} attempts")
+    return None
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket limiting how many requests start per period.
+
+    Up to max_rate tokens accumulate, refilled continuously over period
+    seconds, so short bursts are allowed while the long-run rate stays
+    at max_rate per period.
+    """
+
+    def __init__(self, max_rate: float, period: float = 1.0) -> None:
+        """
+        Initialize rate limiter.
+
+        Args:
+            max_rate: Maximum number of acquisitions per period.
+            period: Length of the rate window in seconds.
+        """
+        self.max_rate = max_rate
+        self.period = period
+        self._tokens = max_rate
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                refill = (now - self._updated) * self.max_rate / self.period
+                self._tokens = min(self.max_rate, self._tokens + refill)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.period / self.max_rate)
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+async def make_request_with_backoff_async(
+    url: str,
+    max_retries: int = REQUEST_MAX_RETRIES,
+    initial_delay: float = INITIAL_BACKOFF_DELAY,
+    timeout: int = DEFAULT_TIMEOUT,
+    headers: Optional[dict[str, str]] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    rate_limiter: Optional[AsyncRateLimiter] = None,
+) -> Optional[dict[str, Any]]:
+    """
+    Make an HTTP GET request with backoff without blocking the event loop.
+
+    Async counterpart of make_request_with_backoff for fetching many URLs
+    concurrently, e.g. with asyncio.gather. Each GET and JSON decode runs in
+    a worker thread on the shared session and backoff waits use
+    asyncio.sleep, so concurrent fetches overlap their waits.
+
+    Args:
+        url: URL to request.
+        max_retries: Maximum number of retry attempts.
+        initial_delay: Initial delay between retries in seconds.
+        timeout: Request timeout in seconds.
+        headers: Custom headers to include in the request.
+        semaphore: Shared semaphore bounding requests in flight, used
+            instead of a fixed per-call rate limit delay.
+        rate_limiter: Shared limiter every attempt, including retries,
+            must pass before sending its request.
+
+    Returns:
+        JSON response as dictionary, or None if all retries failed.
+
+    Raises:
+        requests.RequestException: For non-recoverable HTTP errors.
+    """
+    logger = get_logger(__name__)
+
+    request_headers = _request_headers(headers)
+
+    async def fetch() -> requests.Response:
+        return await asyncio.to_thread(
+            _get_session().get, url, headers=request_headers, timeout=timeout
+        )
+
+    for attempt in range(max_retries):
+        try:
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
+            if semaphore is None:
+                response = await fetch()
             else:
-                response.raise_for_status()
+                async with semaphore:
+                    response = await fetch()
+
+            if response.status_code == 200:
+                # Decoding large bodies is CPU-bound; keep it off the event loop
+                return await asyncio.to_thread(_decode_json, response)
+            wait_time = _status_backoff(response, attempt, initial_delay)
+            if wait_time:
+                await asyncio.sleep(wait_time)
 
         except requests.RequestException as e:
             if attempt < max_retries - 1:
@@ -169,7 +386,7 @@ def make_request_with_backoff(
                     f"Request error on attempt {attempt + 1}: {e}. "
                     f"Waiting {wait_time}s before retry..."
                 )
-                time.sleep(wait_time)
+                await asyncio.sleep(wait_time)
             else:
                 logger.error(
                     f"Request failed after {max_retries} attempts: {e}"
@@ -192,8 +409,9 @@ def validate_ticker(ticker: str) -> bool:
     """
     if not ticker or not isinstance(ticker, str):
         return False
-    ticker = ticker.strip().upper()
-    # Tickers are typically 1-5 alphanumeric characters
+    # Case does not affect the check, so skip upper-casing a copy
+    ticker = ticker.strip()
+    # Tickers are typically 1-5 alphabetic characters
     return 1 <= len(ticker) <= 5 and ticker.isalpha()
 
 
@@ -209,8 +427,8 @@ def validate_cik(cik: str) -> bool:
     """
     if not cik or not isinstance(cik, str):
         return False
-    # CIK should be numeric (10 digits when zero-padded)
-    return cik.isdigit() and len(cik) == 10
+    # CIK should be numeric (10 ASCII digits when zero-padded)
+    return len(cik) == 10 and cik.isascii() and cik.isdigit()
 
 
 def safe_float_conversion(value: Any, default: Optional[float] = None) -> Optional[float]:
@@ -239,6 +457,4 @@ def format_timestamp() -> str:
     Returns:
         Formatted timestamp string.
     """
-    from datetime import datetime
-
-    return datetime.now().strftime("%Y%m%d_%H%M%S")
+    return time.strftime("%Y%m%d_%H%M%S")
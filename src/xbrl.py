@@ -4,33 +4,56 @@ XBRL data extraction from SEC filings.
 Fetches and parses financial data from 10-K and 10-Q filings.
 """
 
+import asyncio
 import os
-import time
-import xml.etree.ElementTree as ET
+import queue
+import threading
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Iterator, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
 from prefect import flow, get_run_logger, task
 
-from .cache import CIKCache
+from .cache import (
+    RESPONSE_CACHE_TTL_SECONDS,
+    TICKERS_CACHE_TTL_SECONDS,
+    CIKCache,
+    ResponseCache,
+)
 from .config import config
 from .constants import (
     CIK_ZERO_PADDING,
+    DEFAULT_COMPRESSION,
     DEFAULT_OUTPUT_DIR,
     DEFAULT_TIMEOUT,
     FILING_TYPE_10_K,
     SEC_BASE_URL,
     SEC_COMPANY_TICKERS_URL,
     SEC_FILINGS_URL,
+    SEC_FRAMES_URL,
+    SEC_MAX_REQUESTS_PER_SECOND,
+    SEC_REQUEST_MODES,
+)
+from .exceptions import (
+    CIKNotFoundError,
+    ConfigurationError,
+    DataParseError,
+    FilingNotFoundError,
 )
-from .exceptions import CIKNotFoundError, DataParseError, FilingNotFoundError
 from .utils import (
+    AsyncRateLimiter,
     format_timestamp,
     get_logger,
     get_next_user_agent,
     make_request_with_backoff,
+    make_request_with_backoff_async,
     safe_float_conversion,
     validate_cik,
     validate_ticker,
@@ -43,20 +66,401 @@ __all__ = [
     "parse_xbrl_fundamentals",
     "save_xbrl_data_to_parquet",
     "fetch_xbrl_filings",
+    "fetch_xbrl_frames",
 ]
 
 logger = get_logger(__name__)
 
-# XBRL financial metric tags to extract
-XBRL_REVENUE_TAGS = ["Revenues", "RevenueFromContractWithCustomer"]
-XBRL_INCOME_TAGS = ["NetIncomeLoss"]
-XBRL_OPERATING_TAGS = ["OperatingIncomeLoss"]
-XBRL_NAMESPACES = {
-    "us-gaap": "http://xbrl.us/us-gaap/2023-01-31",
-    "iso4217": "http://www.xbrl.org/2003/iso4217",
-    "xbrli": "http://www.xbrl.org/2003/instance",
+# Facts come from the SEC companyfacts JSON API; no XBRL XML is parsed here.
+
+# Downloaded companyfacts documents buffered ahead of the parser
+PREFETCH_SLOTS = 2
+
+# How often a producer blocked on a full queue checks for a stop request
+PREFETCH_POLL_SECONDS = 0.1
+
+# Queued by the producer thread once it has nothing more to deliver
+_PREFETCH_DONE = object()
+
+# Currencies tried in order before falling back to any reported unit
+PREFERRED_CURRENCIES = ("USD", "EUR", "GBP", "JPY")
+
+# Numeric fundamentals, stored as float64 columns
+FUNDAMENTAL_METRICS = (
+    "revenue",
+    "net_income",
+    "gross_profit",
+    "operating_income",
+    "total_assets",
+    "total_liabilities",
+    "shareholders_equity",
+    "operating_cash_flow",
+    "free_cash_flow",
+    "current_assets",
+    "current_liabilities",
+    "current_ratio",
+    "quick_ratio",
+    "debt_to_equity",
+)
+
+# Shareholders' equity tags, first non-zero value wins
+EQUITY_TAGS = (
+    "StockholdersEquity",
+    "ShareholdersEquity",
+    "EquityAttributableToOwnersOfParent",
+)
+
+# Balance sheet fundamentals, reported at a point in time rather than a period
+INSTANT_FIELDS = frozenset(
+    {
+        "total_assets",
+        "total_liabilities",
+        "current_assets",
+        "current_liabilities",
+        "shareholders_equity",
+    }
+)
+
+# Fundamentals key -> (US GAAP tags, IFRS tags), first tag with a value wins
+REQUIRED_FIELDS = {
+    "revenue": (
+        ("Revenues", "RevenueFromContractWithCustomerExcludingAssessedTax"),
+        ("Revenue",),
+    ),
+    "net_income": (("NetIncomeLoss",), ("ProfitLoss",)),
+    "operating_income": (
+        ("OperatingIncomeLoss",),
+        ("ProfitLossFromOperatingActivities",),
+    ),
+    "total_assets": (("Assets",), ("Assets",)),
+    "total_liabilities": (("Liabilities",), ("Liabilities",)),
+    "current_assets": (("AssetsCurrent", "CurrentAssets"), ("CurrentAssets",)),
+    "current_liabilities": (
+        ("LiabilitiesCurrent", "CurrentLiabilities"),
+        ("CurrentLiabilities",),
+    ),
+    "operating_cash_flow": (
+        ("NetCashProvidedByUsedInOperatingActivities",),
+        ("CashFlowsFromUsedInOperatingActivities",),
+    ),
 }
 
+# Fundamentals key -> US GAAP concepts queried from the SEC frames API, in order.
+# Only us-gaap names: the frames endpoint 404s for IFRS concepts.
+FRAME_TAGS = {
+    "revenue": ("Revenues", "RevenueFromContractWithCustomerExcludingAssessedTax"),
+    "net_income": ("NetIncomeLoss",),
+    "operating_income": ("OperatingIncomeLoss",),
+    "total_assets": ("Assets",),
+    "total_liabilities": ("Liabilities",),
+    "current_assets": ("AssetsCurrent",),
+    "current_liabilities": ("LiabilitiesCurrent",),
+    "operating_cash_flow": ("NetCashProvidedByUsedInOperatingActivities",),
+    "shareholders_equity": ("StockholdersEquity",),
+}
+
+# Every tag parse_xbrl_fundamentals reads, in either accounting standard
+PARSED_TAGS = frozenset(
+    [
+        tag
+        for standards in REQUIRED_FIELDS.values()
+        for tags in standards
+        for tag in tags
+    ]
+    + list(EQUITY_TAGS)
+)
+
+
+def _company_facts_url(cik: str) -> str:
+    """SEC company facts JSON API URL for a CIK."""
+    return f"https://data.sec.gov/api/xbrl/companyfacts/CIK{cik}.json"
+
+
+def _fetch_sec_json(
+    url: str,
+    ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS,
+    max_retries: int = 5,
+) -> Optional[dict]:
+    """
+    Fetch SEC JSON, serving it from the disk cache while fresh.
+
+    Args:
+        url: SEC API URL.
+        ttl_seconds: Maximum age of a cached response.
+        max_retries: Maximum number of request attempts.
+
+    Returns:
+        Parsed JSON response, or None if the request failed.
+    """
+    data = ResponseCache.get(url, ttl_seconds)
+    if data is None:
+        # Use make_request_with_backoff for proper retry and rate limiting
+        data = make_request_with_backoff(
+            url,
+            max_retries=max_retries,
+            initial_delay=2.0,
+            timeout=DEFAULT_TIMEOUT,
+            rate_limit_delay=0.1,
+        )
+        if data:
+            ResponseCache.set(url, data)
+    return data
+
+
+@lru_cache(maxsize=1)
+def _load_ticker_cik_map() -> dict[str, str]:
+    """
+    Download SEC's company tickers file once and index it by ticker.
+
+    The result is memoized for the life of the process, so every CIK
+    lookup after the first is a dict access, and the download itself is
+    cached on disk for TICKERS_CACHE_TTL_SECONDS. If SEC is unreachable,
+    an expired cached copy is used instead. Failed downloads with no
+    cached copy raise and are therefore not cached.
+
+    Returns:
+        Mapping of uppercased ticker to zero-padded CIK.
+
+    Raises:
+        CIKNotFoundError: If the company tickers file cannot be fetched.
+    """
+    try:
+        tickers_data = _fetch_sec_json(
+            SEC_COMPANY_TICKERS_URL, TICKERS_CACHE_TTL_SECONDS
+        )
+    except requests.RequestException as e:
+        logger.warning(f"Error fetching SEC company tickers: {e}")
+        tickers_data = None
+
+    if not tickers_data:
+        # The ticker list changes slowly; a stale copy beats failing every lookup
+        tickers_data = ResponseCache.get(SEC_COMPANY_TICKERS_URL, float("inf"))
+        if not tickers_data:
+            raise CIKNotFoundError("Could not fetch SEC company tickers")
+        logger.warning("SEC company tickers unavailable, using expired cached copy")
+
+    # First listing wins, matching the order a linear scan would find
+    ticker_ciks = {}
+    for entry in reversed(list(tickers_data.values())):
+        ticker_ciks[entry.get("ticker", "").upper()] = str(
+            entry.get("cik_str", "")
+        ).zfill(CIK_ZERO_PADDING)
+    return ticker_ciks
+
+
+def _latest_filing(data: Optional[dict], cik: str, filing_type: str) -> dict:
+    """
+    Select the most recent filing of a type from SEC submissions data.
+
+    Args:
+        data: Parsed submissions JSON for the company.
+        cik: Company's CIK number.
+        filing_type: Type of filing (e.g., '10-K', '10-Q').
+
+    Returns:
+        Dictionary with filing details.
+
+    Raises:
+        FilingNotFoundError: If no filing of the type is listed.
+    """
+    if not data or "filings" not in data or "recent" not in data["filings"]:
+        raise FilingNotFoundError(f"No filings found for CIK: {cik}")
+
+    recent = data["filings"]["recent"]
+
+    # Find the most recent filing of the specified type
+    for i, form_type in enumerate(recent.get("form", [])):
+        if form_type == filing_type:
+            return {
+                "accession_number": recent["accessionNumber"][i],
+                "filing_date": recent["filingDate"][i],
+                "filing_type": filing_type,
+                "cik": cik,
+            }
+
+    raise FilingNotFoundError(f"No {filing_type} filings found for CIK: {cik}")
+
+
+def _latest_filed_value(field_data: list[dict]) -> Optional[float]:
+    """
+    Return the value of the most recently filed datapoint.
+
+    Single forward pass equivalent to ``max(field_data, key=filed)``: the
+    first datapoint with the latest filed date wins.
+
+    Args:
+        field_data: Non-empty list of SEC facts datapoints for one unit.
+
+    Returns:
+        Datapoint value as float, or None if not convertible.
+    """
+    latest = field_data[0]
+    latest_filed = latest.get("filed", "")
+    for datapoint in field_data:
+        filed = datapoint.get("filed", "")
+        if filed > latest_filed:
+            latest, latest_filed = datapoint, filed
+    return safe_float_conversion(latest.get("val"))
+
+
+def _extract_latest_value(
+    accounting_data: dict,
+    field_name: str,
+    preferred_currencies: tuple[str, ...] = PREFERRED_CURRENCIES,
+) -> Optional[float]:
+    """
+    Get the most recent value for a field, trying multiple currencies.
+
+    Args:
+        accounting_data: us-gaap or ifrs-full section of company facts.
+        field_name: XBRL tag to extract.
+        preferred_currencies: Units tried in order before any other unit.
+
+    Returns:
+        Latest filed value as float, or None if the field is missing.
+    """
+    field_info = accounting_data.get(field_name)
+    if field_info is None:
+        return None
+
+    units = field_info.get("units", {})
+
+    # Try preferred currencies first
+    for currency in preferred_currencies:
+        field_data = units.get(currency)
+        if field_data:
+            return _latest_filed_value(field_data)
+
+    # If no preferred currency found, try any available currency
+    for field_data in units.values():
+        if field_data:
+            return _latest_filed_value(field_data)
+
+    return None
+
+
+def _frame_period_values(xbrl_data: dict, year: int) -> dict[str, Optional[float]]:
+    """
+    Get each frames field for one period from a company's own facts.
+
+    Only datapoints SEC assigned to the requested frame period (their
+    ``frame`` key, e.g. 'CY2023' or 'CY2023Q4I') are used, so the values
+    match what the frames API would have returned for the company.
+
+    Args:
+        xbrl_data: Company facts dictionary from the SEC JSON API.
+        year: Calendar year of the frames.
+
+    Returns:
+        Mapping of fundamentals key to value, None where the period is missing.
+    """
+    facts = xbrl_data.get("facts") or {}
+    us_gaap = facts.get("us-gaap") or {}
+    accounting_data = us_gaap or facts.get("ifrs-full") or {}
+    std_idx = 0 if us_gaap else 1
+
+    candidates = {key: standards[std_idx] for key, standards in REQUIRED_FIELDS.items()}
+    candidates["shareholders_equity"] = EQUITY_TAGS
+
+    values: dict[str, Optional[float]] = {}
+    for key, tags in candidates.items():
+        period = _frame_period(key, year)
+        values[key] = None
+        for tag in tags:
+            units = (accounting_data.get(tag) or {}).get("units", {})
+            currencies = [c for c in PREFERRED_CURRENCIES if c in units]
+            currencies += [c for c in units if c not in PREFERRED_CURRENCIES]
+            datapoint = next(
+                (
+                    datapoint
+                    for currency in currencies
+                    for datapoint in units[currency]
+                    if datapoint.get("frame") == period
+                ),
+                None,
+            )
+            if datapoint is not None:
+                values[key] = safe_float_conversion(datapoint.get("val"))
+                break
+    return values
+
+
+def _slim_company_facts(xbrl_data: Optional[dict]) -> Optional[dict]:
+    """
+    Keep only the facts parse_xbrl_fundamentals reads from a companyfacts document.
+
+    Only the accounting standard the parser would pick is kept, so parsing
+    the slimmed document gives the same fundamentals as the full one.
+
+    Args:
+        xbrl_data: Company facts dictionary from the SEC JSON API.
+
+    Returns:
+        Copy with the selected standard's facts reduced to PARSED_TAGS.
+    """
+    if not xbrl_data or "facts" not in xbrl_data:
+        return xbrl_data
+
+    facts = xbrl_data.get("facts") or {}
+    standard = "us-gaap" if facts.get("us-gaap") else "ifrs-full"
+    section = facts.get(standard) or {}
+    slim_section = {tag: section[tag] for tag in PARSED_TAGS if tag in section}
+    return {**xbrl_data, "facts": {standard: slim_section}}
+
+
+def _add_derived_metrics(fundamentals: dict) -> None:
+    """
+    Fill debt_to_equity and current_ratio from extracted balance sheet values.
+
+    Args:
+        fundamentals: Fundamentals dictionary, updated in place.
+    """
+    if fundamentals["total_assets"] and fundamentals["total_liabilities"]:
+        try:
+            equity = fundamentals["total_assets"] - fundamentals["total_liabilities"]
+            if equity != 0:
+                fundamentals["debt_to_equity"] = (
+                    fundamentals["total_liabilities"] / equity
+                )
+        except (TypeError, ZeroDivisionError):
+            pass
+
+    if fundamentals["current_assets"] and fundamentals["current_liabilities"]:
+        try:
+            fundamentals["current_ratio"] = (
+                fundamentals["current_assets"] / fundamentals["current_liabilities"]
+            )
+        except (TypeError, ZeroDivisionError):
+            pass
+
+
+def _frame_period(field: str, year: int) -> str:
+    """SEC frames period: year-end instant for balance sheet items, else the year."""
+    return f"CY{year}Q4I" if field in INSTANT_FIELDS else f"CY{year}"
+
+
+def _fetch_frame_values(concept: str, period: str) -> dict[str, Optional[float]]:
+    """
+    Fetch one US GAAP concept for every filer from the SEC frames API.
+
+    Args:
+        concept: US GAAP tag (e.g., 'Revenues').
+        period: Frame period (e.g., 'CY2023' or 'CY2023Q4I').
+
+    Returns:
+        Mapping of zero-padded CIK to value; empty if the frame is unavailable.
+    """
+    # A missing frame is a 404, which no amount of backoff will fix
+    data = _fetch_sec_json(
+        f"{SEC_FRAMES_URL}/us-gaap/{concept}/USD/{period}.json", max_retries=1
+    )
+    if not data:
+        return {}
+    return {
+        str(fact["cik"]).zfill(CIK_ZERO_PADDING): safe_float_conversion(fact.get("val"))
+        for fact in data.get("data", [])
+    }
+
 
 @task(retries=3, retry_delay_seconds=5)
 def fetch_company_cik(ticker: str) -> Optional[str]:
@@ -89,26 +493,12 @@ def fetch_company_cik(ticker: str) -> Optional[str]:
         return cached_cik
 
     try:
-        # Use make_request_with_backoff for proper retry and rate limiting
-        tickers_data = make_request_with_backoff(
-            SEC_COMPANY_TICKERS_URL,
-            max_retries=5,
-            initial_delay=2.0,
-            timeout=DEFAULT_TIMEOUT,
-            rate_limit_delay=0.1,
-        )
-
-        if not tickers_data:
-            logger_instance.error(f"Failed to fetch company tickers for {ticker}")
-            raise CIKNotFoundError(f"Could not fetch company data for {ticker}")
-
-        for entry in tickers_data.values():
-            if entry.get("ticker", "").upper() == ticker.upper():
-                cik = str(entry.get("cik_str", "")).zfill(CIK_ZERO_PADDING)
-                logger_instance.info(f"Found CIK: {cik} for ticker: {ticker}")
-                # Cache the result
-                CIKCache.set(ticker, cik)
-                return cik
+        cik = _load_ticker_cik_map().get(ticker.upper())
+        if cik:
+            logger_instance.info(f"Found CIK: {cik} for ticker: {ticker}")
+            # Cache the result
+            CIKCache.set(ticker, cik)
+            return cik
 
         logger_instance.warning(f"CIK not found for ticker: {ticker}")
         raise CIKNotFoundError(f"CIK not found for ticker: {ticker}")
@@ -144,47 +534,16 @@ def fetch_sec_filing_index(
         raise ValueError(f"Invalid CIK format: {cik}")
 
     try:
-        url = f"{SEC_BASE_URL}/CIK{cik}.json"
-        
-        # Use make_request_with_backoff for proper retry and rate limiting
-        data = make_request_with_backoff(
-            url,
-            max_retries=5,
-            initial_delay=2.0,
-            timeout=DEFAULT_TIMEOUT,
-            rate_limit_delay=0.1,
-        )
-
-        if not data or "filings" not in data or "recent" not in data["filings"]:
-            logger_instance.warning(f"No filings found for CIK: {cik}")
-            raise FilingNotFoundError(f"No filings found for CIK: {cik}")
-
-        recent = data["filings"]["recent"]
-
-        # Find the most recent filing of the specified type
-        for i, form_type in enumerate(recent.get("form", [])):
-            if form_type == filing_type:
-                accession_number = recent["accessionNumber"][i]
-                filing_date = recent["filingDate"][i]
-
-                filing_info = {
-                    "accession_number": accession_number,
-                    "filing_date": filing_date,
-                    "filing_type": filing_type,
-                    "cik": cik,
-                }
-
-                logger_instance.info(f"Found {filing_type} filing: {accession_number}")
-                return filing_info
+        data = _fetch_sec_json(f"{SEC_BASE_URL}/CIK{cik}.json")
 
-        logger_instance.warning(
-            f"No {filing_type} filings found for CIK: {cik}"
-        )
-        raise FilingNotFoundError(
-            f"No {filing_type} filings found for CIK: {cik}"
+        filing_info = _latest_filing(data, cik, filing_type)
+        logger_instance.info(
+            f"Found {filing_type} filing: {filing_info['accession_number']}"
         )
+        return filing_info
 
-    except FilingNotFoundError:
+    except FilingNotFoundError as e:
+        logger_instance.warning(str(e))
         raise
     except Exception as e:
         logger_instance.error(f"Error fetching filing index for {cik}: {e}")
@@ -216,16 +575,10 @@ def fetch_xbrl_document(
     try:
         # Use SEC's company facts JSON API for XBRL data
         # This endpoint provides all financial facts in structured JSON format
-        url = f"https://data.sec.gov/api/xbrl/companyfacts/CIK{cik}.json"
+        url = _company_facts_url(cik)
 
-        # Fetch with proper headers and rate limiting
-        data = make_request_with_backoff(
-            url,
-            max_retries=5,
-            initial_delay=2.0,
-            timeout=DEFAULT_TIMEOUT,
-            rate_limit_delay=0.1,
-        )
+        # Fetch with proper headers and rate limiting, or from disk cache
+        data = _fetch_sec_json(url)
 
         if data:
             logger_instance.info(f"Successfully retrieved XBRL data for CIK {cik}")
@@ -261,20 +614,7 @@ def parse_xbrl_fundamentals(xbrl_data: Optional[dict], ticker: str) -> dict:
 
     fundamentals: dict[str, Optional[float]] = {
         "ticker": ticker,
-        "revenue": None,
-        "net_income": None,
-        "gross_profit": None,
-        "operating_income": None,
-        "total_assets": None,
-        "total_liabilities": None,
-        "shareholders_equity": None,
-        "operating_cash_flow": None,
-        "free_cash_flow": None,
-        "current_assets": None,
-        "current_liabilities": None,
-        "current_ratio": None,
-        "quick_ratio": None,
-        "debt_to_equity": None,
+        **dict.fromkeys(FUNDAMENTAL_METRICS),
         "timestamp": datetime.now().isoformat(),
     }
 
@@ -297,85 +637,24 @@ def parse_xbrl_fundamentals(xbrl_data: Optional[dict], ticker: str) -> dict:
             logger_instance.warning(f"No accounting data (us-gaap or ifrs-full) found for {ticker}")
             return fundamentals
 
-        # Helper function to extract value from accounting data
-        def get_latest_value(field_name, preferred_currencies=None):
-            """Get the most recent value for a field, trying multiple currencies."""
-            if preferred_currencies is None:
-                preferred_currencies = ["USD", "EUR", "GBP", "JPY"]
-            
-            if field_name not in accounting_data:
-                return None
-            
-            field_info = accounting_data[field_name]
-            units = field_info.get("units", {})
-            
-            # Try preferred currencies first
-            for currency in preferred_currencies:
-                field_data = units.get(currency, [])
-                if field_data:
-                    try:
-                        # Get the most recent value by filed date
-                        latest = max(field_data, key=lambda x: x.get("filed", ""))
-                        return safe_float_conversion(latest.get("val"))
-                    except (ValueError, KeyError):
-                        continue
-            
-            # If no preferred currency found, try any available currency
-            for currency, field_data in units.items():
-                if field_data:
-                    try:
-                        latest = max(field_data, key=lambda x: x.get("filed", ""))
-                        return safe_float_conversion(latest.get("val"))
-                    except (ValueError, KeyError):
-                        continue
-            
-            return None
-
-        # Extract revenue (US GAAP: Revenues, IFRS: Revenue)
-        revenue_field = "Revenues" if not is_ifrs else "Revenue"
-        fundamentals["revenue"] = get_latest_value(revenue_field)
-
-        # Extract net income (US GAAP: NetIncomeLoss, IFRS: ProfitLoss)
-        income_field = "NetIncomeLoss" if not is_ifrs else "ProfitLoss"
-        fundamentals["net_income"] = get_latest_value(income_field)
-
-        # Extract total assets
-        fundamentals["total_assets"] = get_latest_value("Assets")
-
-        # Extract total liabilities
-        fundamentals["total_liabilities"] = get_latest_value("Liabilities")
+        # Extract each required field with the tag for this standard
+        std_idx = 1 if is_ifrs else 0
+        for key, standards in REQUIRED_FIELDS.items():
+            for tag in standards[std_idx]:
+                value = _extract_latest_value(accounting_data, tag)
+                if value is not None:
+                    break
+            fundamentals[key] = value
 
         # Extract shareholders' equity
-        for equity_tag in ["StockholdersEquity", "ShareholdersEquity", "EquityAttributableToOwnersOfParent"]:
-            equity_value = get_latest_value(equity_tag)
+        for equity_tag in EQUITY_TAGS:
+            equity_value = _extract_latest_value(accounting_data, equity_tag)
             if equity_value:
                 fundamentals["shareholders_equity"] = equity_value
                 break
 
-        # Extract current assets
-        fundamentals["current_assets"] = get_latest_value("CurrentAssets")
-
-        # Extract current liabilities
-        fundamentals["current_liabilities"] = get_latest_value("CurrentLiabilities")
-
         # Calculate derived metrics
-        if fundamentals["total_assets"] and fundamentals["total_liabilities"]:
-            try:
-                equity = fundamentals["total_assets"] - fundamentals["total_liabilities"]
-                if equity != 0:
-                    fundamentals["debt_to_equity"] = (
-                        fundamentals["total_liabilities"] / equity
-                    )
-            except (TypeError, ZeroDivisionError):
-                pass
-
-        if fundamentals["current_assets"] and fundamentals["current_liabilities"]:
-            try:
-                fundamentals["current_ratio"] = (
-                    fundamentals["current_assets"] / fundamentals["current_liabilities"]
-                )
-            except (TypeError, ZeroDivisionError):
-                pass
+        _add_derived_metrics(fundamentals)
 
         logger_instance.info(f"Successfully parsed XBRL data for {ticker}")
 
@@ -386,6 +665,30 @@ def parse_xbrl_fundamentals(xbrl_data: Optional[dict], ticker: str) -> dict:
     return fundamentals
 
 
+def _fundamentals_frame(xbrl_list: list[dict]) -> pd.DataFrame:
+    """
+    Build a DataFrame from fundamentals records one column at a time.
+
+    Metric columns are created directly as float64 arrays (None becomes
+    NaN), skipping pandas' per-row dtype inference for list-of-dict input.
+
+    Args:
+        xbrl_list: List of XBRL data dictionaries.
+
+    Returns:
+        DataFrame with one row per record, columns in first-seen order.
+    """
+    keys = dict.fromkeys(key for record in xbrl_list for key in record)
+    columns = {}
+    for key in keys:
+        values = [record.get(key) for record in xbrl_list]
+        if key in FUNDAMENTAL_METRICS:
+            columns[key] = np.array(values, dtype=np.float64)
+        else:
+            columns[key] = values
+    return pd.DataFrame(columns, copy=False)
+
+
 @task
 def save_xbrl_data_to_parquet(
     xbrl_list: list[dict], output_dir: str = DEFAULT_OUTPUT_DIR
@@ -393,12 +696,15 @@ def save_xbrl_data_to_parquet(
     """
     Save XBRL data to Parquet file.
 
+    Records are upserted into the partitioned xbrl_filings table and also
+    written to a snappy-compressed snapshot file for this run.
+
     Args:
         xbrl_list: List of XBRL data dictionaries.
         output_dir: Output directory.
 
     Returns:
-        Path to saved Parquet file.
+        Path to saved Parquet snapshot file.
 
     Raises:
         IOError: If file cannot be written.
@@ -409,7 +715,7 @@ def save_xbrl_data_to_parquet(
     try:
         from .parquet_db import ParquetDB
         
-        df = pd.DataFrame(xbrl_list)
+        df = _fundamentals_frame(xbrl_list)
         
         # Ensure required columns for XBRL_FILINGS table
         if 'filing_date' not in df.columns:
@@ -430,6 +736,18 @@ def save_xbrl_data_to_parquet(
         inserted, updated = db.upsert_xbrl_filings(df)
         logger_instance.info(f"Saved XBRL data: {inserted} new, {updated} updated")
 
+        # Write this run's records as a standalone snapshot file
+        os.makedirs(output_dir, exist_ok=True)
+        file_path = os.path.join(output_dir, f"xbrl_{format_timestamp()}.parquet")
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(
+            table,
+            file_path,
+            compression=DEFAULT_COMPRESSION,
+            use_dictionary=["ticker", "cik"],
+        )
+        logger_instance.info(f"Saved XBRL snapshot to {file_path}")
+
         return file_path
 
     except Exception as e:
@@ -437,6 +755,252 @@ def save_xbrl_data_to_parquet(
         raise
 
 
+def _sec_max_concurrency() -> int:
+    """
+    Get the in-flight SEC request limit for the configured request mode.
+
+    The mode comes from the SEC_REQUEST_MODE env var or the
+    sec_request_mode config key: normal, caution or crawl.
+
+    Returns:
+        Maximum number of concurrent SEC requests.
+
+    Raises:
+        ConfigurationError: If the mode is not recognised.
+    """
+    mode = config.get("sec_request_mode", "normal", env_var="SEC_REQUEST_MODE")
+    try:
+        return SEC_REQUEST_MODES[mode.lower()]
+    except KeyError:
+        raise ConfigurationError(
+            f"Unknown sec_request_mode '{mode}', "
+            f"expected one of: {', '.join(SEC_REQUEST_MODES)}"
+        ) from None
+
+
+@dataclass
+class _SECRequestLimits:
+    """Limits shared by every concurrent SEC fetch on one event loop."""
+
+    semaphore: asyncio.Semaphore
+    rate_limiter: AsyncRateLimiter
+    ticker_map_lock: asyncio.Lock
+
+    @classmethod
+    def create(cls, max_concurrency: int) -> "_SECRequestLimits":
+        """Create limits allowing max_concurrency requests in flight."""
+        return cls(
+            semaphore=asyncio.Semaphore(max_concurrency),
+            # Stay one request per second under SEC's published cap
+            rate_limiter=AsyncRateLimiter(SEC_MAX_REQUESTS_PER_SECOND - 1),
+            ticker_map_lock=asyncio.Lock(),
+        )
+
+
+async def _fetch_sec_json_async(
+    url: str, limits: _SECRequestLimits
+) -> Optional[dict]:
+    """Fetch SEC JSON with the same retry policy and disk cache as the sync tasks."""
+    data = await asyncio.to_thread(ResponseCache.get, url)
+    if data is None:
+        data = await make_request_with_backoff_async(
+            url,
+            max_retries=5,
+            initial_delay=2.0,
+            timeout=DEFAULT_TIMEOUT,
+            semaphore=limits.semaphore,
+            rate_limiter=limits.rate_limiter,
+        )
+        if data:
+            await asyncio.to_thread(ResponseCache.set, url, data)
+    return data
+
+
+async def _fetch_ticker_facts_async(
+    ticker: str,
+    filing_type: str,
+    limits: _SECRequestLimits,
+) -> Optional[dict]:
+    """
+    Fetch the CIK, latest filing and company facts for one ticker.
+
+    Async counterpart of the fetch_company_cik, fetch_sec_filing_index and
+    fetch_xbrl_document chain, so several tickers can be in flight at once.
+
+    Args:
+        ticker: Stock ticker symbol.
+        filing_type: Type of filing (10-K or 10-Q).
+        limits: Concurrency, rate and download limits shared across tickers.
+
+    Returns:
+        Company facts reduced to the parsed tags, or None if no XBRL data
+        was returned.
+
+    Raises:
+        ValueError: If the ticker or CIK format is invalid.
+        CIKNotFoundError: If the CIK cannot be found.
+        FilingNotFoundError: If no filing of the type is listed.
+    """
+    if not validate_ticker(ticker):
+        raise ValueError(f"Invalid ticker format: {ticker}")
+
+    cik = CIKCache.get(ticker)
+    if not cik:
+        # Serialize the first load so concurrent misses share one download
+        async with limits.ticker_map_lock:
+            if _load_ticker_cik_map.cache_info().currsize:
+                # Already loaded: no SEC request, so no slot or token needed
+                ticker_ciks = _load_ticker_cik_map()
+            else:
+                async with limits.semaphore, limits.rate_limiter:
+                    ticker_ciks = await asyncio.to_thread(_load_ticker_cik_map)
+        cik = ticker_ciks.get(ticker.upper())
+        if not cik:
+            raise CIKNotFoundError(f"CIK not found for ticker: {ticker}")
+        CIKCache.set(ticker, cik)
+
+    if not validate_cik(cik):
+        raise ValueError(f"Invalid CIK format: {cik}")
+
+    submissions = await _fetch_sec_json_async(f"{SEC_BASE_URL}/CIK{cik}.json", limits)
+    _latest_filing(submissions, cik, filing_type)
+
+    # Drop unused facts so queued documents stay small until they are parsed
+    xbrl_data = await _fetch_sec_json_async(_company_facts_url(cik), limits)
+    return _slim_company_facts(xbrl_data)
+
+
+def _put_unless_stopped(
+    results: queue.Queue, item: object, stop: threading.Event
+) -> bool:
+    """Put item on results, giving up once stop is set; return whether it was queued."""
+    while not stop.is_set():
+        try:
+            results.put(item, timeout=PREFETCH_POLL_SECONDS)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+async def _produce_facts_async(
+    tickers: list[str],
+    filing_type: str,
+    max_concurrency: int,
+    results: queue.Queue,
+    stop: threading.Event,
+) -> None:
+    """
+    Fetch tickers through a sliding window and queue results in order.
+
+    At most max_concurrency tickers are in flight and requests start no
+    faster than SEC's rate limit allows; each finished ticker is
+    put on results as (ticker, facts or exception), blocking off the event
+    loop while the queue is full. Once stop is set, outstanding fetches
+    are cancelled and nothing more is queued.
+    """
+    limits = _SECRequestLimits.create(max_concurrency)
+    pending: deque = deque()
+    remaining = iter(tickers)
+
+    def schedule() -> None:
+        for ticker in remaining:
+            fetch = _fetch_ticker_facts_async(ticker, filing_type, limits)
+            pending.append((ticker, asyncio.ensure_future(fetch)))
+            if len(pending) >= max_concurrency:
+                break
+
+    schedule()
+    try:
+        while pending and not stop.is_set():
+            ticker, fetch = pending.popleft()
+            try:
+                result = await fetch
+            except Exception as e:
+                result = e
+            queued = await asyncio.to_thread(
+                _put_unless_stopped, results, (ticker, result), stop
+            )
+            if not queued:
+                break
+            schedule()
+    finally:
+        for _, fetch in pending:
+            fetch.cancel()
+
+
+def _run_facts_producer(
+    tickers: list[str],
+    filing_type: str,
+    max_concurrency: int,
+    results: queue.Queue,
+    stop: threading.Event,
+) -> None:
+    """Thread target: run the producer loop, then queue a terminal item.
+
+    The terminal item is _PREFETCH_DONE, or the exception that ended the
+    loop, so the consumer never waits on a producer that has exited.
+    """
+    outcome: object = _PREFETCH_DONE
+    try:
+        asyncio.run(
+            _produce_facts_async(tickers, filing_type, max_concurrency, results, stop)
+        )
+    except BaseException as e:
+        outcome = e
+    finally:
+        _put_unless_stopped(results, outcome, stop)
+
+
+def _prefetch_facts(
+    tickers: list[str],
+    filing_type: str,
+    max_concurrency: int,
+    slots: int = PREFETCH_SLOTS,
+) -> Iterator[tuple]:
+    """
+    Yield each ticker's company facts while later tickers keep downloading.
+
+    Downloads run on an event loop in a background thread and feed a queue
+    of ``slots`` documents, so the caller parses one ticker while the next
+    ones are fetched and memory stays bounded. Closing the generator early
+    tells the background thread to cancel its downloads and exit.
+
+    Args:
+        tickers: List of stock tickers.
+        filing_type: Type of filing (10-K or 10-Q).
+        max_concurrency: Maximum number of concurrent SEC requests.
+        slots: Number of fetched documents buffered ahead of the caller.
+
+    Yields:
+        (ticker, result) in ticker order, where result is the company facts
+        dictionary, None, or the exception raised while fetching.
+
+    Raises:
+        BaseException: Whatever stopped the background producer before it
+            delivered every ticker.
+    """
+    results: queue.Queue = queue.Queue(maxsize=slots)
+    stop = threading.Event()
+    producer = threading.Thread(
+        target=_run_facts_producer,
+        args=(tickers, filing_type, max_concurrency, results, stop),
+        daemon=True,
+    )
+    producer.start()
+    try:
+        for _ in tickers:
+            item = results.get()
+            if isinstance(item, BaseException):
+                raise item
+            if item is _PREFETCH_DONE:
+                break
+            yield item
+        producer.join()
+    finally:
+        stop.set()
+
+
 @flow
 def fetch_xbrl_filings(
     tickers: list[str], filing_type: str = FILING_TYPE_10_K
@@ -444,6 +1008,10 @@ def fetch_xbrl_filings(
     """
     Main Prefect flow to fetch XBRL data for multiple companies.
 
+    SEC requests for different tickers run concurrently, bounded by the
+    configured SEC request mode, and the next documents download while the
+    current one is parsed; results are parsed in ticker order.
+
     Args:
         tickers: List of stock tickers.
         filing_type: Type of filing (10-K or 10-Q).
@@ -456,26 +1024,15 @@ def fetch_xbrl_filings(
 
     xbrl_data = []
 
-    for ticker in tickers:
+    # Parse each ticker while the following ones download in the background
+    xbrl_docs = _prefetch_facts(tickers, filing_type, _sec_max_concurrency())
+
+    for ticker, xbrl_doc in xbrl_docs:
         logger_instance.info(f"Processing {ticker}")
 
         try:
-            # Fetch CIK
-            cik = fetch_company_cik(ticker)
-            if not cik:
-                logger_instance.warning(f"Could not find CIK for {ticker}")
-                continue
-
-            # Fetch filing index
-            filing_info = fetch_sec_filing_index(cik, filing_type)
-            if not filing_info:
-                logger_instance.warning(
-                    f"Could not find {filing_type} filing for {ticker}"
-                )
-                continue
-
-            # Fetch XBRL document
-            xbrl_doc = fetch_xbrl_document(cik, filing_info["accession_number"])
+            if isinstance(xbrl_doc, BaseException):
+                raise xbrl_doc
             if not xbrl_doc:
                 logger_instance.warning(f"Could not fetch XBRL document for {ticker}")
                 continue
@@ -488,9 +1045,6 @@ def fetch_xbrl_filings(
             logger_instance.warning(f"Error processing {ticker}: {e}")
             continue
 
-        # Rate limiting: wait 2 seconds between requests
-        time.sleep(2)
-
     # Save to Parquet
     if xbrl_data:
         file_path = save_xbrl_data_to_parquet(xbrl_data)
@@ -501,6 +1055,93 @@ def fetch_xbrl_filings(
         return ""
 
 
+@flow
+def fetch_xbrl_frames(
+    tickers: list[str], year: int, filing_type: str = FILING_TYPE_10_K
+) -> str:
+    """
+    Prefect flow to fetch one fiscal year of fundamentals for many companies.
+
+    Each field is fetched once for all filers from the SEC frames API
+    instead of downloading every company's full facts document. Tickers
+    that appear in none of the frames (IFRS or non-USD filers) fall back
+    to their own companyfacts datapoints for the same period; fields with
+    no datapoint for the year stay None.
+
+    Args:
+        tickers: List of stock tickers.
+        year: Calendar year of the frames (e.g., 2023).
+        filing_type: Type of filing used for the companyfacts fallback.
+
+    Returns:
+        Path to saved Parquet file.
+    """
+    logger_instance = get_run_logger()
+    logger_instance.info(f"Starting XBRL frames flow for {year}: {tickers}")
+
+    ciks = {}
+    for ticker in tickers:
+        try:
+            ciks[ticker] = fetch_company_cik(ticker)
+        except CIKNotFoundError as e:
+            logger_instance.warning(f"Error processing {ticker}: {e}")
+
+    timestamp = datetime.now().isoformat()
+    records = {
+        ticker: {
+            "ticker": ticker,
+            **dict.fromkeys(FUNDAMENTAL_METRICS),
+            "timestamp": timestamp,
+        }
+        for ticker in ciks
+    }
+
+    # Try each field's US GAAP tags in order for tickers still missing it
+    framed_ciks: set[str] = set()
+    for key, tags in FRAME_TAGS.items():
+        for tag in tags:
+            pending = [t for t in ciks if records[t][key] is None]
+            if not pending:
+                break
+            values = _fetch_frame_values(tag, _frame_period(key, year))
+            framed_ciks.update(values)
+            for ticker in pending:
+                records[ticker][key] = values.get(ciks[ticker])
+
+    # A filer in any frame has its period datapoints there already; only
+    # filers in none of them (IFRS or non-USD) need their own facts
+    unframed = [ticker for ticker in records if ciks[ticker] not in framed_ciks]
+    if unframed:
+        logger_instance.info(f"Falling back to companyfacts for {unframed}")
+        xbrl_docs = _prefetch_facts(unframed, filing_type, _sec_max_concurrency())
+        for ticker, xbrl_doc in xbrl_docs:
+            try:
+                if isinstance(xbrl_doc, BaseException):
+                    raise xbrl_doc
+                if not xbrl_doc:
+                    continue
+                period_values = _frame_period_values(xbrl_doc, year)
+            except (CIKNotFoundError, FilingNotFoundError, DataParseError) as e:
+                logger_instance.warning(f"Error processing {ticker}: {e}")
+                continue
+            record = records[ticker]
+            for key in FRAME_TAGS:
+                if record[key] is None:
+                    record[key] = period_values[key]
+
+    xbrl_data = list(records.values())
+    for record in xbrl_data:
+        _add_derived_metrics(record)
+
+    if xbrl_data:
+        file_path = save_xbrl_data_to_parquet(xbrl_data)
+        logger_instance.info(f"XBRL frames flow completed. Data saved to {file_path}")
+        return file_path
+    else:
+        logger_instance.warning("No XBRL data collected")
+        return ""
+
+
 def main() -> None:
     """Test XBRL fetching with example companies."""
     result = fetch_xbrl_filings(["AAPL", "MSFT"])
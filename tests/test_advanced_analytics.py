@@ -11,7 +11,7 @@ from src.portfolio_risk import RiskAnalytics
 from src.portfolio_optimization import PortfolioOptimizer, equal_weight_portfolio
 from src.options_analysis import OptionsAnalysis
 from src.fixed_income_analysis import FixedIncomeAnalysis, analyze_bond_position
-from src.quick_wins_analytics import QuickWinsAnalytics
+from src.quick_wins_analytics import QuickWinsAnalytics, daily_returns
 
 
 class TestRiskAnalytics:
@@ -277,6 +277,38 @@ class TestQuickWinsAnalytics:
         assert "equity" in breakdown
         assert "crypto" in breakdown
 
+    def test_prepared_view_matches_dict_input(self):
+        """Test a prepared PortfolioView gives the same breakdowns."""
+        holdings = {
+            "AAPL": {"quantity": 10, "price": 150, "sector": "Technology"},
+            "JPM": {"quantity": 5, "price": 150, "sector": "Finance", "asset_class": "equity"},
+            "BTC": {"quantity": 0.5, "price": 40000, "asset_class": "crypto"},
+        }
+
+        view = QuickWinsAnalytics.prepare(holdings)
+
+        assert QuickWinsAnalytics.sector_allocation(view) == QuickWinsAnalytics.sector_allocation(holdings)
+        assert list(QuickWinsAnalytics.sector_allocation(view)) == ["Technology", "Finance", "Unknown"]
+        assert QuickWinsAnalytics.asset_class_breakdown(view) == QuickWinsAnalytics.asset_class_breakdown(holdings)
+
+        rotation = QuickWinsAnalytics.sector_rotation_strategy({"Technology": 5.0, "Finance": -2.0}, view)
+        assert rotation["candidates_for_rotation"]["Finance"] == ["JPM"]
+
+    def test_daily_returns_matches_pct_change(self):
+        """Test daily returns equal pct_change().dropna(), even after edits."""
+        prices = pd.DataFrame(
+            {
+                "AAPL": [100.0, 101.0, 99.0, 102.0, 103.0],
+                "MSFT": [200.0, 202.0, 204.0, 203.0, 205.0],
+            },
+            index=pd.date_range("2023-01-01", periods=5),
+        )
+        pd.testing.assert_frame_equal(daily_returns(prices), prices.pct_change().dropna())
+
+        # In-place edits to the prices are reflected in the next call
+        prices.iloc[2, 0] = 100.0
+        pd.testing.assert_frame_equal(daily_returns(prices), prices.pct_change().dropna())
+
     def test_portfolio_volatility(self):
         """Test portfolio volatility."""
         returns = [0.01, -0.02, 0.015, -0.01, 0.012]
@@ -311,6 +343,23 @@ class TestQuickWinsAnalytics:
         assert len(report["losers"]) == 2
         assert report["winners"][0]["pnl_pct"] > report["losers"][0]["pnl_pct"]
 
+    def test_winners_losers_ties_and_skipped_entries(self):
+        """Test ranking keeps input order for ties and skips zero entries."""
+        positions = {
+            "A": {"entry_price": 100, "current_price": 110},
+            "B": {"entry_price": 100, "current_price": 90},
+            "C": {"entry_price": 0, "current_price": 50},
+            "D": {"entry_price": 100, "current_price": 110},
+            "E": {"entry_price": 100, "current_price": 90},
+            "F": {"entry_price": 100, "current_price": 100},
+        }
+
+        report = QuickWinsAnalytics.winners_losers_report(positions, top_n=2)
+
+        assert [w["ticker"] for w in report["winners"]] == ["A", "D"]
+        assert [l["ticker"] for l in report["losers"]] == ["E", "B"]
+        assert report["winners"][0]["pnl_dollars"] == 10.0
+
     def test_correlation_matrix(self):
         """Test correlation matrix summary."""
         dates = pd.date_range("2023-01-01", periods=100)
@@ -17,7 +17,7 @@ from unittest.mock import patch
 
 import pytest
 
-from src.cache import CIKCache
+from src.cache import CIKCache, ResponseCache
 
 
 class TestCIKCacheBasicOperations:
@@ -429,5 +429,44 @@ class TestCIKCacheIntegration:
                 assert stats["valid_entries"] == 5
 
 
+class TestResponseCache:
+    """Test SEC response caching."""
+
+    def setup_method(self):
+        """Setup test environment."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.patcher = patch("src.cache.RESPONSE_CACHE_DIR", self.temp_dir)
+        self.patcher.start()
+
+    def teardown_method(self):
+        """Cleanup test environment."""
+        self.patcher.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_set_and_get_response(self):
+        """Test a cached response is returned per URL."""
+        ResponseCache.set("https://example.com/a.json", {"facts": {"n": 1}})
+
+        assert ResponseCache.get("https://example.com/a.json") == {"facts": {"n": 1}}
+        assert ResponseCache.get("https://example.com/b.json") is None
+
+    def test_expired_response(self):
+        """Test responses older than the TTL are treated as missing."""
+        url = "https://example.com/a.json"
+        ResponseCache.set(url, {"n": 1})
+        old = datetime.now().timestamp() - 120
+        os.utime(ResponseCache._path(url), (old, old))
+
+        assert ResponseCache.get(url, ttl_seconds=60) is None
+        assert ResponseCache.get(url, ttl_seconds=300) == {"n": 1}
+
+    def test_clear(self):
+        """Test clearing removes cached responses."""
+        ResponseCache.set("https://example.com/a.json", {"n": 1})
+        ResponseCache.clear()
+
+        assert ResponseCache.get("https://example.com/a.json") is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -7,7 +7,13 @@ import pandas as pd
 
 import pytest
 
-from src.portfolio_technical import TechnicalAnalyzer
+from src.portfolio_technical import (
+    TechnicalAnalyzer,
+    _ewm_mean,
+    _obv_impl,
+    _rolling_mean,
+    _rolling_std,
+)
 
 
 @pytest.fixture
@@ -324,3 +330,87 @@ class TestCalculateAllIndicators:
 
         # Should complete in less than 1 second for 100 data points
         assert elapsed < 1.0
+
+
+class TestIndicatorKernels:
+    """Test ndarray kernels against the pandas reference implementations."""
+
+    @pytest.mark.parametrize("window", [1, 5, 20])
+    def test_rolling_kernels_match_pandas(self, sample_ohlcv_data, window):
+        """Test rolling mean/std match pandas rolling."""
+        close = sample_ohlcv_data["Close"]
+        arr = close.to_numpy()
+
+        np.testing.assert_allclose(
+            _rolling_mean(arr, window), close.rolling(window).mean(), rtol=1e-10
+        )
+        np.testing.assert_allclose(
+            _rolling_std(arr, window), close.rolling(window).std(), rtol=1e-8
+        )
+
+    def test_rolling_kernel_short_input(self):
+        """Test windows longer than the input yield all-NaN."""
+        assert np.isnan(_rolling_mean(np.arange(5.0), 20)).all()
+
+    @pytest.mark.parametrize("span", [9, 12, 26])
+    def test_ewm_kernel_matches_pandas(self, sample_ohlcv_data, span):
+        """Test EWM kernel matches pandas ewm(span).mean()."""
+        close = sample_ohlcv_data["Close"]
+
+        np.testing.assert_allclose(
+            _ewm_mean(close.to_numpy(), span), close.ewm(span=span).mean(), rtol=1e-10
+        )
+
+    def test_ewm_kernel_with_gaps(self, sample_ohlcv_data):
+        """Test EWM kernel keeps pandas semantics around missing prices."""
+        close = sample_ohlcv_data["Close"].copy()
+        close.iloc[10] = np.nan
+
+        np.testing.assert_allclose(
+            _ewm_mean(close.to_numpy(), 12), close.ewm(span=12).mean(), rtol=1e-10
+        )
+
+    def test_calculate_all_batch_matches_calculate_all(self, sample_ohlcv_data):
+        """Test batched EMAs give the same frames as per-security runs."""
+        frames = [
+            sample_ohlcv_data,
+            sample_ohlcv_data.iloc[:40] * 1.5,
+            sample_ohlcv_data.iloc[:10],
+            sample_ohlcv_data.iloc[0:0],
+        ]
+
+        batch = TechnicalAnalyzer.calculate_all_batch(frames)
+
+        assert len(batch) == len(frames)
+        for frame, result in zip(frames, batch):
+            pd.testing.assert_frame_equal(result, TechnicalAnalyzer.calculate_all(frame))
+
+    def test_calculate_all_stacked_matches_concat(self, sample_ohlcv_data):
+        """Test preallocated stacking equals concatenating per-security frames."""
+        frames = [
+            sample_ohlcv_data,
+            sample_ohlcv_data.iloc[:30] * 2.0,
+            sample_ohlcv_data.iloc[:10],
+        ]
+
+        stacked = TechnicalAnalyzer.calculate_all_stacked(frames)
+        expected = pd.concat(TechnicalAnalyzer.calculate_all_batch(frames), ignore_index=True)
+
+        pd.testing.assert_frame_equal(stacked, expected[stacked.columns])
+        assert set(stacked.columns) == set(expected.columns)
+
+    def test_obv_matches_reference_loop(self):
+        """Test branchless OBV matches the up/down/flat recurrence."""
+        close = np.array([10.0, 11.0, 11.0, 9.0, np.nan, 12.0, 13.0])
+        volume = np.array([100.0, 200.0, 300.0, 400.0, 500.0, 600.0, 700.0])
+
+        expected = [volume[0]]
+        for i in range(1, len(close)):
+            if close[i] > close[i - 1]:
+                expected.append(expected[-1] + volume[i])
+            elif close[i] < close[i - 1]:
+                expected.append(expected[-1] - volume[i])
+            else:
+                expected.append(expected[-1])
+
+        np.testing.assert_array_equal(_obv_impl(close, volume), expected)
@@ -0,0 +1,102 @@
+"""
+Unit tests for Streamlit-compatible technical analysis.
+"""
+
+import numpy as np
+import pandas as pd
+
+import pytest
+
+from src.portfolio_technical_streamlit import (
+    calculate_indicators_for_symbols,
+    calculate_indicators_parallel,
+    calculate_indicators_polars,
+    calculate_technical_streamlit,
+    group_prices_by_symbol,
+)
+
+
+class RecordingDB:
+    """Minimal ParquetDB stand-in that records upserted frames."""
+
+    def __init__(self):
+        self.saved = []
+
+    def upsert_technical_analysis(self, df):
+        self.saved.append(df)
+
+
+@pytest.fixture
+def multi_symbol_prices():
+    """Create shuffled price data for two symbols."""
+    periods = 60
+    rows = []
+    for symbol, start in [("AAPL", 100.0), ("MSFT", 300.0)]:
+        closes = start + np.cumsum(np.random.normal(0, 1, periods))
+        for i, close in enumerate(closes):
+            rows.append(
+                {
+                    "symbol": symbol,
+                    "timestamp": pd.Timestamp("2024-01-01") + pd.Timedelta(days=i),
+                    "close_price": close,
+                    "Close": close,
+                    "Volume": 1_000_000 + i,
+                }
+            )
+
+    return pd.DataFrame(rows).sample(frac=1.0, random_state=0)
+
+
+class TestGroupPricesBySymbol:
+    """Test per-symbol grouping."""
+
+    def test_groups_sorted_by_timestamp(self, multi_symbol_prices):
+        """Test each group is timestamp-ordered and holds one symbol."""
+        groups = group_prices_by_symbol(multi_symbol_prices)
+
+        assert set(groups) == {"AAPL", "MSFT"}
+        for symbol, symbol_prices in groups.items():
+            assert (symbol_prices["symbol"] == symbol).all()
+            assert symbol_prices["timestamp"].is_monotonic_increasing
+
+
+class TestCalculateTechnicalStreamlit:
+    """Test the Streamlit technical analysis entry point."""
+
+    def test_parallel_matches_sequential(self, multi_symbol_prices):
+        """Test process-pool results equal the single-worker results."""
+        groups = group_prices_by_symbol(multi_symbol_prices)
+
+        sequential, sequential_symbols = calculate_indicators_parallel(groups, max_workers=1)
+        parallel, parallel_symbols = calculate_indicators_parallel(groups, max_workers=2)
+
+        assert sorted(parallel_symbols) == sorted(sequential_symbols) == ["AAPL", "MSFT"]
+        pd.testing.assert_frame_equal(
+            parallel.sort_values(["symbol", "timestamp"], ignore_index=True),
+            sequential.sort_values(["symbol", "timestamp"], ignore_index=True),
+        )
+
+    def test_missing_symbol_reported_as_failed(self, multi_symbol_prices):
+        """Test symbols without prices are failed and the rest saved."""
+        holdings_df = pd.DataFrame({"sym": ["AAPL", "MSFT", "NOPE"]})
+        db = RecordingDB()
+
+        processed, failed = calculate_technical_streamlit(
+            holdings_df, db=db, prices_df=multi_symbol_prices, max_workers=1
+        )
+
+        assert processed == 2
+        assert failed == ["NOPE"]
+        assert len(db.saved) == 1
+        assert "rsi" in db.saved[0].columns
+
+    def test_polars_matches_pandas(self, multi_symbol_prices):
+        """Test the opt-in Polars path matches the pandas indicators."""
+        pytest.importorskip("polars")
+        groups = group_prices_by_symbol(multi_symbol_prices)
+
+        expected, expected_symbols = calculate_indicators_for_symbols(groups)
+        result, result_symbols = calculate_indicators_polars(groups)
+
+        assert result_symbols == expected_symbols
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False, rtol=1e-5)
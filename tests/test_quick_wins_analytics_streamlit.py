@@ -0,0 +1,194 @@
+"""
+Unit tests for Streamlit-compatible quick wins analytics.
+"""
+
+import numpy as np
+import pandas as pd
+
+import pytest
+from unittest.mock import patch
+
+from src import quick_wins_analytics_streamlit
+from src.quick_wins_analytics_streamlit import (
+    calculate_mean_reversion_analysis,
+    calculate_momentum_analysis,
+    calculate_portfolio_beta_analysis,
+    calculate_sector_rotation_analysis,
+    run_analyses,
+)
+
+
+@pytest.fixture
+def holdings_df():
+    """Create holdings exercising each return % fallback."""
+    return pd.DataFrame(
+        {
+            "sym": ["AAPL", "MSFT", "GOOGL", "TSLA"],
+            "qty": [10.0, 5.0, 2.0, 1.0],
+            "bep": [100.0, 200.0, 0.0, 50.0],
+            "current_price": [120.0, 210.0, 90.0, 40.0],
+            "pnl_absolute": [200.0, 50.0, 180.0, -10.0],
+            "pnl_percent": [np.nan, 5.0, np.nan, np.nan],
+            "current_value": [1200.0, 1050.0, 180.0, 40.0],
+            "asset": ["EQ", "EQ", "MF", "EQ"],
+        }
+    )
+
+
+class TestCalculateMomentumAnalysis:
+    """Test momentum signals from holdings data."""
+
+    def test_return_fallbacks_and_signals(self, holdings_df):
+        """Test pnl_percent wins per row, falling back to price returns."""
+        momentum_df, stats = calculate_momentum_analysis(holdings_df)
+
+        returns = dict(zip(momentum_df["Symbol"], momentum_df["Return %"]))
+        signals = dict(zip(momentum_df["Symbol"], momentum_df["Signal"]))
+
+        assert returns == {"AAPL": 20.0, "MSFT": 5.0, "GOOGL": 0.0, "TSLA": -20.0}
+        assert signals == {
+            "AAPL": "Strong Uptrend",
+            "MSFT": "Uptrend",
+            "GOOGL": "Downtrend",
+            "TSLA": "Downtrend",
+        }
+        assert list(momentum_df["Symbol"]) == ["AAPL", "MSFT", "GOOGL", "TSLA"]
+        assert isinstance(momentum_df["Signal"].dtype, pd.CategoricalDtype)
+        assert stats["uptrend_count"] == 2
+        assert stats["downtrend_count"] == 2
+        assert stats["best_performer"] == "AAPL"
+        assert stats["worst_performer"] == "TSLA"
+
+    def test_absolute_pnl_fallback(self, holdings_df):
+        """Test P&L over entry value is used without price columns."""
+        momentum_df, _ = calculate_momentum_analysis(
+            holdings_df.drop(columns=["current_price", "pnl_percent"])
+        )
+
+        returns = dict(zip(momentum_df["Symbol"], momentum_df["Return %"]))
+
+        assert returns == {"AAPL": 20.0, "MSFT": 5.0, "GOOGL": 0.0, "TSLA": -20.0}
+        assert (momentum_df["Current Price"] == 0).all()
+
+
+class TestCalculateMeanReversionAnalysis:
+    """Test mean reversion signals from P&L data."""
+
+    def test_threshold_boundaries(self):
+        """Test thresholds are exclusive and missing P&L is Normal Range."""
+        pnl = [-60.0, -50.0, -20.0, 20.0, 50.0, 60.0, np.nan]
+        holdings_df = pd.DataFrame({"sym": list("ABCDEFG"), "pnl_percent": pnl})
+
+        reversion_df, stats = calculate_mean_reversion_analysis(holdings_df)
+        signals = dict(zip(reversion_df["Symbol"], reversion_df["Signal"]))
+
+        assert signals == {
+            "A": "Strong Oversold",
+            "B": "Oversold",
+            "C": "Normal Range",
+            "D": "Normal Range",
+            "E": "Overbought",
+            "F": "Strong Overbought",
+            "G": "Normal Range",
+        }
+        assert stats["oversold_count"] == 2
+        assert stats["overbought_count"] == 2
+        assert stats["normal_count"] == 3
+
+
+class TestCalculateSectorRotationAnalysis:
+    """Test asset class aggregation."""
+
+    def test_grouped_totals(self, holdings_df):
+        """Test per-asset sums, derived P&L and value ordering."""
+        sector_df, stats = calculate_sector_rotation_analysis(
+            holdings_df.drop(columns=["pnl_absolute"])
+        )
+
+        assert list(sector_df["Asset Class"]) == ["EQ", "MF"]
+        eq = sector_df.iloc[0]
+        assert eq["Value"] == pytest.approx(2290.0)
+        assert eq["Cost"] == pytest.approx(2050.0)
+        assert eq["P&L"] == pytest.approx(240.0)
+        assert eq["Positions"] == 3
+        assert stats["top_sector"] == "EQ"
+        assert stats["num_sectors"] == 2
+
+
+class TestCalculatePortfolioBetaAnalysis:
+    """Test portfolio beta from holding returns."""
+
+    def test_value_weighted_beta(self):
+        """Test beta is the weighted over equal-weighted return ratio."""
+        holdings_df = pd.DataFrame(
+            {
+                "sym": ["AAPL", "MSFT"],
+                "pnl_percent": [8.0, 2.0],
+                "current_value": [3000.0, 1000.0],
+            }
+        )
+
+        metrics = calculate_portfolio_beta_analysis(holdings_df)
+
+        assert metrics["portfolio_return"] == pytest.approx(6.5)
+        assert metrics["avg_return"] == pytest.approx(5.0)
+        assert metrics["beta"] == pytest.approx(1.3)
+        assert metrics["risk_profile"] == "Aggressive"
+        assert metrics["volatility"] == pytest.approx(3.0)
+
+    def test_equal_returns_have_zero_volatility(self):
+        """Test identical returns give zero volatility and neutral beta."""
+        holdings_df = pd.DataFrame(
+            {
+                "sym": ["AAPL", "MSFT", "GOOGL"],
+                "pnl_percent": [0.1, 0.1, 0.1],
+                "current_value": [1000.0, 2000.0, 3000.0],
+            }
+        )
+
+        metrics = calculate_portfolio_beta_analysis(holdings_df)
+
+        assert metrics["volatility"] == 0.0
+        assert metrics["beta"] == 1.0
+        assert metrics["sharpe_ratio"] == 0
+        assert metrics["risk_profile"] == "Moderate"
+
+
+class TestRunAnalyses:
+    """Test the combined analysis dispatch."""
+
+    def test_matches_individual_analyses(self, holdings_df):
+        """Test each selected kind equals calling its analysis directly."""
+        results = run_analyses(holdings_df, kinds=("momentum", "beta"))
+
+        assert list(results) == ["momentum", "beta"]
+        momentum_df, momentum_stats = calculate_momentum_analysis(holdings_df)
+        pd.testing.assert_frame_equal(results["momentum"][0], momentum_df)
+        assert results["momentum"][1] == momentum_stats
+        assert results["beta"] == calculate_portfolio_beta_analysis(holdings_df)
+
+    def test_return_pct_computed_once(self, holdings_df):
+        """Test momentum and beta share one return % computation per run."""
+        with patch.object(
+            quick_wins_analytics_streamlit,
+            "_compute_return_pct",
+            wraps=quick_wins_analytics_streamlit._compute_return_pct,
+        ) as compute:
+            run_analyses(holdings_df, kinds=("momentum", "beta"))
+
+        assert compute.call_count == 1
+
+    def test_in_place_edits_are_seen(self, holdings_df):
+        """Test a holdings frame edited between runs is not served stale results."""
+        before = run_analyses(holdings_df, kinds=("beta",))["beta"]
+        holdings_df.loc[:, "pnl_percent"] = [50.0, -20.0, 5.0, 1.0]
+        after = run_analyses(holdings_df, kinds=("beta",))["beta"]
+
+        assert after == calculate_portfolio_beta_analysis(holdings_df)
+        assert after["avg_return"] != before["avg_return"]
+
+    def test_unknown_kind_rejected(self, holdings_df):
+        """Test unknown analysis kinds raise ValueError."""
+        with pytest.raises(ValueError, match="nope"):
+            run_analyses(holdings_df, kinds=("momentum", "nope"))
+
@@ -8,11 +8,19 @@ Tests the newly implemented quick wins:
 - Mean reversion signals
 """
 
+import os
+
 import numpy as np
 import pandas as pd
 import pytest
 
+from src.parquet_db import ParquetDB
 from src.quick_wins_analytics import QuickWinsAnalytics
+from src.quick_wins_flows import (
+    _coalesce_price_fields,
+    _read_prices_table,
+    _table_fingerprint,
+)
 
 
 @pytest.fixture
@@ -201,6 +209,103 @@ class TestMeanReversionSignals:
         total_signals = len(result["all_signals"])
         assert total_signals > 0
 
+    def test_z_score_matches_rolling_window(self, sample_prices_df):
+        """Test z-scores use the trailing window of valid prices."""
+        prices_df = sample_prices_df.copy()
+        prices_df.iloc[90:93, 0] = np.nan
+        prices_df.iloc[:85, 1] = np.nan
+
+        result = QuickWinsAnalytics.mean_reversion_signals(prices_df, period=20)
+
+        for ticker in ["AAPL", "GOOGL", "TSLA"]:
+            prices = prices_df[ticker].dropna()
+            ma = prices.rolling(20).mean().iloc[-1]
+            std = prices.rolling(20).std().iloc[-1]
+            expected = (prices.iloc[-1] - ma) / std
+            assert result["all_signals"][ticker]["z_score"] == pytest.approx(expected)
+
+        # Fewer than `period` valid prices
+        assert "MSFT" not in result["all_signals"]
+
+    def test_records_match_dict_output(self, sample_prices_df):
+        """Test as_records returns slotted records with the same content."""
+        expected = QuickWinsAnalytics.mean_reversion_signals(sample_prices_df, period=20)
+        result = QuickWinsAnalytics.mean_reversion_signals(
+            sample_prices_df, period=20, as_records=True
+        )
+
+        assert not hasattr(result["all_signals"]["AAPL"], "__dict__")
+        assert {t: s.as_dict() for t, s in result["all_signals"].items()} == expected["all_signals"]
+        assert result["buy_candidates"] == expected["buy_candidates"]
+        assert result["sell_candidates"] == expected["sell_candidates"]
+
+
+
+class TestPricesTableCache:
+    """Test the fingerprint-keyed prices table cache."""
+
+    @staticmethod
+    def _price_row(day, close):
+        ts = pd.Timestamp("2025-01-01") + pd.Timedelta(days=day)
+        return pd.DataFrame({
+            "timestamp": [ts],
+            "symbol": ["AAPL"],
+            "currency": ["USD"],
+            "open_price": [close],
+            "high_price": [close],
+            "low_price": [close],
+            "close_price": [close],
+            "volume": [1000],
+            "frequency": ["DAILY"],
+            "data_source": ["test"],
+            "created_at": [ts],
+            "updated_at": [ts],
+        })
+
+    def test_reread_only_after_rewrite(self, tmp_path):
+        """Test the table is reused until a partition is rewritten."""
+        db = ParquetDB(root_path=str(tmp_path))
+        table_path = os.path.join(db.root_path, "prices")
+        db.upsert_prices(self._price_row(0, 100.0))
+        db.upsert_prices(self._price_row(1, 101.0))
+
+        fingerprint = _table_fingerprint(table_path)
+        first = _read_prices_table(db.root_path, fingerprint)
+
+        assert _read_prices_table(db.root_path, _table_fingerprint(table_path)) is first
+
+        os.utime(
+            os.path.join(table_path, "year=2025", "month=1", "day=2", "0.parquet"),
+            ns=(fingerprint[1] + 10**9, fingerprint[1] + 10**9),
+        )
+        reread = _read_prices_table(db.root_path, _table_fingerprint(table_path))
+
+        assert _table_fingerprint(table_path) != fingerprint
+        assert reread is not first
+        assert len(reread) == 2
+
+
+class TestCoalescePriceFields:
+    """Test per-symbol field selection from price data."""
+
+    def test_priority_and_holdings_order(self):
+        """Test the first available field wins and holdings order is kept."""
+        prices_dict = {
+            "AAPL": {"price": 150.0},
+            "MSFT": {"price_usd": 300.0, "price_eur": 280.0},
+            "TSLA": {"return_pct": 2.5, "price": 200.0},
+            "GOOGL": {"volume": 1000},
+            "NVDA": 400.0,
+        }
+
+        result = _coalesce_price_fields(
+            prices_dict,
+            ["TSLA", "AAPL", "MSFT", "GOOGL", "NVDA", "AMZN"],
+            ("return_pct", "price", "price_usd", "price_eur"),
+        )
+
+        assert result.to_dict() == {"TSLA": 2.5, "AAPL": 150.0, "MSFT": 300.0}
+        assert list(result.index) == ["TSLA", "AAPL", "MSFT"]
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -17,6 +17,7 @@ from datetime import datetime, timedelta
 from src.tax_optimization import (
     TaxOptimizationEngine,
     TaxLot,
+    TaxLotBatch,
     TaxHarvestingOpportunity
 )
 
@@ -92,6 +93,16 @@ class TestUnrealizedLossIdentification:
         # All should be losses (negative)
         for loss in losses:
             assert loss.unrealized_gain_loss < 0
+    
+    def test_loss_batch_matches_lots(self, engine, sample_holdings):
+        """Test the columnar batch holds the same lots in the same order."""
+        batch = engine.identify_unrealized_loss_batch(sample_holdings)
+        
+        assert isinstance(batch, TaxLotBatch)
+        assert list(batch.symbol) == ['AAPL', 'TSLA', 'BRK.B']
+        assert list(batch.holding_period) == ['long', 'short', 'short']
+        assert batch.to_list() == engine.identify_unrealized_losses(sample_holdings)
+        assert batch.take(slice(1, None)).to_list()[0].symbol == 'TSLA'
 
 
 class TestTaxSavingsCalculation:
@@ -170,6 +181,16 @@ class TestWashSaleDetection:
         
         # Similar tech stocks - moderate risk
         assert 0.1 < risk < 0.5
+    
+    def test_batch_takes_lowest_risk(self, engine):
+        """Test batch assessment keeps each symbol's lowest-risk replacement."""
+        risks = engine.assess_wash_sale_risk_batch(
+            ['AAPL', 'AAPL', 'BRK.B', 'XOM'],
+            [100, 50, 10, 5],
+            [['MSFT'], ['MSFT', 'GOOGL'], ['BRK.A'], []]
+        )
+        
+        np.testing.assert_allclose(risks, [0.3, 0.0, 0.95, 0.1])
 
 
 class TestReplacementSuggestions:
@@ -304,9 +325,27 @@ class TestTaxReportFileGeneration:
         
         # Generate Parquet
         output_file = engine.save_tax_analysis_parquet(report, str(tmp_path))
-        
+
         assert isinstance(output_file, str)
 
+    def test_files_follow_edited_opportunities(self, engine, sample_holdings, tmp_path):
+        """Test both files write the report's current opportunities."""
+        import pyarrow.parquet as pq
+
+        now = pd.Timestamp('2024-01-31')
+        report = engine.generate_tax_harvesting_report(sample_holdings)
+        assert len(report['opportunities']) > 1
+        report['opportunities'] = report['opportunities'][:1]
+        columns = engine.opportunity_columns(report)
+
+        csv_file = engine.generate_tax_report_csv(report, str(tmp_path), now, columns)
+        engine.save_tax_analysis_parquet(report, str(tmp_path), now, columns)
+
+        symbol = report['opportunities'][0]['symbol']
+        assert pd.read_csv(csv_file)['symbol'].tolist() == [symbol, 'SUMMARY']
+        table = pq.read_table(tmp_path / "tax_optimization" / "opportunities_20240131.parquet")
+        assert table.column('symbol').to_pylist() == [symbol]
+
 
 class TestTradeExecution:
     """Test tax harvest trade execution."""
@@ -0,0 +1,143 @@
+"""
+Tests for shared utility helpers.
+"""
+
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.constants import USER_AGENTS
+from src.utils import (
+    AsyncRateLimiter,
+    get_next_user_agent,
+    make_request_with_backoff,
+    make_request_with_backoff_async,
+    validate_cik,
+    validate_ticker,
+)
+
+
+def _response(status_code, payload=None):
+    """Create a mock HTTP response."""
+    response = MagicMock(status_code=status_code)
+    response.content = json.dumps(payload).encode()
+    response.json.return_value = payload
+    return response
+
+
+class TestGetNextUserAgent:
+    """Test user agent rotation."""
+
+    def test_rotation_wraps_around(self):
+        """Test consecutive calls walk the whole list and start over."""
+        start = USER_AGENTS.index(get_next_user_agent())
+        agents = [get_next_user_agent() for _ in range(len(USER_AGENTS))]
+
+        expected = USER_AGENTS[start + 1:] + USER_AGENTS[:start + 1]
+        assert agents == expected
+
+
+class TestMakeRequestWithBackoff:
+    """Test HTTP retries with backoff."""
+
+    @patch("src.utils.time.sleep")
+    @patch("src.utils._get_session")
+    def test_rate_limited_then_success(self, mock_session, mock_sleep):
+        """Test 429 responses back off ten times longer before retrying."""
+        mock_session.return_value.get.side_effect = [
+            _response(429),
+            _response(200, {"ok": True}),
+        ]
+
+        result = make_request_with_backoff(
+            "https://example.com", initial_delay=1.0, rate_limit_delay=0
+        )
+
+        assert result == {"ok": True}
+        assert mock_sleep.call_args_list[-1].args == (10.0,)
+
+    @patch("src.utils._get_session")
+    def test_async_backoff_overlaps(self, mock_session):
+        """Test concurrent async requests wait out their backoff together."""
+        mock_session.return_value.get.side_effect = [
+            _response(403),
+            _response(403),
+            _response(200, {"n": 1}),
+            _response(200, {"n": 1}),
+        ]
+        waits = []
+
+        async def fake_sleep(seconds):
+            waits.append(seconds)
+
+        async def fetch_all():
+            semaphore = asyncio.Semaphore(2)
+            return await asyncio.gather(*[
+                make_request_with_backoff_async(
+                    "https://example.com", initial_delay=0.5, semaphore=semaphore
+                )
+                for _ in range(2)
+            ])
+
+        with patch("src.utils.asyncio.sleep", fake_sleep):
+            results = asyncio.run(fetch_all())
+
+        assert results == [{"n": 1}, {"n": 1}]
+        assert waits == [0.5, 0.5]
+
+
+class TestAsyncRateLimiter:
+    """Test the token bucket rate limiter."""
+
+    def test_burst_then_steady_rate(self):
+        """Test a full bucket allows a burst, then one token per interval."""
+        clock = [100.0]
+        waits = []
+
+        async def fake_sleep(seconds):
+            waits.append(seconds)
+            clock[0] += seconds
+
+        async def acquire_all():
+            limiter = AsyncRateLimiter(2, period=1.0)
+            for _ in range(4):
+                async with limiter:
+                    pass
+
+        with patch("src.utils.time.monotonic", lambda: clock[0]), \
+                patch("src.utils.asyncio.sleep", fake_sleep):
+            asyncio.run(acquire_all())
+
+        assert waits == [pytest.approx(0.5), pytest.approx(0.5)]
+        assert clock[0] == pytest.approx(101.0)
+
+
+class TestValidateTicker:
+    """Test ticker format validation."""
+
+    @pytest.mark.parametrize("ticker", ["A", "aapl", " MSFT ", "GOOGL"])
+    def test_valid_tickers(self, ticker):
+        """Test 1-5 letters are accepted regardless of case or padding."""
+        assert validate_ticker(ticker)
+
+    @pytest.mark.parametrize("ticker", ["", "   ", "BRK.B", "ABCDEF", "AB1", None, 5])
+    def test_invalid_tickers(self, ticker):
+        """Test empty, long, non-alphabetic and non-string tickers are rejected."""
+        assert not validate_ticker(ticker)
+
+
+class TestValidateCik:
+    """Test CIK format validation."""
+
+    def test_zero_padded_cik(self):
+        """Test a 10-digit CIK is accepted."""
+        assert validate_cik("0000320193")
+
+    @pytest.mark.parametrize(
+        "cik", ["", "320193", "00003201930", "000032019a", "０１２３４５６７８９", None]
+    )
+    def test_invalid_ciks(self, cik):
+        """Test short, long, non-digit and non-ASCII CIKs are rejected."""
+        assert not validate_cik(cik)
@@ -18,10 +18,16 @@ import sys
 # Add parent directory to path to enable package imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.exceptions import CIKNotFoundError, ConfigurationError
 from src.xbrl import (
+    _fundamentals_frame,
+    _load_ticker_cik_map,
+    _prefetch_facts,
+    _sec_max_concurrency,
     fetch_company_cik,
     fetch_sec_filing_index,
     fetch_xbrl_document,
+    fetch_xbrl_frames,
     parse_xbrl_fundamentals,
     save_xbrl_data_to_parquet,
 )
@@ -69,6 +75,190 @@ class TestCIKExtraction:
 # Test Filing Index Retrieval (skipped - see test_sec_scraper.py)
 # ============================================================================
 
+class TestTickerCIKMap:
+    """Test the memoized SEC company tickers index."""
+
+    @patch("src.xbrl.ResponseCache.set")
+    @patch("src.xbrl.ResponseCache.get", return_value=None)
+    @patch("src.xbrl.make_request_with_backoff")
+    def test_downloaded_once_and_indexed(self, mock_request, mock_get, mock_set):
+        """Test the tickers file is fetched once and keyed by upper ticker."""
+        mock_request.return_value = {
+            "0": {"ticker": "aapl", "cik_str": 320193},
+            "1": {"ticker": "MSFT", "cik_str": 789019},
+            "2": {"ticker": "AAPL", "cik_str": 1},
+        }
+        _load_ticker_cik_map.cache_clear()
+        try:
+            first = _load_ticker_cik_map()
+            second = _load_ticker_cik_map()
+        finally:
+            _load_ticker_cik_map.cache_clear()
+
+        assert mock_request.call_count == 1
+        assert second is first
+        assert first == {"AAPL": "0000320193", "MSFT": "0000789019"}
+
+    @patch("src.xbrl.ResponseCache.get")
+    @patch("src.xbrl.make_request_with_backoff", return_value=None)
+    def test_expired_copy_used_when_sec_unavailable(self, mock_request, mock_get):
+        """Test a failed download falls back to the expired cached file."""
+        stale = {"0": {"ticker": "AAPL", "cik_str": 320193}}
+        mock_get.side_effect = lambda url, ttl_seconds: (
+            stale if ttl_seconds == float("inf") else None
+        )
+        _load_ticker_cik_map.cache_clear()
+        try:
+            ticker_ciks = _load_ticker_cik_map()
+        finally:
+            _load_ticker_cik_map.cache_clear()
+
+        assert mock_request.call_count == 1
+        assert ticker_ciks == {"AAPL": "0000320193"}
+
+
+class TestSECRequestMode:
+    """Test the configured SEC concurrency mode."""
+
+    @pytest.mark.parametrize(
+        "mode,expected", [("normal", 8), ("CAUTION", 4), ("crawl", 1)]
+    )
+    def test_mode_limits(self, monkeypatch, mode, expected):
+        """Test each mode maps to its in-flight request limit."""
+        monkeypatch.setenv("SEC_REQUEST_MODE", mode)
+        assert _sec_max_concurrency() == expected
+
+    def test_unknown_mode_rejected(self, monkeypatch):
+        """Test an unknown mode raises ConfigurationError."""
+        monkeypatch.setenv("SEC_REQUEST_MODE", "turbo")
+        with pytest.raises(ConfigurationError, match="turbo"):
+            _sec_max_concurrency()
+
+
+class TestPrefetchFacts:
+    """Test the background company facts download pipeline."""
+
+    def test_yields_in_ticker_order(self):
+        """Test slimmed results come back in ticker order with per-ticker errors."""
+        ciks = {"AAPL": "0000320193", "MSFT": "0000789019"}
+        submissions = {
+            "filings": {
+                "recent": {
+                    "form": ["10-K"],
+                    "accessionNumber": ["0000320193-23-000106"],
+                    "filingDate": ["2023-11-03"],
+                }
+            }
+        }
+
+        async def fake_request(url, **kwargs):
+            if "companyfacts" in url:
+                return {
+                    "entityName": url,
+                    "facts": {
+                        "dei": {"EntityCommonStockSharesOutstanding": {}},
+                        "us-gaap": {"Assets": {"units": {}}, "Goodwill": {"units": {}}},
+                    },
+                }
+            return submissions
+
+        with patch("src.xbrl.make_request_with_backoff_async", fake_request), \
+                patch("src.xbrl._load_ticker_cik_map", return_value=ciks), \
+                patch("src.xbrl.ResponseCache") as mock_responses, \
+                patch("src.xbrl.CIKCache") as mock_cache:
+            mock_responses.get.return_value = None
+            mock_cache.get.return_value = None
+            results = list(
+                _prefetch_facts(["AAPL", "NOPE", "MSFT"], "10-K", max_concurrency=2)
+            )
+
+        assert [ticker for ticker, _ in results] == ["AAPL", "NOPE", "MSFT"]
+        assert results[0][1]["entityName"].endswith("CIK0000320193.json")
+        assert isinstance(results[1][1], CIKNotFoundError)
+        assert results[2][1]["entityName"].endswith("CIK0000789019.json")
+        # Only the tags the parser reads are kept
+        assert results[0][1]["facts"] == {"us-gaap": {"Assets": {"units": {}}}}
+
+    def test_loaded_ticker_map_skips_request_limits(self):
+        """Test a CIK cache miss does not take a slot once the map is loaded."""
+        import asyncio
+        from src.xbrl import _SECRequestLimits, _fetch_ticker_facts_async
+
+        class Untouchable:
+            async def __aenter__(self):
+                raise AssertionError("request limits taken for a memoized map")
+
+            async def __aexit__(self, *exc):
+                return False
+
+        async def fake_request(url, **kwargs):
+            if "companyfacts" in url:
+                return {"facts": {}}
+            return {
+                "filings": {
+                    "recent": {
+                        "form": ["10-K"],
+                        "accessionNumber": ["0000320193-23-000106"],
+                        "filingDate": ["2023-11-03"],
+                    }
+                }
+            }
+
+        loader = Mock(return_value={"AAPL": "0000320193"})
+        loader.cache_info.return_value.currsize = 1
+
+        async def run():
+            limits = _SECRequestLimits(
+                semaphore=Untouchable(),
+                rate_limiter=Untouchable(),
+                ticker_map_lock=asyncio.Lock(),
+            )
+            return await _fetch_ticker_facts_async("AAPL", "10-K", limits)
+
+        with patch("src.xbrl.make_request_with_backoff_async", fake_request), \
+                patch("src.xbrl._load_ticker_cik_map", loader), \
+                patch("src.xbrl.ResponseCache") as mock_responses, \
+                patch("src.xbrl.CIKCache") as mock_cache:
+            mock_responses.get.return_value = None
+            mock_cache.get.return_value = None
+            assert "facts" in asyncio.run(run())
+
+        loader.assert_called_once_with()
+
+    def test_closing_early_stops_producer(self):
+        """Test the background thread exits when the caller stops consuming."""
+        import threading
+
+        async def fake_fetch(ticker, filing_type, limits):
+            return {"facts": {}}
+
+        before = threading.active_count()
+        with patch("src.xbrl._fetch_ticker_facts_async", fake_fetch):
+            docs = _prefetch_facts(
+                [f"T{i}" for i in range(20)], "10-K", max_concurrency=2, slots=1
+            )
+            assert next(docs)[0] == "T0"
+            docs.close()
+
+            for _ in range(50):
+                if threading.active_count() <= before:
+                    break
+                threading.Event().wait(0.1)
+
+        assert threading.active_count() <= before
+
+    def test_producer_failure_is_raised(self):
+        """Test a producer killed by a BaseException does not hang the caller."""
+        import asyncio
+
+        async def cancelled(ticker, filing_type, limits):
+            raise asyncio.CancelledError()
+
+        with patch("src.xbrl._fetch_ticker_facts_async", cancelled):
+            with pytest.raises(asyncio.CancelledError):
+                list(_prefetch_facts(["AAPL", "MSFT"], "10-K", max_concurrency=2))
+
+
 class TestFilingIndexRetrieval:
     """Test SEC filing index retrieval."""
     
@@ -214,6 +404,32 @@ class TestXBRLParsing:
         # Current ratio = 150B / 100B = 1.5
         assert result["current_ratio"] == pytest.approx(1.5, rel=1e-5)
     
+    def test_parse_xbrl_us_gaap_alternate_tags(self):
+        """Test US GAAP tag names used when the primary tags are absent."""
+        def facts(val):
+            return {"units": {"USD": [{"val": val, "filed": "2024-01-30"}]}}
+
+        xbrl_data = {
+            "facts": {
+                "us-gaap": {
+                    "RevenueFromContractWithCustomerExcludingAssessedTax": facts(
+                        383285000000
+                    ),
+                    "OperatingIncomeLoss": facts(114301000000),
+                    "AssetsCurrent": facts(143566000000),
+                    "LiabilitiesCurrent": facts(145308000000),
+                    "NetCashProvidedByUsedInOperatingActivities": facts(110543000000),
+                }
+            }
+        }
+
+        result = parse_xbrl_fundamentals(xbrl_data, "AAPL")
+
+        assert result["revenue"] == 383285000000
+        assert result["operating_income"] == 114301000000
+        assert result["operating_cash_flow"] == 110543000000
+        assert result["current_ratio"] == pytest.approx(143566 / 145308, rel=1e-5)
+
     def test_parse_xbrl_missing_data(self):
         """Test parsing XBRL with missing fields."""
         xbrl_data = {
@@ -262,6 +478,133 @@ class TestXBRLParsing:
 # Test Parquet Storage
 # ============================================================================
 
+class TestFetchXBRLFrames:
+    """Test assembling fundamentals from SEC frames."""
+
+    def test_missing_frame_not_retried(self):
+        """Test a 404 frame is treated as empty after a single request."""
+        import requests
+        from src.xbrl import _fetch_frame_values
+
+        response = Mock(status_code=404)
+        response.raise_for_status.side_effect = requests.HTTPError("404 Not Found")
+        session = Mock()
+        session.get.return_value = response
+
+        with patch("src.utils._get_session", return_value=session), \
+                patch("src.utils.time.sleep") as mock_sleep, \
+                patch("src.xbrl.ResponseCache.get", return_value=None):
+            values = _fetch_frame_values("AssetsCurrent", "CY2023Q4I")
+
+        assert values == {}
+        assert session.get.call_count == 1
+        # Only the fixed rate-limit pause, no backoff
+        assert all(call.args[0] < 1 for call in mock_sleep.call_args_list)
+
+    def test_frames_with_companyfacts_fallback(self):
+        """Test frame values per CIK, with unframed filers from companyfacts."""
+        ciks = {"AAPL": "0000320193", "MSFT": "0000789019", "SAP": "0001000184"}
+        frames = {
+            ("Revenues", "CY2023"): {"0000320193": 383285e6, "0000789019": 211915e6},
+            ("NetIncomeLoss", "CY2023"): {"0000320193": 96995e6},
+            ("NetCashProvidedByUsedInOperatingActivities", "CY2023"): {
+                "0000320193": 110543e6,
+            },
+            ("Assets", "CY2023Q4I"): {"0000320193": 400e9, "0000789019": 300e9},
+            ("Liabilities", "CY2023Q4I"): {"0000320193": 300e9, "0000789019": 200e9},
+            ("AssetsCurrent", "CY2023Q4I"): {"0000320193": 150e9, "0000789019": 90e9},
+            ("LiabilitiesCurrent", "CY2023Q4I"): {
+                "0000320193": 100e9,
+                "0000789019": 60e9,
+            },
+            ("StockholdersEquity", "CY2023Q4I"): {
+                "0000320193": 100e9,
+                "0000789019": 100e9,
+            },
+        }
+        # IFRS filer reporting in EUR, so absent from every us-gaap USD frame
+        sap_facts = {
+            "facts": {
+                "ifrs-full": {
+                    "Revenue": {
+                        "units": {
+                            "EUR": [
+                                {"val": 30871e6, "filed": "2024-02-22", "frame": "CY2023"},
+                                {"val": 34176e6, "filed": "2025-02-20", "frame": "CY2024"},
+                            ]
+                        }
+                    },
+                    # Only reported for another year, so it must not be used
+                    "ProfitLoss": {
+                        "units": {
+                            "EUR": [
+                                {"val": 3150e6, "filed": "2025-02-20", "frame": "CY2024"}
+                            ]
+                        }
+                    },
+                    "Assets": {
+                        "units": {
+                            "EUR": [
+                                {"val": 68e9, "filed": "2024-02-22", "frame": "CY2023Q4I"}
+                            ]
+                        }
+                    },
+                }
+            }
+        }
+        saved = {}
+
+        def save(xbrl_list):
+            saved["records"] = xbrl_list
+            return "xbrl.parquet"
+
+        with patch("src.xbrl.fetch_company_cik", side_effect=ciks.get), \
+                patch(
+                    "src.xbrl._fetch_frame_values",
+                    side_effect=lambda tag, period: frames.get((tag, period), {}),
+                ), \
+                patch(
+                    "src.xbrl._prefetch_facts", return_value=[("SAP", sap_facts)]
+                ) as mock_prefetch, \
+                patch("src.xbrl.save_xbrl_data_to_parquet", side_effect=save):
+            result = fetch_xbrl_frames(["AAPL", "MSFT", "SAP"], 2023)
+
+        assert result == "xbrl.parquet"
+        # Filers in any frame are not downloaded, even with fields missing
+        assert mock_prefetch.call_args.args[0] == ["SAP"]
+        aapl, msft, sap = saved["records"]
+        assert aapl["revenue"] == 383285e6
+        assert aapl["net_income"] == 96995e6
+        assert aapl["operating_income"] is None
+        assert aapl["debt_to_equity"] == pytest.approx(3.0)
+        assert aapl["current_ratio"] == pytest.approx(1.5)
+        assert msft["net_income"] is None
+        assert msft["shareholders_equity"] == 100e9
+        assert sap["revenue"] == 30871e6
+        assert sap["total_assets"] == 68e9
+        assert sap["net_income"] is None
+
+
+class TestFundamentalsFrame:
+    """Test columnar DataFrame construction for fundamentals."""
+
+    def test_metric_columns_are_float(self):
+        """Test metrics are float64 even when every value is missing."""
+        records = [
+            {"ticker": "AAPL", "revenue": 394328000000, "net_income": None},
+            {"ticker": "MSFT", "revenue": None, "net_income": None},
+        ]
+
+        df = _fundamentals_frame(records)
+
+        assert list(df.columns) == ["ticker", "revenue", "net_income"]
+        assert list(df["ticker"]) == ["AAPL", "MSFT"]
+        assert df["revenue"].dtype == "float64"
+        assert df["net_income"].dtype == "float64"
+        assert df["revenue"].iloc[0] == 394328000000
+        assert df["net_income"].isna().all()
+
+
 class TestParquetStorage:
     """Test saving XBRL data to Parquet format."""
     